@@ -13,3 +13,32 @@ class Paths:
 
     # Subscribers
     CREDENTIALS_SUFFIX = "/credentials"
+
+
+class Defaults:
+    """Default configuration values used by the Novu client."""
+
+    # Connection pool
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 30.0
+    TIMEOUT = 10.0
+
+    # Bulk operations
+    BULK_TRIGGER_LIMIT = 100
+    BULK_SUBSCRIBER_LIMIT = 500
+    BULK_CONCURRENCY = 10
+
+    # Trigger batching
+    BATCH_WINDOW = 0.005
+
+    # Background triggers
+    TASK_POOL_SIZE = 1000
+
+
+class Endpoints:
+    """Classes of Novu API endpoints sharing a rate limit budget."""
+
+    TRIGGER = "trigger"
+    BULK = "bulk"
+    SUBSCRIBERS = "subscribers"
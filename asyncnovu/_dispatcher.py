@@ -0,0 +1,104 @@
+import asyncio
+
+from asyncnovu.api._events import _bulk_results
+from asyncnovu.models import Trigger
+from asyncnovu.response import NovuResponse
+from asyncnovu.scheduler import Priority, current_priority, priority
+
+
+# Dispatcher coalescing individual trigger requests into bulk requests.
+class TriggerDispatcher:
+    """
+    A class to buffer individual trigger requests for a short window and send them together as a bulk request.
+
+    Each caller awaits its own slice of the bulk response, as a NovuResponse with the bulk response's status code and
+    headers, the same way as a single trigger_event response.
+    A buffer is flushed when the batching window elapses or when it reaches the maximum batch size, whichever comes
+    first.
+
+    Parameters:
+
+    client (NovuClient): Client used to send the bulk requests.
+    window (float): Seconds to wait for more triggers after the first one is buffered.
+    max_size (int): Maximum number of triggers per bulk request.
+
+    """
+
+    def __init__(self, client, window: float, max_size: int):
+        self.client = client
+        self.window = window
+        self.max_size = max_size
+        self._buffer = []
+        self._level = None
+        self._timer = None
+        self._tasks = set()
+
+    async def submit(self, trigger: Trigger, read_body: bool = True) -> NovuResponse:
+        """
+        Buffer a trigger and wait for its result from the next bulk request. With read_body set to False, the detail
+        of a successful result is left empty.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._buffer.append((trigger, future, read_body))
+
+        # Send the batch with the most urgent priority of its triggers.
+        level = current_priority(Priority.NORMAL)
+        self._level = level if self._level is None else min(self._level, level)
+
+        # Flush right away once the batch is full, otherwise make sure a flush is scheduled.
+        if len(self._buffer) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    async def flush(self):
+        """Send any buffered triggers now and wait for every in-flight bulk request to complete."""
+
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        level, self._level = self._level, None
+        with priority(level):
+            task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list):
+        # Only read the bulk response if a caller wants the detail of its result.
+        wanted = any(read_body for _, _, read_body in batch)
+        try:
+            response = await self.client.bulk_trigger([trigger for trigger, _, _ in batch], read_body=wanted)
+        except asyncio.CancelledError:
+            for _, future, _ in batch:
+                future.cancel()
+            raise
+        except Exception as error:
+            # Surface errors to every caller, as an unbatched trigger_event would.
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        if response.ok and not wanted:
+            results = [{"status_code": response.status_code, "detail": {}}] * len(batch)
+        else:
+            results = _bulk_results(response, len(batch))
+
+        for (_, future, read_body), result in zip(batch, results):
+            code, detail = result["status_code"], result["detail"]
+            if not read_body and code < 300:
+                detail = {}
+            if not future.done():
+                future.set_result(NovuResponse.from_detail(code, detail, response.headers))
@@ -1,3 +1,6 @@
+import asyncio
+
+
 # Function to format Novu server responses.
 def format(code, r) -> dict[str, str]:
     """
@@ -19,3 +22,133 @@ def format(code, r) -> dict[str, str]:
         r.pop("statusCode", None)
         response["detail"] = r
     return response
+
+
+# Function to format a request which could not be sent at all.
+def format_error(error: Exception) -> dict:
+    """
+    Function to format a request which failed without a response, eg on a transport error or an open circuit, the
+    same way as a server response.
+
+            Parameters:
+                    error (Exception): Error raised while sending the request.
+
+            Returns:
+                dict: Formatted dictionary with a None 'status_code' and the error message as 'detail'.
+
+    """
+
+    return {"status_code": None, "detail": str(error) or type(error).__name__}
+
+
+# Function to split a sequence into consecutive chunks.
+def chunks(items, size: int):
+    """
+    Function to split a sequence into consecutive chunks of at most 'size' items.
+
+            Parameters:
+                    items (Sequence): Sequence to split.
+                    size (int): Maximum number of items per chunk.
+
+            Returns:
+                Generator: Yields (offset, chunk) tuples where offset is the index of the chunk's first item.
+
+    """
+
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    for offset in range(0, len(items), size):
+        yield offset, items[offset:offset + size]
+
+
+# Function to iterate over a sync or async iterable asynchronously.
+async def aiterate(items):
+    """
+    Function to iterate asynchronously over either a sync or an async iterable.
+
+            Parameters:
+                    items (Iterable | AsyncIterable): Source of items.
+
+            Returns:
+                AsyncGenerator: Yields the items of the source in order.
+
+    """
+
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+# Function to group a sync or async iterable into batches on the fly.
+async def abatched(items, size: int):
+    """
+    Function to group a sync or async iterable into lists of at most 'size' items, without materialising the source.
+
+            Parameters:
+                    items (Iterable | AsyncIterable): Source of items.
+                    size (int): Maximum number of items per batch.
+
+            Returns:
+                AsyncGenerator: Yields (offset, batch) tuples where offset is the index of the batch's first item.
+
+    """
+
+    if size < 1:
+        raise ValueError("Batch size must be at least 1.")
+    offset, batch = 0, []
+    async for item in aiterate(items):
+        batch.append(item)
+        if len(batch) == size:
+            yield offset, batch
+            offset, batch = offset + size, []
+    if batch:
+        yield offset, batch
+
+
+# Function to run a coroutine function over a stream of items with bounded concurrency.
+async def bounded_map(func, items, limit: int):
+    """
+    Function to run a coroutine function over a sync or async iterable with at most 'limit' calls in flight.
+
+    The next item is only pulled from the source when a slot frees up, so slow consumers apply backpressure to the
+    source. Calls still in flight are cancelled if the generator is closed early.
+
+            Parameters:
+                    func (Callable): Coroutine function called with each item.
+                    items (Iterable | AsyncIterable): Source of items.
+                    limit (int): Maximum number of calls in flight at once.
+
+            Returns:
+                AsyncGenerator: Yields the result of each call in order of completion.
+
+    """
+
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1.")
+    source = aiterate(items).__aiter__()
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            # Top up the in-flight calls from the source.
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(func(item)))
+            if not pending:
+                return
+
+            # Hand back results as soon as any call completes.
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await source.aclose()
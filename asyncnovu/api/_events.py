@@ -1,53 +1,165 @@
+import asyncio
+import functools
+import time
+import uuid
+
 import httpx
-from asyncnovu._constants import Paths
-from asyncnovu._utils import format
-from asyncnovu.models import Trigger
+from asyncnovu._constants import Defaults, Endpoints, Paths
+from asyncnovu._utils import abatched, aiterate, bounded_map, chunks, format_error
+from asyncnovu.exceptions import CircuitOpenError, ResponseError
+from asyncnovu.fanout import FanoutProgress
+from asyncnovu.models import Trigger, TriggerTemplate
+from asyncnovu.scheduler import Priority, default_priority
+
+
+# Build the JSON representation of a trigger for the events endpoints.
+def _event(self, trigger: Trigger) -> dict:
+    event = trigger.to_wire()
+
+    # Give the trigger a transaction ID when retrying, so Novu can deduplicate repeated attempts.
+    if trigger.transaction_id is None and self.retry_policy is not None:
+        event = {**event, "transactionId": uuid.uuid4().hex}
+    return event
 
 
 # Trigger a notification workflow.
 # [INFO] https://docs.novu.co/api/trigger-event/
 
-async def trigger_event(self, trigger: Trigger):
+async def trigger_event(self, trigger: Trigger, read_body: bool = True):
     """
     Trigger a notification workflow.
 
             Parameters:
                 trigger (Trigger): Trigger request details to identify and configure the required Novu workflow.
+                read_body (bool): Set to False for fire-and-forget triggers, to discard the body of a successful
+                                  response without decoding it. Error details are always kept.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not. When trigger batching is enabled on the client, this holds the
+                               trigger's slice of the bulk response, with the bulk response's headers.
 
             API Reference: https://docs.novu.co/api/trigger-event/
 
     """
 
+    # Hand the trigger over to the batching dispatcher if enabled.
+    if self._dispatcher is not None:
+        return await self._dispatcher.submit(trigger, read_body)
+
     # Configuring request URL and payload data.
     url = self.api_url + Paths.TRIGGER_ENDPOINT
-    json = {
-        "name": trigger.id,
-        "to": trigger.subscribers,
-        "payload": trigger.payload,
-        "overrides": trigger.overrides,
-    }
+    json = _event(self, trigger)
+
+    # Send the request to Novu server over the pooled connection.
+    return await self._request("post", url, json=json, endpoint=Endpoints.TRIGGER, read_body=read_body)
+
+
+# Trigger a notification workflow from a pre-encoded template.
+# [INFO] https://docs.novu.co/api/trigger-event/
+
+async def trigger_template(
+    self,
+    template: TriggerTemplate,
+    subscribers: list[str],
+    payload: dict = None,
+    transaction_id: str = None,
+    read_body: bool = True,
+):
+    """
+    Trigger a notification workflow from a template, only encoding the fields which change between calls.
+
+            Parameters:
+                template (TriggerTemplate): Template with the workflow ID, overrides and constant payload.
+                subscribers (list[str]): List of subscriber IDs for users requiring notifications.
+                payload (dict): Optional payload attributes for this call, merged over the template's payload.
+                transaction_id (str): Optional unique ID of the trigger, used by Novu to deduplicate and cancel it.
+                read_body (bool): Set to False to discard the body of a successful response without decoding it.
+
+            Returns:
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not. When trigger batching is enabled on the client, this holds the
+                               trigger's slice of the bulk response, with the bulk response's headers.
+
+            API Reference: https://docs.novu.co/api/trigger-event/
+
+    """
+
+    # Hand the trigger over to the batching dispatcher if enabled.
+    if self._dispatcher is not None:
+        return await self._dispatcher.submit(template.to_trigger(subscribers, payload, transaction_id), read_body)
+
+    # Configuring request URL and payload data, with a transaction ID if retries have to be deduplicated.
+    url = self.api_url + Paths.TRIGGER_ENDPOINT
+    if transaction_id is None and self.retry_policy is not None:
+        transaction_id = uuid.uuid4().hex
+    content = template.encode(self.codec, subscribers, payload, transaction_id)
+
+    # Send the request to Novu server over the pooled connection.
+    return await self._request("post", url, endpoint=Endpoints.TRIGGER, read_body=read_body, content=content)
+
+
+# Trigger a notification workflow in the background.
+# [INFO] https://docs.novu.co/api/trigger-event/
+
+async def trigger_nowait(self, trigger: Trigger) -> bool:
+    """
+    Trigger a notification workflow in the background, returning as soon as the client's task pool accepted it.
+
+    The trigger is sent with trigger_event, discarding the body of successful responses. Failures, including error
+    responses as ResponseError, are reported to the task pool's error callback. Pending triggers are awaited by
+    drain_triggers() and aclose(), but are lost if the process exits first: use enqueue_trigger for durability.
+
+            Parameters:
+                trigger (Trigger): Trigger request details to identify and configure the required Novu workflow.
+
+            Returns:
+                bool : True if the trigger was accepted, False if it was dropped because the task pool is full and
+                       its overflow policy is 'drop'. With the 'block' policy, this waits for a free slot, and with
+                       the 'raise' policy, PoolFullError is raised.
+
+            API Reference: https://docs.novu.co/api/trigger-event/
+
+    """
+
+    return await self.task_pool.submit(functools.partial(_trigger_in_background, self), trigger)
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=json, headers=self.headers)
-        return format(response.status_code, response.json())
+
+# Send a trigger submitted with trigger_nowait, raising on error responses for the task pool to report.
+async def _trigger_in_background(self, trigger: Trigger):
+    response = await self.trigger_event(trigger, read_body=False)
+    if response["status_code"] is None or response["status_code"] >= 300:
+        raise ResponseError(response)
+
+
+# Wait until every trigger sent with trigger_nowait completed.
+
+async def drain_triggers(self, timeout: float = None):
+    """
+    Wait until every trigger sent in the background with trigger_nowait completed, eg before shutting down.
+
+            Parameters:
+                timeout (float): Optional maximum number of seconds to wait, raising asyncio.TimeoutError when exceeded.
+
+    """
+
+    await self.task_pool.drain(timeout)
 
 
 # Trigger multiple notification workflows in bulk.
 # [INFO] https://docs.novu.co/api/bulk-trigger-event/
 
-async def bulk_trigger(self, triggers: list[Trigger]):
+async def bulk_trigger(self, triggers: list[Trigger], read_body: bool = True):
     """
     Trigger multiple notification workflows in bulk.
 
             Parameters:
                 triggers (list[Trigger]): List of Trigger requests to execute.
+                read_body (bool): Set to False to discard the body of a successful response without decoding it.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not.
 
             API Reference: https://docs.novu.co/api/trigger-event/
 
@@ -55,38 +167,168 @@ async def bulk_trigger(self, triggers: list[Trigger]):
 
     # Configuring request URL and payload data.
     url = self.api_url + Paths.TRIGGER_ENDPOINT + Paths.BULK_SUFFIX
-    json = {
-        "events": [
-            {
-                "name": trigger.id,
-                "to": trigger.subscribers,
-                "payload": trigger.payload,
-                "overrides": trigger.overrides,
-            }
-            for trigger in triggers
-        ],
-    }
-
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=json, headers=self.headers)
-        return format(response.status_code, response.json())
+    json = {"events": [_event(self, trigger) for trigger in triggers]}
+
+    # Send the request to Novu server over the pooled connection.
+    return await self._request("post", url, json=json, endpoint=Endpoints.BULK, read_body=read_body)
+
+
+# Split a bulk trigger response into one result per trigger in the request.
+def _bulk_results(response: dict, count: int) -> list[dict]:
+    code, detail = response["status_code"], response["detail"]
+    if code is not None and code < 300 and isinstance(detail, list) and len(detail) == count:
+        return [{"status_code": code, "detail": item} for item in detail]
+
+    # The whole request failed, so every trigger in it shares the same error.
+    return [dict(response) for _ in range(count)]
+
+
+# Send one bulk trigger request and split the response into one result per trigger.
+async def _send_bulk(self, triggers: list[Trigger]) -> list[dict]:
+    try:
+        response = await self.bulk_trigger(triggers)
+    except (httpx.HTTPError, CircuitOpenError) as error:
+        response = format_error(error)
+    return _bulk_results(response, len(triggers))
+
+
+# Trigger any number of notification workflows, split into concurrent bulk requests.
+# [INFO] https://docs.novu.co/api/bulk-trigger-event/
+
+async def bulk_trigger_many(
+    self,
+    triggers: list[Trigger],
+    chunk_size: int = Defaults.BULK_TRIGGER_LIMIT,
+    concurrency: int = Defaults.BULK_CONCURRENCY,
+):
+    """
+    Trigger any number of notification workflows, split into bulk requests sent concurrently.
+
+            Parameters:
+                triggers (list[Trigger]): List of Trigger requests to execute, of any length.
+                chunk_size (int): Maximum number of triggers per bulk request, capped by Novu at 100.
+                concurrency (int): Maximum number of bulk requests in flight at once.
+
+            Returns:
+                list[dict] : One formatted result per trigger, in the same order as the input. Triggers in a chunk
+                             that failed as a whole share that chunk's error details. If the request could not be
+                             sent at all, 'status_code' is None and 'detail' holds the transport or open circuit error.
+
+            API Reference: https://docs.novu.co/api/bulk-trigger-event/
+
+    """
+
+    results = [None] * len(triggers)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(offset, chunk):
+        async with semaphore:
+            results[offset:offset + len(chunk)] = await _send_bulk(self, chunk)
+
+    # Send every chunk, mapping the results back onto the input indices.
+    await asyncio.gather(*(send(offset, chunk) for offset, chunk in chunks(triggers, chunk_size)))
+    return results
+
+
+# Trigger notification workflows streamed from a sync or async iterable.
+# [INFO] https://docs.novu.co/api/bulk-trigger-event/
+
+async def stream_bulk_trigger(
+    self,
+    triggers,
+    batch_size: int = Defaults.BULK_TRIGGER_LIMIT,
+    max_in_flight: int = Defaults.BULK_CONCURRENCY,
+):
+    """
+    Trigger notification workflows streamed from a sync or async iterable, batching them into bulk requests on the fly.
+
+    Triggers are only pulled from the source when a bulk request slot is free, so memory stays bounded by
+    batch_size * max_in_flight regardless of the total number of triggers.
+
+            Parameters:
+                triggers (Iterable[Trigger] | AsyncIterable[Trigger]): Source of Trigger requests to execute.
+                batch_size (int): Maximum number of triggers per bulk request, capped by Novu at 100.
+                max_in_flight (int): Maximum number of bulk requests in flight at once.
+
+            Returns:
+                AsyncGenerator[dict] : Yields one dict per batch as it completes, with the 'offset' of the batch's first
+                                       trigger in the source and the per-trigger 'results' in batch order, formatted
+                                       as in bulk_trigger_many.
+
+            API Reference: https://docs.novu.co/api/bulk-trigger-event/
+
+    """
+
+    async def send(batch):
+        offset, chunk = batch
+        return {"offset": offset, "results": await _send_bulk(self, chunk)}
+
+    async for result in bounded_map(send, abatched(triggers, batch_size), max_in_flight):
+        yield result
+
+
+# Durably queue a notification workflow trigger, to be sent in the background.
+
+async def enqueue_trigger(self, trigger: Trigger) -> str:
+    """
+    Durably queue a notification workflow trigger in the client's outbox, to be sent in the background.
+
+    The trigger is committed to the outbox before this returns, so it survives a crash of the process and is sent
+    once the client is started again. Triggers are sent in bulk, with batching and retries, by the outbox worker.
+
+            Parameters:
+                trigger (Trigger): Trigger request details to identify and configure the required Novu workflow.
+
+            Returns:
+                str : Transaction ID of the trigger, generated if the trigger has none. Use it to cancel the trigger.
+
+    """
+
+    if self._outbox_worker is None:
+        raise RuntimeError("enqueue_trigger requires the client to be created with an outbox.")
+
+    # Give the trigger a stable transaction ID, reused if the trigger has to be replayed.
+    transaction_id = trigger.transaction_id or uuid.uuid4().hex
+    event = {**trigger.to_wire(), "transactionId": transaction_id}
+
+    await self._outbox_worker.outbox.append(transaction_id, self.codec.encode(event))
+    self._outbox_worker.notify()
+    return transaction_id
+
+
+# Wait until every trigger queued in the client's outbox was sent.
+
+async def drain_outbox(self, timeout: float = None):
+    """
+    Wait until every pending trigger queued in the client's outbox was sent. Triggers which failed permanently are
+    kept in the outbox and not waited for, see SQLiteOutbox.failures().
+
+            Parameters:
+                timeout (float): Optional maximum number of seconds to wait, raising asyncio.TimeoutError when exceeded.
+
+    """
+
+    if self._outbox_worker is None:
+        raise RuntimeError("drain_outbox requires the client to be created with an outbox.")
+    await self._outbox_worker.drain(timeout)
 
 
 # Broadcast a notification to all existing subscribers.
 # [INFO] https://docs.novu.co/api/broadcast-event-to-all/
 
-async def broadcast_event(self, trigger: Trigger):
+async def broadcast_event(self, trigger: Trigger, read_body: bool = True):
     """
     Broadcast a notification to all existing subscribers.
 
             Parameters:
                 trigger (Trigger): Trigger request details to identify and configure the required Novu workflow.
+                read_body (bool): Set to False to discard the body of a successful response without decoding it.
 
                 NOTE: Omit the 'subscribers' field from the Trigger object as it will not be used.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not.
 
             API Reference: https://docs.novu.co/api/broadcast-event-to-all/
 
@@ -94,16 +336,87 @@ async def broadcast_event(self, trigger: Trigger):
 
     # Configuring request URL and payload data.
     url = self.api_url + Paths.TRIGGER_ENDPOINT + Paths.BROADCAST_SUFFIX
-    json = {
-        "name": trigger.id,
-        "payload": trigger.payload,
-        "overrides": trigger.overrides,
-    }
+    json = {key: value for key, value in _event(self, trigger).items() if key != "to"}
+
+    # Send the request to Novu server over the pooled connection.
+    return await self._request("post", url, json=json, endpoint=Endpoints.TRIGGER, read_body=read_body)
+
+
+# Trigger a notification workflow for a stream of subscribers, paced and tracked on the client side.
+# [INFO] https://docs.novu.co/api/bulk-trigger-event/
+
+async def fanout_event(
+    self,
+    trigger: Trigger,
+    subscribers,
+    batch_size: int = Defaults.BULK_TRIGGER_LIMIT,
+    concurrency: int = Defaults.BULK_CONCURRENCY,
+    rate: float = None,
+    checkpoint: int = 0,
+):
+    """
+    Trigger a notification workflow for every subscriber of a sync or async iterable, as an alternative to
+    broadcast_event which gives control over the pace of the delivery and reports its progress.
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=json, headers=self.headers)
-        return format(response.status_code, response.json())
+    Subscribers are sent one trigger each, grouped into bulk requests. If the trigger has a transaction ID, every
+    subscriber's trigger gets '<transaction_id>-<index>' so that a resumed fan-out is deduplicated by Novu and each
+    trigger can be cancelled.
+
+            Parameters:
+                trigger (Trigger): Trigger request details. Its 'subscribers' field is ignored.
+                subscribers (Iterable[str] | AsyncIterable[str]): Source of subscriber IDs.
+                batch_size (int): Maximum number of subscribers per bulk request, capped by Novu at 100.
+                concurrency (int): Maximum number of bulk requests in flight at once.
+                rate (float): Optional maximum number of subscribers triggered per second.
+                checkpoint (int): Number of subscribers to skip from the start of the source, eg the checkpoint of an
+                                  interrupted fan-out's last progress.
+
+            Returns:
+                AsyncGenerator[FanoutProgress] : Yields the same progress object each time a batch completes.
+
+            API Reference: https://docs.novu.co/api/bulk-trigger-event/
+
+    """
+
+    progress = FanoutProgress(checkpoint)
+
+    async def source():
+        index, next_at = 0, time.monotonic()
+        async for offset, batch in abatched(_skip(subscribers, checkpoint), batch_size):
+            # Pace the batches to the requested rate.
+            if rate is not None:
+                now = time.monotonic()
+                if next_at > now:
+                    await asyncio.sleep(next_at - now)
+                next_at = max(next_at, now) + len(batch) / rate
+            yield checkpoint + offset, batch
+
+    async def send(item):
+        offset, batch = item
+        triggers = [
+            Trigger(
+                trigger.id,
+                [subscriber],
+                trigger.payload,
+                trigger.overrides,
+                f"{trigger.transaction_id}-{offset + index}" if trigger.transaction_id else None,
+            )
+            for index, subscriber in enumerate(batch)
+        ]
+        return offset, batch, await _send_bulk(self, triggers)
+
+    async for offset, batch, results in bounded_map(send, source(), concurrency):
+        progress.record(offset, batch, results)
+        yield progress
+
+
+# Skip the first items of a sync or async iterable.
+async def _skip(items, count: int):
+    async for item in aiterate(items):
+        if count:
+            count -= 1
+            continue
+        yield item
 
 
 # Cancel any active or pending notification workflow using a previously generated transaction ID.
@@ -117,7 +430,8 @@ async def cancel_event(self, transaction_id):
                 transaction_id (str): Unique trnasaction ID of the workflow to be cancelled.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not.
 
             API Reference: https://docs.novu.co/api/cancel-triggered-event/
 
@@ -126,7 +440,71 @@ async def cancel_event(self, transaction_id):
     # Configuring request URL and payload data.
     url = self.api_url + Paths.TRIGGER_ENDPOINT + f"/{transaction_id}"
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=self.headers)
-        return format(response.status_code, response.json())
+    # Send the request to Novu server over the pooled connection.
+    return await self._request("delete", url, endpoint=Endpoints.TRIGGER)
+
+
+# Cancel many notification workflows by transaction ID, streaming the outcomes as they complete.
+# [INFO] https://docs.novu.co/api/cancel-triggered-event/
+
+async def stream_cancel_events(self, transaction_ids, concurrency: int = Defaults.BULK_CONCURRENCY):
+    """
+    Cancel the workflows of many transaction IDs streamed from a sync or async iterable, with bounded concurrency.
+
+    Transaction IDs are only pulled from the source when a request slot is free, so memory stays bounded regardless
+    of the number of cancellations. Every request goes through the client's rate limiter and retry policy, if any.
+
+            Parameters:
+                transaction_ids (Iterable[str] | AsyncIterable[str]): Source of transaction IDs to cancel.
+                concurrency (int): Maximum number of cancellations in flight at once.
+
+            Returns:
+                AsyncGenerator[dict] : Yields one formatted result per transaction ID as it completes, with the
+                                       'transaction_id' it is for. If the request could not be sent at all,
+                                       'status_code' is None and 'detail' holds the transport or open circuit error.
+
+            API Reference: https://docs.novu.co/api/cancel-triggered-event/
+
+    """
+
+    async def cancel(transaction_id):
+        try:
+            with default_priority(Priority.LOW):
+                response = await self.cancel_event(transaction_id)
+        except (httpx.HTTPError, CircuitOpenError) as error:
+            response = format_error(error)
+        return {"transaction_id": transaction_id, **response}
+
+    async for result in bounded_map(cancel, transaction_ids, concurrency):
+        yield result
+
+
+# Cancel many notification workflows by transaction ID.
+# [INFO] https://docs.novu.co/api/cancel-triggered-event/
+
+async def cancel_events(self, transaction_ids, concurrency: int = Defaults.BULK_CONCURRENCY):
+    """
+    Cancel the workflows of many transaction IDs, eg every trigger of an aborted campaign. See stream_cancel_events.
+
+            Parameters:
+                transaction_ids (Iterable[str] | AsyncIterable[str]): Source of transaction IDs to cancel.
+                concurrency (int): Maximum number of cancellations in flight at once.
+
+            Returns:
+                dict : Report with the 'cancelled' transaction IDs, the 'not_found' ones which had no active or pending
+                       workflow left to cancel, and the 'failed' ones mapped to their error details.
+
+            API Reference: https://docs.novu.co/api/cancel-triggered-event/
+
+    """
+
+    report = {"cancelled": [], "not_found": [], "failed": {}}
+    async for result in stream_cancel_events(self, transaction_ids, concurrency):
+        status, transaction_id = result["status_code"], result["transaction_id"]
+        if status is None or status >= 300:
+            report["failed"][transaction_id] = result["detail"]
+        elif result["detail"] is False:
+            report["not_found"].append(transaction_id)
+        else:
+            report["cancelled"].append(transaction_id)
+    return report
@@ -1,8 +1,32 @@
+import asyncio
+
 import httpx
-from asyncnovu._constants import Paths
-from asyncnovu._utils import format
+from asyncnovu._constants import Defaults, Endpoints, Paths
+from asyncnovu._utils import abatched, bounded_map, format_error
 from asyncnovu.enums.provider import ProviderIdEnum
+from asyncnovu.exceptions import CircuitOpenError
+from asyncnovu.fingerprint import fingerprint
 from asyncnovu.models import Subscriber
+from asyncnovu.response import NovuResponse
+from asyncnovu.scheduler import Priority, default_priority
+
+
+# Drop a subscriber from the client's cache after it was modified, and keep later reads from joining a read of the
+# previous profile still in flight.
+def _invalidate(self, subscriber_id: str):
+    if self.subscriber_cache is not None:
+        self.subscriber_cache.invalidate(subscriber_id)
+    self._inflight.pop(self.api_url + Paths.SUBSCRIBERS_ENDPOINT + f"/{subscriber_id}", None)
+
+
+# Key of a subscriber profile's fingerprint in the client's fingerprint store.
+def _profile_key(self, subscriber_id: str) -> str:
+    return f"{self.namespace}subscriber:{subscriber_id}"
+
+
+# Key of a subscriber's credentials fingerprint in the client's fingerprint store, for one provider or all of them.
+def _credentials_key(self, subscriber_id: str, provider_id: ProviderIdEnum = None) -> str:
+    return f"{self.namespace}credentials:{subscriber_id}:{provider_id.value if provider_id is not None else ''}"
 
 
 # Get an existing subscriber profile.
@@ -16,20 +40,32 @@ async def get_subscriber(self, subscriber_id: str):
                 subscriber_id (str): Unique ID of the subscriber.
 
             Returns:
-                dict : The response from the server with subscriber information, error details if not.
+                NovuResponse : The response from the server with subscriber information, error details if not.
+                       Served from the client's subscriber cache when enabled and fresh.
 
             API Reference:
                 https://docs.novu.co/api/delete-subscriber/
 
     """
 
+    # Answer from the subscriber cache if possible.
+    cache = self.subscriber_cache
+    if cache is not None:
+        cached = cache.get(subscriber_id)
+        if cached is not None:
+            return cached
+        generation = cache.generation
+
     # Configuring request URL and payload data.
     url = self.api_url + Paths.SUBSCRIBERS_ENDPOINT + f"/{subscriber_id}"
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=self.headers)
-        return format(response.status_code, response.json())
+    # Send the request to Novu server over the pooled connection.
+    response = await self._request("get", url, endpoint=Endpoints.SUBSCRIBERS)
+
+    # Cache successful lookups, unless the subscriber was modified meanwhile.
+    if cache is not None and response["status_code"] == 200:
+        cache.set(subscriber_id, response, generation)
+    return response
 
 
 # Update an existing subscriber profile. If the subscriber foes not exist, a new one will be created.
@@ -39,11 +75,16 @@ async def upsert_subscriber(self, subscriber: Subscriber):
     """
     Update an existing subscriber profile. If the subscriber does not exist, a new one will be created.
 
+    When the client skips unchanged upserts, a subscriber identical to the last one successfully saved through the
+    client's fingerprint store is not sent. A successful response is returned instead, with a 200 status code, the
+    detail {"skipped": True} and its 'skipped' attribute set, so callers checking 'ok' treat it like a saved profile.
+
             Parameters:
                 subscriber (Subscriber): Object containing subscriber details to save in Novu.
 
             Returns:
-                dict : The response from the server with the full profile dataset if the request succeeded, error details if not.
+                NovuResponse : The response from the server with the full profile dataset if the request succeeded,
+                               error details if not.
 
             API Reference:
                 https://docs.novu.co/api/update-subscriber/
@@ -52,19 +93,144 @@ async def upsert_subscriber(self, subscriber: Subscriber):
 
     # Configuring request URL and payload data.
     url = self.api_url + Paths.SUBSCRIBERS_ENDPOINT
-    json = {
-        "subscriberId": subscriber.id,
-        "email": subscriber.email,
-        "firstName": subscriber.first_name,
-        "lastName": subscriber.last_name,
-        "phone": subscriber.phone,
-        "avatar": subscriber.avatar,
-    }
+    json = subscriber.to_wire()
+
+    # Skip the request if the profile did not change since it was last saved.
+    if self.skip_unchanged_upserts:
+        key, digest = _profile_key(self, subscriber.id), fingerprint(json)
+        if (await self.fingerprint_store.get_many([key])).get(key) == digest:
+            self.upsert_stats["skipped"] += 1
+            return NovuResponse.from_detail(200, {"skipped": True}, skipped=True)
+
+    # Send the request to Novu server over the pooled connection.
+    try:
+        response = await self._request("post", url, json=json, endpoint=Endpoints.SUBSCRIBERS)
+    finally:
+        _invalidate(self, subscriber.id)
+    self.upsert_stats["sent"] += 1
+
+    if self.skip_unchanged_upserts and response.ok:
+        await self.fingerprint_store.set_many({key: digest})
+    return response
+
+
+# Create or update many subscriber profiles, using the bulk endpoint where available.
+# [INFO] https://docs.novu.co/api-reference/subscribers/bulk-create-subscribers
+
+async def bulk_upsert_subscribers(
+    self,
+    subscribers,
+    batch_size: int = Defaults.BULK_SUBSCRIBER_LIMIT,
+    concurrency: int = Defaults.BULK_CONCURRENCY,
+    use_bulk_endpoint: bool = True,
+):
+    """
+    Create or update many subscriber profiles streamed from a sync or async iterable.
+
+    Subscribers are sent in batches through Novu's bulk subscriber endpoint. If the server does not provide it, the
+    remaining subscribers are upserted one by one with bounded concurrency instead. Subscribers are only pulled from
+    the source when a request slot is free, so memory stays bounded regardless of the total number of subscribers.
+    When the client skips unchanged upserts, subscribers identical to the last ones successfully saved are not sent.
+
+            Parameters:
+                subscribers (Iterable[Subscriber] | AsyncIterable[Subscriber]): Source of subscribers to save in Novu.
+                batch_size (int): Maximum number of subscribers per bulk request, capped by Novu at 500.
+                concurrency (int): Maximum number of requests in flight at once.
+                use_bulk_endpoint (bool): Use the bulk endpoint, set to False to always upsert one by one.
+
+            Returns:
+                dict : Report with the IDs of the 'succeeded' subscribers, the 'skipped' unchanged ones, and the
+                       'failed' subscribers mapped by ID to their error details.
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=json, headers=self.headers)
-        return format(response.status_code, response.json())
+            API Reference:
+                https://docs.novu.co/api-reference/subscribers/bulk-create-subscribers
+
+    """
+
+    url = self.api_url + Paths.SUBSCRIBERS_ENDPOINT + Paths.BULK_SUFFIX
+    report = {"succeeded": [], "skipped": [], "failed": {}}
+    semaphore = asyncio.Semaphore(concurrency)
+    bulk = use_bulk_endpoint
+
+    async def upsert(subscriber):
+        async with semaphore:
+            try:
+                response = await self.upsert_subscriber(subscriber)
+            except (httpx.HTTPError, CircuitOpenError) as error:
+                report["failed"][subscriber.id] = format_error(error)["detail"]
+                return
+        if response.skipped:
+            report["skipped"].append(subscriber.id)
+        elif response["status_code"] < 300:
+            report["succeeded"].append(subscriber.id)
+        else:
+            report["failed"][subscriber.id] = response["detail"]
+
+    async def send(batch):
+        with default_priority(Priority.LOW):
+            await send_batch(batch)
+
+    async def send_batch(batch):
+        nonlocal bulk
+        _, chunk = batch
+        if bulk:
+            # Leave out the profiles which did not change since they were last saved.
+            digests = {}
+            if self.skip_unchanged_upserts:
+                digests = {subscriber.id: fingerprint(subscriber.to_wire()) for subscriber in chunk}
+                stored = await self.fingerprint_store.get_many([_profile_key(self, id) for id in digests])
+                unchanged = {id for id, digest in digests.items() if stored.get(_profile_key(self, id)) == digest}
+                if unchanged:
+                    report["skipped"].extend(unchanged)
+                    self.upsert_stats["skipped"] += len(unchanged)
+                    chunk = [subscriber for subscriber in chunk if subscriber.id not in unchanged]
+                    if not chunk:
+                        return
+
+            json = {"subscribers": [subscriber.to_wire() for subscriber in chunk]}
+            try:
+                response = await self._request("post", url, json=json, endpoint=Endpoints.SUBSCRIBERS)
+            except (httpx.HTTPError, CircuitOpenError) as error:
+                response = format_error(error)
+            finally:
+                for subscriber in chunk:
+                    _invalidate(self, subscriber.id)
+
+            # Fall back to individual upserts if the server has no bulk endpoint.
+            if response["status_code"] == 404:
+                bulk = False
+            else:
+                self.upsert_stats["sent"] += len(chunk)
+                chunk_report = {"succeeded": [], "failed": {}}
+                _merge_bulk_report(chunk_report, response, chunk)
+                report["succeeded"].extend(chunk_report["succeeded"])
+                report["failed"].update(chunk_report["failed"])
+                if digests:
+                    saved = [id for id in chunk_report["succeeded"] if id in digests]
+                    await self.fingerprint_store.set_many({_profile_key(self, id): digests[id] for id in saved})
+                return
+
+        await asyncio.gather(*(upsert(subscriber) for subscriber in chunk))
+
+    # Batch the source on the fly, keeping a bounded number of batches in flight.
+    async for _ in bounded_map(send, abatched(subscribers, batch_size), concurrency):
+        pass
+    return report
+
+
+# Record the outcome of a bulk subscriber request in a bulk upsert report.
+def _merge_bulk_report(report: dict, response: dict, subscribers: list[Subscriber]):
+    code, detail = response["status_code"], response["detail"]
+    if code is None or code >= 300 or not isinstance(detail, dict):
+        # The whole request failed, so every subscriber in it shares the same error.
+        for subscriber in subscribers:
+            report["failed"][subscriber.id] = detail
+        return
+
+    for entry in detail.get("created", []) + detail.get("updated", []):
+        report["succeeded"].append(entry["subscriberId"])
+    for entry in detail.get("failed", []):
+        report["failed"][entry["subscriberId"]] = entry.get("message")
 
 
 # Update a subscriber's credentials (eg device tokens) into Novu.
@@ -77,7 +243,8 @@ async def update_subscriber_credentials(
     credentials: dict = None,
 ):
     """
-    Update a subscriber's credentials (eg device tokens) into Novu.
+    Update a subscriber's credentials (eg device tokens) into Novu. With a fingerprint store, the credentials are
+    remembered once saved, so that sync_subscriber_credentials only sends them again if they change.
 
             Parameters:
                     subscriber_id (str): Unique ID of the subscriber.
@@ -85,12 +252,31 @@ async def update_subscriber_credentials(
                     credentials (Dict): Credentials payload for the specified provider, eg device tokens.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not.
 
             API Reference: https://docs.novu.co/api/update-subscriber-credentials/
 
     """
 
+    if self.fingerprint_store is None:
+        return await _put_credentials(self, subscriber_id, provider_id, credentials)
+
+    # Remember the saved credentials, or forget the previous ones if the outcome is unknown.
+    key, response = _credentials_key(self, subscriber_id, provider_id), None
+    try:
+        response = await _put_credentials(self, subscriber_id, provider_id, credentials)
+    finally:
+        if response is not None and response.ok:
+            await self.fingerprint_store.set_many({key: fingerprint(credentials)})
+        else:
+            await self.fingerprint_store.delete_many([key])
+    return response
+
+
+# Send a subscriber's credentials, without updating the fingerprint store.
+async def _put_credentials(self, subscriber_id: str, provider_id: ProviderIdEnum, credentials: dict):
+
     # Configuring request URL and payload data.
     url = self.api_url + Paths.SUBSCRIBERS_ENDPOINT + f"/{subscriber_id}" + Paths.CREDENTIALS_SUFFIX
     payload = {
@@ -98,10 +284,82 @@ async def update_subscriber_credentials(
         "credentials": credentials,
     }
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, json=payload, headers=self.headers)
-        return format(response.status_code, response.json())
+    # Send the request to Novu server over the pooled connection.
+    try:
+        return await self._request("put", url, json=payload, endpoint=Endpoints.SUBSCRIBERS)
+    finally:
+        _invalidate(self, subscriber_id)
+
+
+# Update the credentials of many subscribers, skipping credentials which did not change since they were last sent.
+# [INFO] https://docs.novu.co/api/update-subscriber-credentials/
+
+async def sync_subscriber_credentials(
+    self,
+    credentials,
+    batch_size: int = Defaults.BULK_SUBSCRIBER_LIMIT,
+    concurrency: int = Defaults.BULK_CONCURRENCY,
+):
+    """
+    Update the credentials (eg device tokens) of many subscribers, only sending the ones which changed since they were
+    last sent successfully, according to the client's fingerprint store.
+
+    Entries are read from the source in batches. Within a batch, the last entry of a subscriber and provider wins, and
+    changed credentials are sent with bounded concurrency. Credentials updated or subscribers deleted through this
+    client are accounted for, but credentials changed in Novu by other means are not detected, clear the store to send
+    everything again.
+
+            Parameters:
+                credentials (Iterable[tuple] | AsyncIterable[tuple]): Source of (subscriber_id, provider_id,
+                                                                      credentials) tuples, as for
+                                                                      update_subscriber_credentials.
+                batch_size (int): Number of entries looked up in the fingerprint store at once.
+                concurrency (int): Maximum number of requests in flight at once.
+
+            Returns:
+                dict : Report with the (subscriber_id, provider_id) pairs 'updated', the number of unchanged or
+                       superseded entries 'skipped', and the 'failed' pairs mapped to their error details.
+
+            API Reference: https://docs.novu.co/api/update-subscriber-credentials/
+
+    """
+
+    if self.fingerprint_store is None:
+        raise RuntimeError("sync_subscriber_credentials requires the client to be created with a fingerprint store.")
+
+    report = {"updated": [], "skipped": 0, "failed": {}}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def update(key, entry):
+        subscriber_id, provider_id, values = entry
+        async with semaphore:
+            try:
+                with default_priority(Priority.LOW):
+                    response = await _put_credentials(self, subscriber_id, provider_id, values)
+            except (httpx.HTTPError, CircuitOpenError) as error:
+                response = format_error(error)
+        if response["status_code"] is not None and response["status_code"] < 300:
+            report["updated"].append((subscriber_id, provider_id))
+            return key
+        report["failed"][(subscriber_id, provider_id)] = response["detail"]
+
+    async for _, batch in abatched(credentials, batch_size):
+        # Keep the last entry of every subscriber and provider, with its fingerprint.
+        entries, fingerprints = {}, {}
+        for entry in batch:
+            subscriber_id, provider_id, values = entry
+            key = _credentials_key(self, subscriber_id, provider_id)
+            entries[key], fingerprints[key] = entry, fingerprint(values)
+        report["skipped"] += len(batch) - len(entries)
+
+        # Send the credentials whose fingerprint changed, and remember the ones Novu accepted.
+        stored = await self.fingerprint_store.get_many(list(entries))
+        changed = [key for key in entries if stored.get(key) != fingerprints[key]]
+        report["skipped"] += len(entries) - len(changed)
+        sent = await asyncio.gather(*(update(key, entries[key]) for key in changed))
+        await self.fingerprint_store.set_many({key: fingerprints[key] for key in sent if key is not None})
+
+    return report
 
 
 # Delete an existing subscriber profile.
@@ -115,7 +373,8 @@ async def delete_subscriber(self, subscriber_id: str):
                 subscriber_id (str): Unique ID of the subscriber.
 
             Returns:
-                dict : The response from the server with acknowledgement if the request succeeded, error details if not.
+                NovuResponse : The response from the server with acknowledgement if the request succeeded, error
+                               details if not.
 
             API Reference:
                 https://docs.novu.co/api/delete-subscriber/
@@ -125,7 +384,12 @@ async def delete_subscriber(self, subscriber_id: str):
     # Configuring request URL and payload data.
     url = self.api_url + Paths.SUBSCRIBERS_ENDPOINT + f"/{subscriber_id}"
 
-    # Post the request to Novu server.
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=self.headers)
-        return format(response.status_code, response.json())
+    # Send the request to Novu server over the pooled connection.
+    try:
+        return await self._request("delete", url, endpoint=Endpoints.SUBSCRIBERS)
+    finally:
+        _invalidate(self, subscriber_id)
+        if self.skip_unchanged_upserts:
+            await self.fingerprint_store.delete_many([_profile_key(self, subscriber_id)])
+        if self.fingerprint_store is not None:
+            await self.fingerprint_store.delete_prefix(_credentials_key(self, subscriber_id))
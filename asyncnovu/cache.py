@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+
+
+# In-process cache with per-entry expiry and least recently used eviction.
+class TTLCache:
+    """
+    Class representing a bounded in-process cache whose entries expire after a fixed time to live.
+
+    When the cache is full, the least recently used entry is evicted. Cached values are shared between callers and
+    should be treated as read-only.
+
+    Attributes:
+
+    maxsize (int): Maximum number of entries kept in the cache.
+    ttl (float): Seconds an entry stays valid after being stored.
+    hits (int): Number of lookups answered from the cache.
+    misses (int): Number of lookups which found no valid entry.
+
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Counter increased by every invalidation, used to discard values fetched before an invalidation."""
+
+        return self._generation
+
+    def get(self, key):
+        """Return the cached value for a key, or None if it is missing or expired."""
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key, value, generation: int = None):
+        """
+        Store a value for a key, evicting the least recently used entry if the cache is full.
+
+                Parameters:
+                    key (Hashable): Key of the entry.
+                    value (Any): Value to cache.
+                    generation (int): Generation read before fetching the value. The value is not stored if the cache
+                                      was invalidated since then, as it may be stale.
+
+        """
+
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Remove a key from the cache."""
+
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry from the cache and reset the hit and miss counters."""
+
+        self._generation += 1
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,4 +1,20 @@
-from asyncnovu._constants import Paths
+import asyncio
+import contextlib
+import time
+
+import httpx
+from asyncnovu._constants import Defaults, Endpoints, Paths
+from asyncnovu._dispatcher import TriggerDispatcher
+from asyncnovu.cache import TTLCache
+from asyncnovu.codec import get_codec
+from asyncnovu.instrumentation import RequestInfo
+from asyncnovu.outbox import OutboxWorker, SQLiteOutbox
+from asyncnovu.ratelimit import RateLimiter
+from asyncnovu.resilience import CircuitBreaker, HedgePolicy
+from asyncnovu.response import NovuResponse
+from asyncnovu.scheduler import FairScheduler, Priority, SchedulerLane, current_priority, priority
+from asyncnovu.tasks import TaskPool
+from asyncnovu.retry import RetryPolicy
 
 
 # Python client for connecting and making requests to a Novu server.
@@ -6,32 +22,375 @@ class NovuClient:
     """
     A class to interface with Novu APIs and execute different operations.
 
+    The client owns a single pooled httpx.AsyncClient which is created on first use and shared by every API call,
+    so connections (and TLS sessions) to the Novu server are reused. Use the client as an async context manager,
+    or call aclose() when done, to release the pooled connections.
+
     Parameters:
 
     api_key (str): Unique Novu API key to authorize requests to the Novu server.
     api_url (str): Novu Server URL for sending requests. If not provided, default value would be https://api.novu.co/v1
+    max_connections (int): Maximum number of concurrent connections kept in the pool.
+    max_keepalive_connections (int): Maximum number of idle connections kept alive in the pool.
+    keepalive_expiry (float): Seconds an idle connection is kept alive before being closed.
+    http2 (bool): Enable HTTP/2 support. Requires the 'h2' package to be installed.
+    timeout (float | httpx.Timeout): Timeout configuration applied to every request.
+    transport (httpx.AsyncBaseTransport): Optional custom transport, eg for testing with httpx.MockTransport.
+    batch_triggers (bool): Coalesce concurrent trigger_event calls into bulk requests. Disabled by default.
+    batch_window (float): Seconds trigger_event calls are buffered for before being sent when batching is enabled.
+    batch_max_size (int): Maximum number of buffered triggers per bulk request when batching is enabled.
+    retry_policy (RetryPolicy): Optional policy to retry rate limited, failed and unreachable requests.
+                                Triggers are given a transaction ID, if missing, so retries can be deduplicated.
+    rate_limiter (RateLimiter): Optional client-side rate limiter, which may be shared between clients.
+    subscriber_cache (TTLCache): Optional cache for get_subscriber responses, invalidated by subscriber updates and
+                                 deletions made through this client.
+    coalesce_reads (bool): Share one request between concurrent identical GET requests. Enabled by default.
+    codec (str | object): JSON codec for request bodies and responses: 'auto' (default) for the fastest installed
+                          of orjson and msgspec, falling back to the standard library, a codec name, or an instance.
+    hooks (list[Hooks]): Optional instrumentation hooks called around every HTTP attempt, eg a MetricsCollector.
+    outbox (SQLiteOutbox): Optional durable outbox for enqueue_trigger. Its worker starts when entering the client
+                           context or on the first enqueued trigger, replaying entries left over by a previous run.
+    circuit_breaker (CircuitBreaker): Optional breaker failing requests fast with CircuitOpenError while an endpoint
+                                      keeps failing, instead of waiting for timeouts. It may be shared between clients.
+    hedge_policy (HedgePolicy): Optional policy sending a second attempt for GET requests slower than the endpoint's
+                                usual latency, using the first response received.
+    task_pool (TaskPool): Pool running the triggers of trigger_nowait in the background, with its size, overflow
+                          policy and error callback. A pool with the default settings is used if not provided.
+    http_client (httpx.AsyncClient): Optional pooled client shared with other Novu clients, eg by NovuClientPool,
+                                     used instead of creating one. It is not closed by aclose().
+    scheduler (SchedulerLane): Optional lane of a FairScheduler shared with other clients, which every attempt waits
+                               for a slot of before being sent.
+    fingerprint_store (MemoryFingerprintStore | SQLiteFingerprintStore): Optional store of fingerprints of the values
+                                                                         last sent, used by sync_subscriber_credentials
+                                                                         to skip unchanged credentials, and to skip
+                                                                         unchanged upserts when enabled.
+    namespace (str): Prefix for the keys the client writes to stores which may be shared, such as the fingerprint
+                     store, to keep the entries of clients with different API keys apart.
+    skip_unchanged_upserts (bool): Skip upserting subscribers identical to the last ones successfully saved through the
+                                   fingerprint store, which is required. Counts are kept in 'upsert_stats'.
+    priority_scheduler (FairScheduler): Optional scheduler bounding the requests of the client which are in flight or
+                                        waiting for the rate limiter, serving the most urgent ones first and keeping
+                                        its reserved slots for high priority requests. See priority().
 
     """
 
-    def __init__(self, api_key: str, api_url: str = Paths.API_URL):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = Paths.API_URL,
+        max_connections: int = Defaults.MAX_CONNECTIONS,
+        max_keepalive_connections: int = Defaults.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = Defaults.KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        timeout=Defaults.TIMEOUT,
+        transport: httpx.AsyncBaseTransport = None,
+        batch_triggers: bool = False,
+        batch_window: float = Defaults.BATCH_WINDOW,
+        batch_max_size: int = Defaults.BULK_TRIGGER_LIMIT,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        subscriber_cache: TTLCache = None,
+        coalesce_reads: bool = True,
+        codec="auto",
+        hooks: list = None,
+        outbox: SQLiteOutbox = None,
+        circuit_breaker: CircuitBreaker = None,
+        hedge_policy: HedgePolicy = None,
+        task_pool: TaskPool = None,
+        http_client: httpx.AsyncClient = None,
+        scheduler: SchedulerLane = None,
+        fingerprint_store=None,
+        namespace: str = "",
+        skip_unchanged_upserts: bool = False,
+        priority_scheduler: FairScheduler = None,
+    ):
         self.api_url = api_url
         self.headers = {
             "Authorization": f"ApiKey {api_key}",
             "Content-Type": "application/json",
         }
-    
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.timeout = timeout
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.subscriber_cache = subscriber_cache
+        self.coalesce_reads = coalesce_reads
+        self.codec = get_codec(codec)
+        self.hooks = list(hooks) if hooks else []
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.task_pool = task_pool if task_pool is not None else TaskPool()
+        self.scheduler = scheduler
+        self.priority_scheduler = priority_scheduler
+        if skip_unchanged_upserts and fingerprint_store is None:
+            raise ValueError("Skipping unchanged upserts requires a fingerprint store.")
+        self.fingerprint_store = fingerprint_store
+        self.namespace = namespace
+        self.skip_unchanged_upserts = skip_unchanged_upserts
+        self.upsert_stats = {"sent": 0, "skipped": 0}
+        self._shared_http = http_client
+        self._http = None
+        self._inflight = {}
+        self._on_wire = 0
+        self._dispatcher = TriggerDispatcher(self, batch_window, batch_max_size) if batch_triggers else None
+        self._outbox_worker = OutboxWorker(self, outbox) if outbox is not None else None
+
+    async def __aenter__(self):
+        if self._outbox_worker is not None:
+            self._outbox_worker.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared pooled httpx.AsyncClient, created on first access and re-created if previously closed."""
+
+        if self._shared_http is not None:
+            return self._shared_http
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                transport=self.transport,
+            )
+        return self._http
+
+    async def aclose(self):
+        """
+        Wait for the background triggers, send any buffered triggers, stop the outbox worker and close the pooled
+        connections. The client can still be used afterwards.
+        """
+
+        await self.task_pool.drain()
+        if self._outbox_worker is not None:
+            await self._outbox_worker.stop()
+        if self._dispatcher is not None:
+            await self._dispatcher.flush()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def priority(self, level: int):
+        """
+        Return a context manager sending every request made within it, including from tasks it starts, with the given
+        priority. Without it, bulk operations are sent with low priority and other calls with normal priority.
+
+                Parameters:
+                    level (int): Priority of the requests, from Priority.
+
+        Usage:
+
+            with client.priority(Priority.HIGH):
+                await client.trigger_event(trigger)
+
+        """
+
+        return priority(level)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        json=None,
+        endpoint: str = Endpoints.TRIGGER,
+        read_body: bool = True,
+        content: bytes = None,
+    ) -> NovuResponse:
+        """
+        Send a request to the Novu server over the pooled connection and wrap the response.
+        Every attempt waits for the client's rate limiter, and failed attempts are retried according to the client's
+        retry policy, if any. Concurrent identical GET requests share a single request when coalescing is enabled.
+        Raises CircuitOpenError without sending anything while the endpoint's circuit is open.
+
+                Parameters:
+                    method (str): Lowercase HTTP method name, eg 'get' or 'post'.
+                    url (str): Full request URL.
+                    json (dict): Optional JSON body for the request.
+                    endpoint (str): Class of the endpoint, from Endpoints, used to pick the rate limit budget.
+                    read_body (bool): Set to False to discard the body of successful responses without decoding it.
+                    content (bytes): Optional pre-encoded JSON body, sent instead of 'json'.
+
+                Returns:
+                    NovuResponse : The response from the server, decoded on demand.
+
+        """
+
+        # Encode the body once, every attempt sends the same bytes.
+        if content is None and json is not None:
+            content = self.codec.encode(json)
+
+        if method != "get" or not self.coalesce_reads:
+            return await self._perform(method, url, content, endpoint, read_body)
+
+        # Join the identical read already in flight, or start one others can join.
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._perform(method, url, content, endpoint, read_body))
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._inflight.pop(url) if self._inflight.get(url) is done else None)
+
+        # Shield the shared request so one cancelled caller does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    async def _perform(self, method: str, url: str, content: bytes, endpoint: str, read_body: bool) -> NovuResponse:
+
+        circuit = self.circuit_breaker.circuit(f"{method.upper()} {endpoint}") if self.circuit_breaker else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._attempt(method, url, content, endpoint, attempt, circuit)
+            except httpx.TransportError:
+                delay = self.retry_policy.delay(attempt) if self.retry_policy else None
+                if delay is None:
+                    raise
+            else:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.observe(endpoint, response)
+                delay = self.retry_policy.delay(attempt, response) if self.retry_policy else None
+                if delay is None:
+                    status = response.status_code
+                    content = response.content if read_body or status >= 300 else b""
+                    return NovuResponse(status, content, response.headers, self.codec)
+
+            # Wait before trying again.
+            await asyncio.sleep(delay)
+
+    async def _attempt(self, method: str, url: str, content: bytes, endpoint: str, attempt: int, circuit):
+        # Fail fast while the endpoint's circuit is open, before spending a rate limit token.
+        if circuit is not None:
+            circuit.before_call()
+        level = current_priority(Priority.LOW if endpoint == Endpoints.BULK else Priority.NORMAL)
+        try:
+            async with self._slot(endpoint, level):
+                if method == "get" and self.hedge_policy is not None:
+                    response = await self._send_hedged(url, endpoint, attempt, level)
+                else:
+                    response = await self._send(method, url, content, endpoint, attempt)
+        except httpx.TransportError:
+            if circuit is not None:
+                circuit.record(True)
+            raise
+        except BaseException:
+            if circuit is not None:
+                circuit.release()
+            raise
+        if circuit is not None:
+            circuit.record(response.status_code >= 500)
+        return response
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, endpoint: str, level: Priority):
+        # Take a priority slot before waiting for the rate limiter, so urgent requests do not queue behind others.
+        if self.priority_scheduler is not None:
+            await self.priority_scheduler.acquire("", level)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(endpoint, level)
+            if self.scheduler is not None:
+                await self.scheduler.acquire(level)
+            try:
+                yield
+            finally:
+                if self.scheduler is not None:
+                    self.scheduler.release()
+        finally:
+            if self.priority_scheduler is not None:
+                self.priority_scheduler.release()
+
+    async def _send_hedged(self, url: str, endpoint: str, attempt: int, level: Priority) -> httpx.Response:
+        label = f"GET {endpoint}"
+        delay = self.hedge_policy.delay(label)
+        start = time.perf_counter()
+
+        # The hedge is a request of its own, taking the same slots and rate limit token as the first one.
+        async def hedge():
+            async with self._slot(endpoint, level):
+                return await self._send("get", url, None, endpoint, attempt)
+
+        pending = {asyncio.ensure_future(self._send("get", url, None, endpoint, attempt))}
+        try:
+            # Send the hedge if the first attempt is slower than usual for the endpoint.
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    pending.add(asyncio.ensure_future(hedge()))
+
+            # Use the first response, or raise the last error if both attempts failed.
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        response = task.result()
+                        if response.status_code < 500:
+                            self.hedge_policy.observe(label, time.perf_counter() - start)
+                        return response
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(self, method: str, url: str, content: bytes, endpoint: str, attempt: int) -> httpx.Response:
+        method = method.upper()
+        if not self.hooks:
+            return await self.http.request(method, url, content=content, headers=self.headers)
+
+        # Report the attempt to the instrumentation hooks, keeping the count on the wire right if a hook raises.
+        self._on_wire += 1
+        try:
+            size = len(content) if content else 0
+            info = RequestInfo(method, url, endpoint, attempt, size, self._on_wire, self.limits.max_connections)
+            for hook in self.hooks:
+                hook.on_request(info)
+            try:
+                response = await self.http.request(method, url, content=content, headers=self.headers)
+            except BaseException as error:
+                info.finish()
+                for hook in self.hooks:
+                    hook.on_error(info, error)
+                raise
+        finally:
+            self._on_wire -= 1
+        info.finish(response)
+        for hook in self.hooks:
+            hook.on_response(info, response)
+        return response
+
     # Events
     from asyncnovu.api._events import (
         broadcast_event,
         bulk_trigger,
+        bulk_trigger_many,
         cancel_event,
+        cancel_events,
+        drain_outbox,
+        drain_triggers,
+        enqueue_trigger,
+        fanout_event,
+        stream_bulk_trigger,
+        stream_cancel_events,
         trigger_event,
+        trigger_nowait,
+        trigger_template,
     )
 
     # Subscribers
     from asyncnovu.api._subscribers import (
+        bulk_upsert_subscribers,
         delete_subscriber,
         get_subscriber,
+        sync_subscriber_credentials,
         update_subscriber_credentials,
         upsert_subscriber,
     )
@@ -0,0 +1,105 @@
+"""
+This module gathers the JSON codecs used to encode request bodies and decode responses exchanged with Novu.
+The fast codecs rely on the optional 'orjson' and 'msgspec' packages, and fall back to the standard library.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class StdlibCodec:
+    """JSON codec based on the standard library json module, always available."""
+
+    name = "json"
+
+    def encode(self, obj) -> bytes:
+        """Encode a JSON-compatible object into UTF-8 bytes."""
+
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def decode(self, data: bytes):
+        """Decode UTF-8 JSON bytes into Python objects."""
+
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """JSON codec based on orjson. Integers must fit in 64 bits."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the 'orjson' package to be installed.")
+
+    def encode(self, obj) -> bytes:
+        """Encode a JSON-compatible object into UTF-8 bytes."""
+
+        # Accept non-string dictionary keys, which the standard library converts to strings.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: bytes):
+        """Decode UTF-8 JSON bytes into Python objects."""
+
+        return orjson.loads(data)
+
+
+class MsgspecCodec:
+    """JSON codec based on msgspec. Integers must fit in 64 bits."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecCodec requires the 'msgspec' package to be installed.")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj) -> bytes:
+        """Encode a JSON-compatible object into UTF-8 bytes."""
+
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes):
+        """Decode UTF-8 JSON bytes into Python objects."""
+
+        return self._decoder.decode(data)
+
+
+CODECS = {codec.name: codec for codec in (StdlibCodec, OrjsonCodec, MsgspecCodec)}
+"""Available codec classes by name."""
+
+
+# Function to pick a JSON codec by name.
+def get_codec(codec="auto"):
+    """
+    Function to resolve the codec option of the Novu client.
+
+            Parameters:
+                    codec (str | object): 'auto' for the fastest installed codec, a codec name ('json', 'orjson' or
+                                          'msgspec'), or a codec instance with encode() and decode() methods.
+
+            Returns:
+                object: Codec instance.
+
+    """
+
+    if not isinstance(codec, str):
+        return codec
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return StdlibCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of: auto, {', '.join(CODECS)}.")
+    return CODECS[codec]()
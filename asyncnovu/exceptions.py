@@ -0,0 +1,37 @@
+class NovuError(Exception):
+    """Base class for errors raised by the Novu client itself, as opposed to transport errors raised by httpx."""
+
+
+class CircuitOpenError(NovuError):
+    """
+    Raised without sending the request when the circuit breaker of an endpoint is open.
+
+    Attributes:
+
+    endpoint (str): Label of the endpoint whose circuit is open, eg 'POST trigger'.
+    retry_in (float): Seconds until the circuit lets a trial request through.
+
+    """
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(f"Circuit for '{endpoint}' is open, retry in {retry_in:.1f}s.")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class PoolFullError(NovuError):
+    """Raised when submitting work to a full TaskPool whose overflow policy is 'raise'."""
+
+
+class ResponseError(NovuError):
+    """
+    Raised for a request which got an error response, where no response is returned to the caller, eg for triggers
+    sent in the background.
+
+    Attributes:
+
+    response (NovuResponse | dict): Error response of the Novu server.
+
+    """
+    def __init__(self, response):
+        super().__init__(f"Novu request failed with status {response['status_code']}: {response['detail']!r}")
+        self.response = response
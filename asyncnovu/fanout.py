@@ -0,0 +1,64 @@
+import time
+
+
+# Progress of a client-side fan-out of one workflow to many subscribers.
+class FanoutProgress:
+    """
+    Class reporting the progress of NovuClient.fanout_event, updated as every batch completes.
+
+    Batches may complete out of order, so 'checkpoint' only advances over subscribers whose batch and every batch
+    before it completed. Passing it back to fanout_event resumes the fan-out without skipping anyone.
+
+    Attributes:
+
+    sent (int): Number of subscribers whose trigger was accepted by Novu.
+    failed (int): Number of subscribers whose trigger failed.
+    failures (dict): Error details of the failed triggers, by subscriber ID.
+    batches (int): Number of completed bulk requests.
+    checkpoint (int): Number of subscribers from the start of the source which are fully processed.
+
+    """
+    def __init__(self, checkpoint: int = 0):
+        self.sent = 0
+        self.failed = 0
+        self.failures = {}
+        self.batches = 0
+        self.checkpoint = checkpoint
+        self.started = time.monotonic()
+        self._completed = {}
+
+    def __repr__(self):
+        return (
+            f"FanoutProgress(sent={self.sent}, failed={self.failed}, batches={self.batches}, "
+            f"checkpoint={self.checkpoint}, throughput={self.throughput:.1f}/s)"
+        )
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the fan-out started."""
+
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Average number of subscribers processed per second."""
+
+        elapsed = self.elapsed
+        return (self.sent + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    def record(self, offset: int, subscribers: list[str], results: list[dict]):
+        """Account for a completed batch starting at the given offset of the source."""
+
+        self.batches += 1
+        for subscriber, result in zip(subscribers, results):
+            status = result["status_code"]
+            if status is not None and status < 300:
+                self.sent += 1
+            else:
+                self.failed += 1
+                self.failures[subscriber] = result["detail"]
+
+        # Advance the checkpoint over the contiguous run of completed batches.
+        self._completed[offset] = offset + len(subscribers)
+        while self.checkpoint in self._completed:
+            self.checkpoint = self._completed.pop(self.checkpoint)
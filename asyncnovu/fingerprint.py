@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+# Function to fingerprint a JSON-compatible value.
+def fingerprint(value) -> str:
+    """
+    Function to compute a stable fingerprint of a JSON-compatible value, independent of the order of dictionary keys.
+
+            Parameters:
+                    value (Any): JSON-compatible value, eg the wire representation of a model.
+
+            Returns:
+                str: Hexadecimal digest of the value.
+
+    """
+
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+# In-process store of fingerprints with least recently used eviction.
+class MemoryFingerprintStore:
+    """
+    Class keeping the fingerprints of the last values sent to Novu in memory, to skip sending unchanged values again.
+    When the store is full, the least recently used fingerprint is evicted, which only costs a redundant request.
+
+    Parameters:
+
+    maxsize (int): Maximum number of fingerprints kept in the store.
+
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize < 1:
+            raise ValueError("Store size must be at least 1.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get_many(self, keys: list[str]) -> dict:
+        """Return the stored fingerprints of the given keys, omitting unknown keys."""
+
+        found = {}
+        for key in keys:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    async def set_many(self, fingerprints: dict):
+        """Store fingerprints by key."""
+
+        for key, value in fingerprints.items():
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete_many(self, keys: list[str]):
+        """Forget the fingerprints of the given keys, so their next value is sent whatever it is."""
+
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def delete_prefix(self, prefix: str):
+        """Forget the fingerprints of every key starting with the given prefix."""
+
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    async def clear(self):
+        """Forget every fingerprint."""
+
+        self._entries.clear()
+
+
+# Store of fingerprints kept in a local SQLite file.
+class SQLiteFingerprintStore:
+    """
+    Class keeping the fingerprints of the last values sent to Novu in a local SQLite file, so that they survive
+    restarts and can be shared by the processes of a host, eg successive runs of a sync job.
+
+    Parameters:
+
+    path (str): Path of the SQLite database file, created if it does not exist.
+    timeout (float): Seconds to wait for another process holding the database lock.
+
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS novu_fingerprints (key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)"
+        )
+
+    async def get_many(self, keys: list[str]) -> dict:
+        """Return the stored fingerprints of the given keys, omitting unknown keys."""
+
+        return await asyncio.to_thread(self._get_many, list(keys))
+
+    async def set_many(self, fingerprints: dict):
+        """Store fingerprints by key."""
+
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO novu_fingerprints (key, fingerprint) VALUES (?, ?)",
+            list(fingerprints.items()),
+        )
+
+    async def delete_many(self, keys: list[str]):
+        """Forget the fingerprints of the given keys, so their next value is sent whatever it is."""
+
+        await asyncio.to_thread(self._execute, "DELETE FROM novu_fingerprints WHERE key = ?", [(key,) for key in keys])
+
+    async def delete_prefix(self, prefix: str):
+        """Forget the fingerprints of every key starting with the given prefix."""
+
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM novu_fingerprints WHERE substr(key, 1, ?) = ?", [(len(prefix), prefix)]
+        )
+
+    async def clear(self):
+        """Forget every fingerprint."""
+
+        await asyncio.to_thread(self._execute, "DELETE FROM novu_fingerprints", [()])
+
+    def close(self):
+        """Close the database connection, once any statement still running in a worker thread completed."""
+
+        with self._lock:
+            self._connection.close()
+
+    def _get_many(self, keys):
+        found = {}
+        with self._lock:
+            # Stay below SQLite's limit on the number of query parameters.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                found.update(
+                    self._connection.execute(
+                        f"SELECT key, fingerprint FROM novu_fingerprints WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                )
+        return found
+
+    def _execute(self, statement, rows):
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany(statement, rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
@@ -0,0 +1,260 @@
+"""
+This module gathers the instrumentation hooks of the Novu client: the hook interface, a built-in metrics collector
+and an optional OpenTelemetry integration, which requires the 'opentelemetry-api' package.
+"""
+import bisect
+import time
+from collections import defaultdict
+
+import httpx
+
+
+class RequestInfo:
+    """
+    Class describing one HTTP attempt sent by the client, passed to every hook.
+
+    Attributes:
+
+    method (str): Uppercase HTTP method.
+    url (str): Full request URL.
+    endpoint (str): Class of the endpoint, from Endpoints.
+    attempt (int): Number of the attempt for the call, starting at 1. Higher values are retries.
+    bytes_sent (int): Size of the request body.
+    in_flight (int): Number of attempts on the wire for the client, including this one.
+    pool_size (int): Maximum number of connections of the client's pool.
+    start (float): time.perf_counter() value when the attempt started.
+    elapsed (float): Seconds the attempt took, set once it completed.
+    status_code (int): Response status code, None until a response is received.
+    bytes_received (int): Size of the response body, 0 until a response is received.
+    context (dict): Free storage for hooks to keep per-attempt state, eg spans.
+
+    """
+    __slots__ = (
+        "method", "url", "endpoint", "attempt", "bytes_sent", "in_flight", "pool_size",
+        "start", "elapsed", "status_code", "bytes_received", "context",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        attempt: int,
+        bytes_sent: int,
+        in_flight: int,
+        pool_size: int,
+    ):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.bytes_sent = bytes_sent
+        self.in_flight = in_flight
+        self.pool_size = pool_size
+        self.start = time.perf_counter()
+        self.elapsed = None
+        self.status_code = None
+        self.bytes_received = 0
+        self.context = {}
+
+    @property
+    def key(self) -> str:
+        """Label grouping the metrics of an attempt, eg 'POST trigger'."""
+
+        return f"{self.method} {self.endpoint}"
+
+    def finish(self, response: httpx.Response = None):
+        """Record the end of the attempt and, when available, its response."""
+
+        self.elapsed = time.perf_counter() - self.start
+        if response is not None:
+            self.status_code = response.status_code
+            self.bytes_received = len(response.content)
+
+
+class Hooks:
+    """
+    Base class for client instrumentation hooks. Subclasses override the callbacks they need.
+
+    Callbacks run inline for every HTTP attempt, so they should be fast and must not raise.
+    """
+
+    def on_request(self, info: RequestInfo):
+        """Called before an attempt is sent."""
+
+    def on_response(self, info: RequestInfo, response: httpx.Response):
+        """Called when an attempt received a response, whatever its status code."""
+
+    def on_error(self, info: RequestInfo, error: BaseException):
+        """Called when an attempt failed without a response, eg on a transport error or cancellation."""
+
+
+class Histogram:
+    """
+    Class representing a fixed-bucket histogram of latencies.
+
+    Attributes:
+
+    bounds (tuple[float]): Upper bounds in seconds of every bucket but the last, which is unbounded.
+    counts (list[int]): Number of observations per bucket.
+    count (int): Total number of observations.
+    total (float): Sum of all observations in seconds.
+
+    """
+    BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds: tuple = BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        """Record one observation."""
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it, inf for the last bucket."""
+
+        if not self.count:
+            return 0.0
+        rank, seen = fraction * self.count, 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+
+class MetricsCollector(Hooks):
+    """
+    Hooks collecting client metrics in memory: latency histograms, status codes and errors per endpoint, in-flight
+    attempts, retries, bytes sent and received, and connection pool utilisation.
+
+    Pool utilisation is estimated as the number of attempts on the wire over the pool's maximum number of connections.
+
+    Attributes:
+
+    latency (dict[str, Histogram]): Latency histogram per endpoint label, eg 'POST trigger'.
+    statuses (dict[str, Counter]): Response status code counts per endpoint label.
+    errors (dict[str, int]): Attempts failed without a response per endpoint label.
+    requests (int): Number of attempts sent.
+    retries (int): Number of attempts which were retries of a previous one.
+    in_flight (int): Number of attempts currently on the wire.
+    peak_in_flight (int): Highest number of attempts on the wire at once.
+    bytes_sent (int): Total size of request bodies.
+    bytes_received (int): Total size of response bodies.
+    pool_utilisation (float): Latest estimate of the share of the connection pool in use.
+    peak_pool_utilisation (float): Highest estimate of the share of the connection pool in use.
+
+    """
+
+    def __init__(self, bounds: tuple = Histogram.BOUNDS):
+        self.bounds = bounds
+        self.latency = defaultdict(lambda: Histogram(self.bounds))
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+        self.requests = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.pool_utilisation = 0.0
+        self.peak_pool_utilisation = 0.0
+
+    def on_request(self, info: RequestInfo):
+        self.requests += 1
+        if info.attempt > 1:
+            self.retries += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.bytes_sent += info.bytes_sent
+        if info.pool_size:
+            self.pool_utilisation = min(1.0, info.in_flight / info.pool_size)
+            self.peak_pool_utilisation = max(self.peak_pool_utilisation, self.pool_utilisation)
+
+    def on_response(self, info: RequestInfo, response: httpx.Response):
+        self.in_flight -= 1
+        self.latency[info.key].observe(info.elapsed)
+        self.statuses[info.key][info.status_code] += 1
+        self.bytes_received += info.bytes_received
+
+    def on_error(self, info: RequestInfo, error: BaseException):
+        self.in_flight -= 1
+        self.latency[info.key].observe(info.elapsed)
+        self.errors[info.key] += 1
+
+    def snapshot(self) -> dict:
+        """Return a plain dictionary summary of the collected metrics, eg for logging or exporting."""
+
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "pool_utilisation": self.pool_utilisation,
+            "peak_pool_utilisation": self.peak_pool_utilisation,
+            "endpoints": {
+                key: {
+                    "count": histogram.count,
+                    "mean": histogram.total / histogram.count if histogram.count else 0.0,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                    "statuses": dict(self.statuses[key]),
+                    "errors": self.errors[key],
+                }
+                for key, histogram in self.latency.items()
+            },
+        }
+
+
+class OpenTelemetryHooks(Hooks):
+    """
+    Hooks emitting one OpenTelemetry client span per HTTP attempt. Requires the 'opentelemetry-api' package.
+
+    Parameters:
+
+    tracer (opentelemetry.trace.Tracer): Tracer used to create the spans. Defaults to the global tracer provider's.
+
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError as error:
+            raise ImportError("OpenTelemetryHooks requires the 'opentelemetry-api' package to be installed.") from error
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("asyncnovu")
+
+    def on_request(self, info: RequestInfo):
+        info.context["span"] = self.tracer.start_span(
+            f"Novu {info.key}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "url.full": info.url,
+                "novu.endpoint": info.endpoint,
+                "novu.attempt": info.attempt,
+                "http.request.body.size": info.bytes_sent,
+            },
+        )
+
+    def on_response(self, info: RequestInfo, response: httpx.Response):
+        span = info.context.pop("span")
+        span.set_attribute("http.response.status_code", info.status_code)
+        span.set_attribute("http.response.body.size", info.bytes_received)
+        if info.status_code >= 400:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def on_error(self, info: RequestInfo, error: BaseException):
+        span = info.context.pop("span")
+        span.record_exception(error)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, type(error).__name__))
+        span.end()
@@ -1,4 +1,56 @@
-class Trigger:
+import weakref
+
+
+# Public attributes of a slotted model, from the base class down.
+def _fields(cls) -> list[str]:
+    return [
+        attribute
+        for klass in reversed(cls.__mro__)
+        for attribute in getattr(klass, "__slots__", ())
+        if not attribute.startswith("_")
+    ]
+
+
+class _WireModel:
+    """Base class for slotted request models, sent to the Novu API as the dictionary returned by to_wire()."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute in _fields(type(self)))
+        return f"{type(self).__name__}({fields})"
+
+
+class _CachedWire:
+    """
+    Mixin caching the JSON wire representation of models which are sent many times, such as subscribers.
+
+    Subclasses build their wire dictionary in _build_wire(). It is built on the first call to to_wire() and reused
+    until an attribute is reassigned. It is shared between callers and must not be modified.
+    """
+
+    __slots__ = ("_wire",)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_wire", None)
+
+    def to_wire(self) -> dict:
+        """
+        Return the JSON representation of the model expected by the Novu API, omitting unset (None) fields.
+
+        The result is cached. Reassigning an attribute resets the cache, but mutating a nested value in place
+        (eg appending to a list) does not.
+        """
+
+        wire = self._wire
+        if wire is None:
+            wire = self._build_wire()
+            object.__setattr__(self, "_wire", wire)
+        return wire
+
+
+class Trigger(_WireModel):
     """
     Class representing a single trigger request to activate a Novu workflow from an existing template.
 
@@ -8,22 +60,115 @@ class Trigger:
     subscribers (list[str]): List of subscriber IDs for users requiring notifications.
     payload (dict): Optional dictionary with custom attributes needed by the template.
     overrides (dict): Additional attributes needed for template integrations.
+    transaction_id (str): Optional unique ID of the trigger, used by Novu to deduplicate and cancel it.
 
     """
+    __slots__ = ("id", "subscribers", "payload", "overrides", "transaction_id")
+
     def __init__(
         self,
         id: str,
         subscribers: list[str] = None,
         payload: dict = None,
-        overrides: dict = None
+        overrides: dict = None,
+        transaction_id: str = None,
     ):
         self.id = id
         self.subscribers = subscribers
         self.payload = payload
         self.overrides = overrides
+        self.transaction_id = transaction_id
+
+    def to_wire(self) -> dict:
+        """Return the JSON representation of the trigger expected by the Novu API, omitting unset (None) fields."""
+
+        wire = {"name": self.id}
+        if self.subscribers is not None:
+            wire["to"] = self.subscribers
+        if self.payload is not None:
+            wire["payload"] = self.payload
+        if self.overrides is not None:
+            wire["overrides"] = self.overrides
+        if self.transaction_id is not None:
+            wire["transactionId"] = self.transaction_id
+        return wire
 
 
-class Subscriber:
+class TriggerTemplate(Trigger):
+    """
+    Class representing a trigger repeated many times with the same workflow, overrides and constant payload, where
+    only the subscribers, some payload keys and the transaction ID change between calls.
+
+    The constant parts are validated when the template is created, and encoded to JSON once per codec instance. Every call then
+    only encodes its own fields and splices them in, see NovuClient.trigger_template. A template is also a Trigger
+    without subscribers, eg for broadcast_event.
+
+    Attributes:
+
+    id (str): Unique ID of the Novu template.
+    payload (dict): Optional payload attributes shared by every call.
+    overrides (dict): Optional attributes needed for template integrations, shared by every call.
+
+    """
+    __slots__ = ("_encoded",)
+
+    def __init__(self, id: str, payload: dict = None, overrides: dict = None):
+        if not isinstance(id, str) or not id:
+            raise ValueError("Trigger template ID must be a non-empty string.")
+        if payload is not None and not isinstance(payload, dict):
+            raise ValueError("Trigger template payload must be a dictionary.")
+        if overrides is not None and not isinstance(overrides, dict):
+            raise ValueError("Trigger template overrides must be a dictionary.")
+        super().__init__(id, payload=payload, overrides=overrides)
+
+    def __setattr__(self, name, value):
+        # Reassigning an attribute resets the encoded constant parts.
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_encoded", weakref.WeakKeyDictionary())
+
+    def to_trigger(self, subscribers: list[str], payload: dict = None, transaction_id: str = None) -> Trigger:
+        """Return a plain Trigger for the given subscribers, with the per-call payload merged over the constant one."""
+
+        if payload:
+            payload = {**self.payload, **payload} if self.payload else payload
+        else:
+            payload = self.payload
+        return Trigger(self.id, subscribers, payload, self.overrides, transaction_id)
+
+    def encode(self, codec, subscribers: list[str], payload: dict = None, transaction_id: str = None) -> bytes:
+        """
+        Return the JSON body of a trigger for the given subscribers, splicing the per-call fields into the constant
+        parts encoded with the given codec on first use.
+        """
+
+        # Per-call keys replacing constant ones are encoded the regular way, so the body has no duplicate keys.
+        if payload and self.payload and not self.payload.keys().isdisjoint(payload):
+            return codec.encode(self.to_trigger(subscribers, payload, transaction_id).to_wire())
+
+        # Keyed by the codec itself, as custom codecs need not have a name, without keeping it alive.
+        encoded = self._encoded.get(codec)
+        if encoded is None:
+            # Keep the object opened after the constant fields, and the constant payload entries without braces.
+            head = {"name": self.id}
+            if self.overrides is not None:
+                head["overrides"] = self.overrides
+            encoded = (codec.encode(head)[:-1], codec.encode(self.payload)[1:-1] if self.payload else b"")
+            self._encoded[codec] = encoded
+        head, constant = encoded
+
+        body = [head, b',"to":', codec.encode(subscribers)]
+        extra = codec.encode(payload)[1:-1] if payload else b""
+        if constant or extra:
+            body += [b',"payload":{', constant, b"," if constant and extra else b"", extra, b"}"]
+        elif self.payload is not None:
+            body.append(b',"payload":{}')
+        if transaction_id is not None:
+            body += [b',"transactionId":', codec.encode(transaction_id)]
+        body.append(b"}")
+        return b"".join(body)
+
+
+class Subscriber(_CachedWire, _WireModel):
     """
     Class representing a Novu subscriber.
 
@@ -37,6 +182,8 @@ class Subscriber:
     avatar (str): Optional URL pointing to a profile picture.
 
     """
+    __slots__ = ("id", "email", "first_name", "last_name", "phone", "avatar")
+
     def __init__(
         self,
         id: str,
@@ -46,9 +193,26 @@ class Subscriber:
         phone: str = None,
         avatar: str = None,
     ):
-        self.id = id
-        self.email = email
-        self.first_name = first_name
-        self.last_name = last_name
-        self.phone = phone
-        self.avatar = avatar
+        # Assign through object.__setattr__ to skip the cache reset, which is not needed while constructing.
+        assign = object.__setattr__
+        assign(self, "id", id)
+        assign(self, "email", email)
+        assign(self, "first_name", first_name)
+        assign(self, "last_name", last_name)
+        assign(self, "phone", phone)
+        assign(self, "avatar", avatar)
+        assign(self, "_wire", None)
+
+    def _build_wire(self) -> dict:
+        wire = {"subscriberId": self.id}
+        if self.email is not None:
+            wire["email"] = self.email
+        if self.first_name is not None:
+            wire["firstName"] = self.first_name
+        if self.last_name is not None:
+            wire["lastName"] = self.last_name
+        if self.phone is not None:
+            wire["phone"] = self.phone
+        if self.avatar is not None:
+            wire["avatar"] = self.avatar
+        return wire
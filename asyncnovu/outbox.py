@@ -0,0 +1,278 @@
+import asyncio
+import sqlite3
+import threading
+import time
+
+import httpx
+from asyncnovu._constants import Defaults, Endpoints, Paths
+from asyncnovu._utils import format_error
+from asyncnovu.exceptions import CircuitOpenError
+
+
+# Durable local store of triggers waiting to be sent to Novu.
+class SQLiteOutbox:
+    """
+    Class representing a durable outbox of triggers kept in a local SQLite file.
+
+    Triggers are committed to the file before NovuClient.enqueue_trigger returns, and a background worker sends them
+    through the bulk trigger endpoint. Entries are only removed once Novu acknowledged them, so triggers left over by
+    a crash are replayed on the next start. Every entry keeps the transaction ID it was given when enqueued, which lets
+    Novu deduplicate a trigger that was sent but not acknowledged before the crash.
+
+    Parameters:
+
+    path (str): Path of the SQLite database file, created if it does not exist.
+    batch_size (int): Maximum number of triggers per bulk request.
+    poll_interval (float): Maximum seconds the worker sleeps before checking for due entries again.
+    max_attempts (int): Number of failed sends after which an entry is marked as failed and no longer retried.
+    backoff_base (float): Seconds to wait before retrying an entry after its first failed send, doubled every time.
+    backoff_cap (float): Maximum seconds to wait before retrying an entry.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = Defaults.BULK_TRIGGER_LIMIT,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 300.0,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS novu_outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "transaction_id TEXT NOT NULL UNIQUE, "
+            "event BLOB NOT NULL, "
+            "state TEXT NOT NULL DEFAULT 'pending', "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "next_attempt REAL NOT NULL DEFAULT 0, "
+            "error TEXT)"
+        )
+
+    async def append(self, transaction_id: str, event: bytes):
+        """Durably store an encoded trigger. Transaction IDs already in the outbox are ignored."""
+
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR IGNORE INTO novu_outbox (transaction_id, event) VALUES (?, ?)",
+            [(transaction_id, event)],
+        )
+
+    async def fetch(self, limit: int) -> list:
+        """Return up to 'limit' due pending entries as (id, event) tuples, oldest first."""
+
+        return await asyncio.to_thread(
+            self._query,
+            "SELECT id, event FROM novu_outbox WHERE state = 'pending' AND next_attempt <= ? ORDER BY id LIMIT ?",
+            (time.time(), limit),
+        )
+
+    async def ack(self, ids: list):
+        """Remove entries acknowledged by Novu."""
+
+        await asyncio.to_thread(self._execute, "DELETE FROM novu_outbox WHERE id = ?", [(id,) for id in ids])
+
+    async def fail(self, failures: list):
+        """Mark entries as permanently failed, from (id, error) tuples."""
+
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE novu_outbox SET state = 'failed', error = ? WHERE id = ?",
+            [(error, id) for id, error in failures],
+        )
+
+    async def retry(self, failures: list):
+        """Schedule entries for another attempt with exponential backoff, from (id, error) tuples."""
+
+        await asyncio.to_thread(self._retry, failures, time.time())
+
+    async def requeue_failed(self) -> int:
+        """Move every failed entry back to pending with a fresh attempt budget, and return how many were moved."""
+
+        return await asyncio.to_thread(
+            self._execute,
+            "UPDATE novu_outbox SET state = 'pending', attempts = 0, next_attempt = 0, error = NULL "
+            "WHERE state = 'failed'",
+            [()],
+        )
+
+    async def counts(self) -> dict:
+        """Return the number of entries per state, eg {'pending': 3, 'failed': 1}."""
+
+        rows = await asyncio.to_thread(self._query, "SELECT state, COUNT(*) FROM novu_outbox GROUP BY state", ())
+        return {"pending": 0, "failed": 0, **dict(rows)}
+
+    async def failures(self, limit: int = 100) -> list:
+        """Return up to 'limit' failed entries as (transaction_id, error) tuples."""
+
+        return await asyncio.to_thread(
+            self._query,
+            "SELECT transaction_id, error FROM novu_outbox WHERE state = 'failed' ORDER BY id LIMIT ?",
+            (limit,),
+        )
+
+    def close(self):
+        """Close the database connection, once any statement still running in a worker thread completed."""
+
+        with self._lock:
+            self._connection.close()
+
+    def _retry(self, failures, now):
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                for id, error in failures:
+                    row = self._connection.execute("SELECT attempts FROM novu_outbox WHERE id = ?", (id,)).fetchone()
+                    if row is None:
+                        continue
+                    attempts = row[0] + 1
+                    if attempts >= self.max_attempts:
+                        self._connection.execute(
+                            "UPDATE novu_outbox SET state = 'failed', attempts = ?, error = ? WHERE id = ?",
+                            (attempts, error, id),
+                        )
+                    else:
+                        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempts - 1))
+                        self._connection.execute(
+                            "UPDATE novu_outbox SET attempts = ?, next_attempt = ?, error = ? WHERE id = ?",
+                            (attempts, now + delay, error, id),
+                        )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _execute(self, statement, rows):
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                changes = sum(self._connection.execute(statement, row).rowcount for row in rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            return changes
+
+    def _query(self, statement, parameters):
+        with self._lock:
+            return self._connection.execute(statement, parameters).fetchall()
+
+
+# Background worker sending the triggers of an outbox.
+class OutboxWorker:
+    """
+    Class draining an outbox through a NovuClient's bulk trigger endpoint in the background.
+
+    Entries acknowledged by Novu are removed. Entries rejected individually, or in a batch rejected with a client error,
+    are marked as failed. Entries in a batch that was rate limited, hit a server error or could not be sent are retried
+    with backoff.
+
+    Parameters:
+
+    client (NovuClient): Client used to send the triggers.
+    outbox (SQLiteOutbox): Outbox to drain.
+
+    """
+
+    def __init__(self, client, outbox: SQLiteOutbox):
+        self.client = client
+        self.outbox = outbox
+        self.last_error = None
+        self._task = None
+        self._wakeup = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker is currently draining the outbox."""
+
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start draining the outbox, including entries left over by a previous run."""
+
+        if not self.running:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+    def notify(self):
+        """Wake the worker up after new entries were appended."""
+
+        self.start()
+        self._wakeup.set()
+
+    async def stop(self):
+        """
+        Stop the worker. A batch interrupted while being sent stays in the outbox and is replayed with the same
+        transaction IDs on the next start.
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def drain(self, timeout: float = None):
+        """Wait until no pending entry is left in the outbox. Failed entries are not waited for."""
+
+        async def wait():
+            while (await self.outbox.counts())["pending"]:
+                self.notify()
+                await asyncio.sleep(min(0.05, self.outbox.poll_interval))
+
+        await asyncio.wait_for(wait(), timeout)
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                entries = await self.outbox.fetch(self.outbox.batch_size)
+                if entries:
+                    await self._send(entries)
+                    continue
+            except Exception as error:
+                # Keep the worker alive, the entries stay in the outbox.
+                self.last_error = error
+
+            # Sleep until new entries are appended or the next poll.
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.outbox.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _send(self, entries: list):
+        ids = [id for id, _ in entries]
+        url = self.client.api_url + Paths.TRIGGER_ENDPOINT + Paths.BULK_SUFFIX
+        json = {"events": [self.client.codec.decode(event) for _, event in entries]}
+
+        try:
+            response = await self.client._request("post", url, json=json, endpoint=Endpoints.BULK)
+        except (httpx.HTTPError, CircuitOpenError) as error:
+            await self.outbox.retry([(id, format_error(error)["detail"]) for id in ids])
+            return
+
+        code, detail = response["status_code"], response["detail"]
+        if code < 300 and isinstance(detail, list) and len(detail) == len(ids):
+            # Acknowledge or fail every entry from its own result.
+            acknowledged = [id for id, result in zip(ids, detail) if result.get("acknowledged")]
+            rejected = [(id, repr(result)) for id, result in zip(ids, detail) if not result.get("acknowledged")]
+            await self.outbox.ack(acknowledged)
+            if rejected:
+                await self.outbox.fail(rejected)
+        elif code in (408, 429) or code >= 500:
+            await self.outbox.retry([(id, repr(detail)) for id in ids])
+        else:
+            await self.outbox.fail([(id, repr(detail)) for id in ids])
@@ -0,0 +1,171 @@
+import hashlib
+
+import httpx
+from asyncnovu._constants import Defaults, Paths
+from asyncnovu.client import NovuClient
+from asyncnovu.codec import get_codec
+from asyncnovu.ratelimit import RateLimiter
+from asyncnovu.scheduler import FairScheduler
+
+# Options managed by the pool for every tenant.
+_POOL_OPTIONS = ("api_url", "http_client", "scheduler", "rate_limiter", "namespace", "fingerprint_store")
+
+# Options holding tenant data or state, which must not be shared between tenants.
+_TENANT_OPTIONS = ("subscriber_cache", "outbox", "task_pool", "priority_scheduler")
+
+
+# Pool of Novu clients for many tenants sharing one set of connections.
+class NovuClientPool:
+    """
+    A class managing one NovuClient per API key (eg per Novu environment or organization), all sharing a single
+    pooled httpx.AsyncClient so that the number of sockets stays flat as the number of tenants grows.
+
+    Every tenant keeps its own authorization headers and, if configured, its own rate limit budget. Requests of all
+    tenants share a FairScheduler, which grants the connection slots round-robin between tenants with waiting
+    requests, so one busy tenant cannot starve the others.
+
+    Options holding tenant data, such as a subscriber cache or an outbox, are given per tenant to client(), never to
+    the pool. A fingerprint store given to the pool is shared, with keys namespaced by tenant.
+
+    Parameters:
+
+    api_url (str): Novu Server URL for sending requests. If not provided, default value would be https://api.novu.co/v1
+    max_connections (int): Maximum number of concurrent connections kept in the shared pool.
+    max_keepalive_connections (int): Maximum number of idle connections kept alive in the shared pool.
+    keepalive_expiry (float): Seconds an idle connection is kept alive before being closed.
+    http2 (bool): Enable HTTP/2 support. Requires the 'h2' package to be installed.
+    timeout (float | httpx.Timeout): Timeout configuration applied to every request.
+    transport (httpx.AsyncBaseTransport): Optional custom transport, eg for testing with httpx.MockTransport.
+    max_in_flight (int): Maximum number of requests in flight at once across tenants. Defaults to max_connections.
+    rate_limits (dict): Optional RateLimiter arguments applied to every tenant with a budget of its own, eg
+                        {"trigger": RateLimit(60), "bulk": RateLimit(10)}.
+    rate_limit_backend (MemoryBackend | SQLiteBackend): Storage for the token buckets of every tenant.
+    fingerprint_store (MemoryFingerprintStore | SQLiteFingerprintStore): Optional fingerprint store shared by every
+                                                                         tenant, with keys namespaced by tenant.
+    **options: Other NovuClient arguments applied to every tenant's client, eg retry_policy or codec.
+
+    Usage:
+
+        async with NovuClientPool(rate_limits={"trigger": RateLimit(60)}) as pool:
+            await pool.client(api_key).trigger_event(trigger)
+
+    """
+
+    def __init__(
+        self,
+        api_url: str = Paths.API_URL,
+        max_connections: int = Defaults.MAX_CONNECTIONS,
+        max_keepalive_connections: int = Defaults.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = Defaults.KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        timeout=Defaults.TIMEOUT,
+        transport: httpx.AsyncBaseTransport = None,
+        max_in_flight: int = None,
+        rate_limits: dict = None,
+        rate_limit_backend=None,
+        fingerprint_store=None,
+        **options,
+    ):
+        for name in _POOL_OPTIONS + _TENANT_OPTIONS:
+            if name in options:
+                raise ValueError(f"'{name}' cannot be shared by the tenants of a NovuClientPool.")
+
+        self.api_url = api_url
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.timeout = timeout
+        self.transport = transport
+        self.scheduler = FairScheduler(max_in_flight or max_connections)
+        self.rate_limits = rate_limits
+        self.rate_limit_backend = rate_limit_backend
+        self.fingerprint_store = fingerprint_store
+        # Resolve the codec once, so templates shared by the tenants are encoded once.
+        self.options = {**options, "codec": get_codec(options.get("codec", "auto"))}
+        self.clients = {}
+        self._http = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def __len__(self):
+        return len(self.clients)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled httpx.AsyncClient shared by every tenant, created on first access."""
+
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                transport=self.transport,
+            )
+        return self._http
+
+    def client(self, api_key: str, rate_limits: dict = None, **options) -> NovuClient:
+        """
+        Return the client of a tenant, created on first use.
+
+                Parameters:
+                    api_key (str): Unique Novu API key of the tenant.
+                    rate_limits (dict): Optional RateLimiter arguments for this tenant, instead of the pool's. Only
+                                        used when the tenant's client is created.
+                    **options: Optional NovuClient arguments for this tenant, eg its own subscriber_cache or outbox,
+                               added to the pool's. Only used when the tenant's client is created.
+
+                Returns:
+                    NovuClient : Client sending the tenant's requests over the shared connections.
+
+        """
+
+        client = self.clients.get(api_key)
+        if client is None:
+            for name in _POOL_OPTIONS:
+                if name in options:
+                    raise ValueError(f"'{name}' is managed by the NovuClientPool.")
+
+            # Keep API keys out of scheduler and rate limit keys, which may be stored on disk.
+            tenant = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+            rate_limits = rate_limits if rate_limits is not None else self.rate_limits
+            rate_limiter = None
+            if rate_limits is not None:
+                rate_limiter = RateLimiter(**rate_limits, backend=self.rate_limit_backend, namespace=f"{tenant}:")
+                self.rate_limit_backend = rate_limiter.backend
+
+            client = self.clients[api_key] = NovuClient(
+                api_key,
+                self.api_url,
+                max_connections=self.limits.max_connections,
+                rate_limiter=rate_limiter,
+                http_client=self.http,
+                scheduler=self.scheduler.lane(tenant),
+                fingerprint_store=self.fingerprint_store,
+                namespace=f"{tenant}:",
+                **{**self.options, **options},
+            )
+        return client
+
+    async def remove(self, api_key: str):
+        """Close and forget the client of a tenant, eg when it is offboarded."""
+
+        client = self.clients.pop(api_key, None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self):
+        """Close every tenant's client, then the shared connections."""
+
+        for client in list(self.clients.values()):
+            await client.aclose()
+        self.clients.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
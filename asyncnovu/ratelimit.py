@@ -0,0 +1,226 @@
+import asyncio
+import sqlite3
+import threading
+import time
+
+import httpx
+from asyncnovu._constants import Endpoints
+from asyncnovu.retry import parse_retry_after
+from asyncnovu.scheduler import FairScheduler, Priority
+
+
+class RateLimit:
+    """
+    Class representing a token bucket budget for one class of Novu endpoints.
+
+    Attributes:
+
+    rate (float): Number of requests allowed per second on average.
+    burst (int): Number of requests which may be sent at once after an idle period. Defaults to one second's worth.
+
+    """
+    def __init__(self, rate: float, burst: int = None):
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+
+# In-process storage for token buckets.
+class MemoryBackend:
+    """
+    Token bucket storage local to the current process, shared by every client using the same RateLimiter.
+
+    Buckets may go into debt: every request reserves a token immediately and waits until the bucket would have refilled
+    it, so concurrent waiters are served in order without polling.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+
+    async def reserve(self, key: str, rate: float, burst: int) -> float:
+        """Take one token from the bucket and return the number of seconds to wait before using it."""
+
+        now = time.monotonic()
+        tokens = self._refill(key, rate, burst, now) - 1
+        self._buckets[key] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    async def pause(self, key: str, rate: float, burst: int, seconds: float):
+        """Empty the bucket so that no token becomes available for the given number of seconds."""
+
+        now = time.monotonic()
+        tokens = self._refill(key, rate, burst, now)
+        self._buckets[key] = (min(tokens, -seconds * rate), now)
+
+    def _refill(self, key, rate, burst, now):
+        tokens, updated = self._buckets.get(key, (burst, now))
+        return min(burst, tokens + (now - updated) * rate)
+
+
+# SQLite storage for token buckets shared between processes.
+class SQLiteBackend:
+    """
+    Token bucket storage kept in a local SQLite file, so that several processes on the same host share one budget.
+
+    Parameters:
+
+    path (str): Path of the SQLite database file, created if it does not exist.
+    timeout (float): Seconds to wait for another process holding the database lock.
+
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS novu_rate_limits (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+        )
+
+    async def reserve(self, key: str, rate: float, burst: int) -> float:
+        """Take one token from the bucket and return the number of seconds to wait before using it."""
+
+        tokens = await asyncio.to_thread(self._update, key, rate, burst, lambda tokens: tokens - 1)
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    async def pause(self, key: str, rate: float, burst: int, seconds: float):
+        """Empty the bucket so that no token becomes available for the given number of seconds."""
+
+        await asyncio.to_thread(self._update, key, rate, burst, lambda tokens: min(tokens, -seconds * rate))
+
+    def close(self):
+        """Close the database connection, once any statement still running in a worker thread completed."""
+
+        with self._lock:
+            self._connection.close()
+
+    def _update(self, key, rate, burst, change):
+        with self._lock:
+            # Lock the database for writing so the read-modify-write is atomic across processes.
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._connection.execute(
+                    "SELECT tokens, updated FROM novu_rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated = row if row is not None else (burst, now)
+                tokens = change(min(burst, tokens + max(0.0, now - updated) * rate))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO novu_rate_limits (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now),
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+            return tokens
+
+
+# Client-side rate limiter for requests sent to the Novu server.
+class RateLimiter:
+    """
+    Class limiting the rate of requests sent to the Novu server, with one token bucket per class of endpoints.
+
+    Requests wait for capacity before being sent instead of being rejected by Novu with a 429 response. Within this
+    process, requests waiting on the same bucket take their tokens one at a time, the most urgent priority first, so
+    a high priority request never waits behind queued bulk requests for more than one token. When adaptive,
+    the limiter also reads the rate limit headers returned by Novu: it pauses a bucket when the server reports an
+    exhausted budget or rate limits a request, and lowers the configured rate to the one advertised by the server.
+
+    Parameters:
+
+    trigger (RateLimit): Budget for trigger, broadcast and cancel requests, None for no limit.
+    bulk (RateLimit): Budget for bulk trigger requests, None for no limit.
+    subscribers (RateLimit): Budget for subscriber requests, None for no limit.
+    backend (MemoryBackend | SQLiteBackend): Storage for the token buckets. Defaults to a new MemoryBackend.
+    adaptive (bool): Tune the buckets from the rate limit headers returned by Novu.
+    namespace (str): Prefix for bucket keys, to keep separate budgets in a shared backend (eg one per API key).
+
+    """
+
+    def __init__(
+        self,
+        trigger: RateLimit = RateLimit(60),
+        bulk: RateLimit = RateLimit(10),
+        subscribers: RateLimit = RateLimit(60),
+        backend=None,
+        adaptive: bool = True,
+        namespace: str = "",
+    ):
+        self.limits = {
+            Endpoints.TRIGGER: trigger,
+            Endpoints.BULK: bulk,
+            Endpoints.SUBSCRIBERS: subscribers,
+        }
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.adaptive = adaptive
+        self.namespace = namespace
+        self._queues = {}
+
+    async def acquire(self, endpoint: str, priority: int = Priority.NORMAL):
+        """Wait until a request to the given class of endpoints and priority, from Priority, may be sent."""
+
+        limit = self.limits.get(endpoint)
+        if limit is None:
+            return
+        key = self.namespace + endpoint
+
+        # Only the head of the bucket's queue reserves a token and waits for it, the others queue by priority.
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = FairScheduler(1)
+        await queue.acquire(key, priority)
+        try:
+            delay = await self.backend.reserve(key, limit.rate, limit.burst)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        finally:
+            queue.release()
+
+    async def observe(self, endpoint: str, response: httpx.Response):
+        """Adjust the bucket of the given class of endpoints from the rate limit headers of a response."""
+
+        limit = self.limits.get(endpoint)
+        if limit is None or not self.adaptive:
+            return
+        headers = response.headers
+
+        # Follow the rate advertised by the server if it is stricter than the configured one.
+        policy = _parse_policy(_header(headers, "Policy"))
+        if policy is not None and policy < limit.rate:
+            limit = self.limits[endpoint] = RateLimit(policy, min(limit.burst, max(1, int(policy))))
+
+        # Pause the bucket when the server reports the budget as exhausted.
+        pause = None
+        if response.status_code == 429:
+            pause = parse_retry_after(headers.get("Retry-After"))
+        if _header(headers, "Remaining") == "0":
+            reset = parse_retry_after(_header(headers, "Reset"))
+            if reset is not None:
+                pause = max(pause or 0.0, reset)
+        if pause:
+            await self.backend.pause(self.namespace + endpoint, limit.rate, limit.burst, pause)
+
+
+# Read a rate limit header using either the standard or the legacy 'X-' name.
+def _header(headers: httpx.Headers, name: str):
+    value = headers.get(f"RateLimit-{name}")
+    return value if value is not None else headers.get(f"X-RateLimit-{name}")
+
+
+# Parse a RateLimit-Policy header such as '100;w=60' into requests per second.
+def _parse_policy(value: str):
+    if not value:
+        return None
+    try:
+        quota, *parameters = value.split(",")[0].split(";")
+        window = 1.0
+        for parameter in parameters:
+            name, _, amount = parameter.strip().partition("=")
+            if name == "w":
+                window = float(amount)
+        rate = float(quota) / window
+    except (ValueError, ZeroDivisionError):
+        return None
+    return rate if rate > 0 else None
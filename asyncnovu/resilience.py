@@ -0,0 +1,159 @@
+import math
+import time
+from collections import deque
+
+from asyncnovu.exceptions import CircuitOpenError
+
+
+# State of the circuit of one endpoint.
+class Circuit:
+    """
+    Class tracking the recent outcomes of one endpoint and whether requests to it are allowed.
+
+    The circuit is 'closed' while the endpoint is healthy. It opens when the share of failures over the recent calls
+    reaches the breaker's threshold, failing every request fast. After the reset timeout it becomes 'half_open' and
+    lets a limited number of trial requests through: a success closes it, a failure opens it again.
+
+    Attributes:
+
+    endpoint (str): Label of the endpoint, eg 'POST trigger'.
+    state (str): One of 'closed', 'open' or 'half_open'.
+
+    """
+    def __init__(self, breaker, endpoint: str):
+        self.breaker = breaker
+        self.endpoint = endpoint
+        self.state = "closed"
+        self._outcomes = deque(maxlen=breaker.window)
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failures over the recent calls."""
+
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def before_call(self):
+        """Reserve the right to send a request, raising CircuitOpenError if the circuit does not allow it."""
+
+        if self.state == "open":
+            retry_in = self._opened_at + self.breaker.reset_timeout - time.monotonic()
+            if retry_in > 0:
+                raise CircuitOpenError(self.endpoint, retry_in)
+            self.state, self._trials = "half_open", 0
+        if self.state == "half_open":
+            if self._trials >= self.breaker.half_open_calls:
+                raise CircuitOpenError(self.endpoint, 0.0)
+            self._trials += 1
+
+    def release(self):
+        """Give back a reservation whose request ended without an outcome, eg when cancelled."""
+
+        if self.state == "half_open":
+            self._trials -= 1
+
+    def record(self, failure: bool):
+        """Record the outcome of a request sent after before_call()."""
+
+        if self.state == "half_open":
+            if failure:
+                self._open()
+            else:
+                self.state = "closed"
+                self._outcomes.clear()
+            return
+        if self.state == "open":
+            return
+
+        self._outcomes.append(failure)
+        if len(self._outcomes) >= self.breaker.min_calls and self.failure_rate >= self.breaker.failure_threshold:
+            self._open()
+
+    def _open(self):
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+# Circuit breaker keeping one circuit per endpoint.
+class CircuitBreaker:
+    """
+    Class failing requests fast with CircuitOpenError while an endpoint of the Novu server is degraded, instead of
+    letting every caller wait for full timeouts. Transport errors and 5xx responses count as failures.
+
+    Parameters:
+
+    failure_threshold (float): Share of failures over the window which opens the circuit.
+    window (int): Number of recent calls the failure share is computed over.
+    min_calls (int): Minimum number of recent calls before the circuit can open.
+    reset_timeout (float): Seconds an open circuit waits before letting trial requests through.
+    half_open_calls (int): Number of trial requests allowed at once while half-open.
+
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.circuits = {}
+
+    def circuit(self, endpoint: str) -> Circuit:
+        """Return the circuit of an endpoint, created closed on first use."""
+
+        circuit = self.circuits.get(endpoint)
+        if circuit is None:
+            circuit = self.circuits[endpoint] = Circuit(self, endpoint)
+        return circuit
+
+
+# Policy for hedging slow idempotent reads.
+class HedgePolicy:
+    """
+    Class describing when to send a second, hedged attempt for a slow idempotent read such as get_subscriber.
+
+    The hedge is sent when the first attempt is slower than the given quantile of the endpoint's recent latencies.
+    The first response wins and the other attempt is cancelled. Hedging starts once enough latencies were observed.
+
+    Parameters:
+
+    quantile (float): Latency quantile after which the hedge is sent, eg 0.95.
+    min_delay (float): Minimum seconds to wait before hedging, to avoid hedging fast endpoints.
+    window (int): Number of recent latencies tracked per endpoint.
+    min_samples (int): Number of latencies to observe before hedging starts.
+
+    """
+
+    def __init__(self, quantile: float = 0.95, min_delay: float = 0.01, window: int = 200, min_samples: int = 20):
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies = {}
+
+    def observe(self, endpoint: str, latency: float):
+        """Record the latency of a successful read."""
+
+        samples = self._latencies.get(endpoint)
+        if samples is None:
+            samples = self._latencies[endpoint] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def delay(self, endpoint: str):
+        """Return the seconds to wait before hedging a read, or None if not enough latencies were observed."""
+
+        samples = self._latencies.get(endpoint)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(self.quantile * len(ordered)) - 1))
+        return max(self.min_delay, ordered[index])
@@ -0,0 +1,99 @@
+from collections.abc import Mapping
+
+import httpx
+from asyncnovu._utils import format
+
+# Marker for a detail which was not decoded yet.
+_PENDING = object()
+
+
+# Response of the Novu server, decoded on demand.
+class NovuResponse(Mapping):
+    """
+    Class representing a response of the Novu server, keeping the raw body and only decoding it when 'detail' is first
+    accessed. Responses nobody looks into, such as acknowledgements of triggers, are never decoded.
+
+    It is a read-only mapping with the 'status_code' and 'detail' keys, so it can be used wherever the formatted
+    response dictionaries were, and compares equal to them. to_dict() returns such a dictionary.
+
+    Attributes:
+
+    status_code (int): HTTP status code returned by Novu.
+    content (bytes): Raw response body. Empty when the body was discarded, see NovuClient.trigger_event.
+    headers (httpx.Headers): Response headers, eg the rate limit headers.
+    skipped (bool): Whether the client answered the request itself without sending it, eg an upsert of an unchanged
+                    subscriber. Such responses are successful, with a 200 status code.
+
+    """
+    __slots__ = ("status_code", "content", "headers", "skipped", "_codec", "_detail")
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes = b"",
+        headers: httpx.Headers = None,
+        codec=None,
+        skipped: bool = False,
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers if headers is not None else httpx.Headers()
+        self.skipped = skipped
+        self._codec = codec
+        self._detail = _PENDING
+
+    @classmethod
+    def from_detail(cls, status_code: int, detail, headers: httpx.Headers = None, skipped: bool = False):
+        """Return a response with an already decoded detail, eg one result of a bulk request or a skipped request."""
+
+        response = cls(status_code, headers=headers, skipped=skipped)
+        response._detail = detail
+        return response
+
+    def __repr__(self):
+        return f"NovuResponse(status_code={self.status_code!r}, detail={self.detail!r})"
+
+    def __getitem__(self, key):
+        if key == "status_code":
+            return self.status_code
+        if key == "detail":
+            return self.detail
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("status_code", "detail"))
+
+    def __len__(self):
+        return 2
+
+    @property
+    def detail(self):
+        """
+        Data of the response if the request succeeded, error details if not. Decoded on first access. Bodies which
+        are not JSON objects, such as the HTML error page of a proxy, are kept as the raw text.
+        """
+
+        if self._detail is _PENDING:
+            try:
+                body = self._codec.decode(self.content) if self.content else {}
+            except ValueError:
+                body = self.content.decode(errors="replace")
+            self._detail = format(self.status_code, body)["detail"] if isinstance(body, dict) else body
+        return self._detail
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded."""
+
+        return self.status_code < 300
+
+    @property
+    def request_id(self) -> str:
+        """ID of the request given by the server, to quote when reporting issues, if sent."""
+
+        return self.headers.get("X-Request-Id")
+
+    def to_dict(self) -> dict:
+        """Return the response as a formatted dictionary with the 'status_code' and 'detail' keys."""
+
+        return {"status_code": self.status_code, "detail": self.detail}
@@ -0,0 +1,99 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+
+# Policy describing how failed requests to the Novu server are retried.
+class RetryPolicy:
+    """
+    Class representing the retry behaviour applied to every request sent by a NovuClient.
+
+    Requests are retried on transport errors and on the configured status codes (rate limiting and transient server
+    errors by default), waiting between attempts with exponential backoff and full jitter. When the server sends a
+    Retry-After header, that delay is used instead. Trigger requests are sent with a transaction ID which is reused by
+    every attempt, so Novu deduplicates a trigger that was processed before its response was lost.
+
+    Attributes:
+
+    max_attempts (int): Maximum number of attempts per request, including the first one.
+    backoff_base (float): Backoff ceiling in seconds for the first retry, doubled for every following retry.
+    backoff_cap (float): Maximum backoff in seconds. Requests whose Retry-After exceeds it are not retried.
+    retry_statuses (tuple[int]): Response status codes which should be retried.
+    respect_retry_after (bool): Wait for the delay given by the server's Retry-After header when present.
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        retry_statuses: tuple = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("RetryPolicy needs at least one attempt.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full jitter backoff delay in seconds after the given (1-based) failed attempt."""
+
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def delay(self, attempt: int, response: httpx.Response = None):
+        """
+        Return the delay in seconds before retrying after the given (1-based) failed attempt, or None to stop retrying.
+
+                Parameters:
+                    attempt (int): Number of the attempt which just failed.
+                    response (httpx.Response): Response of the failed attempt, None for transport errors.
+
+                Returns:
+                    float : Seconds to wait before the next attempt, None if the request should not be retried.
+
+        """
+
+        if attempt >= self.max_attempts:
+            return None
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return None
+            if self.respect_retry_after:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    return retry_after if retry_after <= self.backoff_cap else None
+        return self.backoff(attempt)
+
+
+# Function to parse a Retry-After header into seconds.
+def parse_retry_after(value: str):
+    """
+    Function to parse a Retry-After header value given either in seconds or as an HTTP date.
+
+            Parameters:
+                    value (str): Raw header value, may be None.
+
+            Returns:
+                float: Seconds to wait, None if the header is missing or invalid.
+
+    """
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
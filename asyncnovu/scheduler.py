@@ -0,0 +1,193 @@
+import asyncio
+import contextlib
+import contextvars
+from collections import OrderedDict, deque
+
+
+class Priority:
+    """Priority classes of requests, from the most to the least urgent."""
+
+    # Transactional notifications, eg password resets and one-time codes.
+    HIGH = 0
+    # Default for individual API calls.
+    NORMAL = 1
+    # Default for bulk operations, eg marketing campaigns.
+    LOW = 2
+
+
+# Priority of the requests sent from the current context, None when not set.
+_priority = contextvars.ContextVar("novu_priority", default=None)
+
+
+# Function to read the priority of the current context.
+def current_priority(default: int = Priority.NORMAL) -> int:
+    """
+    Function to get the priority requests sent from the current context are scheduled with.
+
+            Parameters:
+                    default (int): Priority to use when none was set.
+
+            Returns:
+                int: Priority of the current context, from Priority.
+
+    """
+
+    level = _priority.get()
+    return default if level is None else level
+
+
+# Context manager setting the priority of the requests sent within it.
+@contextlib.contextmanager
+def priority(level: int):
+    """
+    Context manager sending every request made within it, including from tasks it starts, with the given priority.
+
+            Parameters:
+                    level (int): Priority of the requests, from Priority.
+
+    Usage:
+
+        with priority(Priority.HIGH):
+            await client.trigger_event(trigger)
+
+    """
+
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+# Context manager setting the priority of the requests sent within it, unless the caller already set one.
+@contextlib.contextmanager
+def default_priority(level: int):
+    if _priority.get() is not None:
+        yield
+        return
+    with priority(level):
+        yield
+
+
+# Scheduler sharing a bounded number of request slots between priorities and keys.
+class FairScheduler:
+    """
+    Class bounding the number of requests in flight at once. Free slots go to the waiting requests of the most urgent
+    priority first, and round-robin between the keys (eg tenants) with waiting requests of that priority, so that a
+    key sending many requests cannot starve the others.
+
+    Some slots may be reserved for high priority requests, so that urgent requests find capacity right away even while
+    bulk operations keep every other slot busy.
+
+    Parameters:
+
+    capacity (int): Maximum number of requests in flight at once, across all keys.
+    reserved (int): Number of slots only high priority requests may use.
+
+    """
+
+    def __init__(self, capacity: int, reserved: int = 0):
+        if capacity < 1:
+            raise ValueError("Scheduler capacity must be at least 1.")
+        if not 0 <= reserved < capacity:
+            raise ValueError("Reserved slots must leave at least one slot for other priorities.")
+        self.capacity = capacity
+        self.reserved = reserved
+        self.active = 0
+        self._waiters = {}
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for a slot."""
+
+        return sum(len(queue) for waiters in self._waiters.values() for queue in waiters.values())
+
+    def lane(self, key: str) -> "SchedulerLane":
+        """Return the lane of a key, to pass to NovuClient as its scheduler."""
+
+        return SchedulerLane(self, key)
+
+    async def acquire(self, key: str, priority: int = Priority.NORMAL):
+        """Wait for a free slot, served after more urgent requests and in turn with the other keys."""
+
+        if self._free(priority) and not any(level <= priority for level in self._waiters):
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(priority, OrderedDict()).setdefault(key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted as the waiter got cancelled, hand it over.
+                self.release()
+            else:
+                self._discard(priority, key, future)
+            raise
+
+    def release(self):
+        """Free a slot taken by acquire()."""
+
+        self.active -= 1
+        self._dispatch()
+
+    def _free(self, priority):
+        limit = self.capacity if priority <= Priority.HIGH else self.capacity - self.reserved
+        return self.active < limit
+
+    def _dispatch(self):
+        for level in sorted(self._waiters):
+            waiters = self._waiters[level]
+            while waiters and self._free(level):
+                # Serve the first key in turn, then move it to the back of the round.
+                key, queue = next(iter(waiters.items()))
+                future = queue.popleft()
+                if queue:
+                    waiters.move_to_end(key)
+                else:
+                    del waiters[key]
+                if not future.done():
+                    self.active += 1
+                    future.set_result(None)
+            if waiters:
+                # Less urgent requests wait for this priority to be served.
+                return
+            del self._waiters[level]
+
+    def _discard(self, priority, key, future):
+        waiters = self._waiters.get(priority, {})
+        queue = waiters.get(key)
+        if queue is not None and future in queue:
+            queue.remove(future)
+            if not queue:
+                del waiters[key]
+            if not waiters:
+                del self._waiters[priority]
+
+
+# Handle on a FairScheduler bound to one key.
+class SchedulerLane:
+    """
+    Class binding a FairScheduler to one key, used as the scheduler of a NovuClient.
+
+    Attributes:
+
+    scheduler (FairScheduler): Scheduler shared between the lanes.
+    key (str): Key the requests of this lane are scheduled under.
+
+    """
+
+    def __init__(self, scheduler: FairScheduler, key: str):
+        self.scheduler = scheduler
+        self.key = key
+
+    async def acquire(self, priority: int = Priority.NORMAL):
+        """Wait for a free slot of the shared scheduler."""
+
+        await self.scheduler.acquire(self.key, priority)
+
+    def release(self):
+        """Free the slot taken by acquire()."""
+
+        self.scheduler.release()
@@ -0,0 +1,125 @@
+import asyncio
+import functools
+import threading
+
+from asyncnovu._constants import Paths
+from asyncnovu.client import NovuClient
+
+
+# Build a blocking method running the NovuClient coroutine method of the same name.
+def _blocking(name: str):
+    method = getattr(NovuClient, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return self._call(getattr(self.client, name)(*args, **kwargs))
+
+    return call
+
+
+# Build a blocking generator iterating over the NovuClient async generator method of the same name.
+def _blocking_iterator(name: str):
+    method = getattr(NovuClient, name)
+
+    @functools.wraps(method)
+    def iterate(self, *args, **kwargs):
+        iterator = getattr(self.client, name)(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self._call(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._call(iterator.aclose())
+
+    return iterate
+
+
+# Blocking Python client for connecting and making requests to a Novu server from synchronous code.
+class SyncNovuClient:
+    """
+    A class to interface with Novu APIs from synchronous code, eg Django views or Celery workers.
+
+    The client runs one persistent event loop in a background thread, with a single pooled NovuClient, and exposes the
+    same methods as blocking calls. Calls can be made from any number of threads at once. Use the client as a context
+    manager, or call close() when done, to release the pooled connections and stop the background thread.
+
+    With an outbox, its worker runs on the background loop from the start, sending entries left over by a previous run.
+
+    Parameters:
+
+    api_key (str): Unique Novu API key to authorize requests to the Novu server.
+    api_url (str): Novu Server URL for sending requests. If not provided, default value would be https://api.novu.co/v1
+    call_timeout (float): Optional maximum number of seconds a blocking call waits for its result.
+    **options: Any other NovuClient option, eg retry_policy or max_connections.
+
+    """
+
+    def __init__(self, api_key: str, api_url: str = Paths.API_URL, call_timeout: float = None, **options):
+        self.call_timeout = call_timeout
+        self.client = NovuClient(api_key, api_url, **options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="novu-client-loop", daemon=True)
+        self._thread.start()
+        self._call(self.client.__aenter__())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client was closed and can no longer be used."""
+
+        return self._loop.is_closed()
+
+    def close(self):
+        """Send any buffered triggers, close the pooled connections and stop the background event loop."""
+
+        if self.closed:
+            return
+        try:
+            self._call(self.client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def _call(self, coroutine):
+        # Run a coroutine on the background loop and block until it completes.
+        if self.closed:
+            coroutine.close()
+            raise RuntimeError("SyncNovuClient is closed.")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.call_timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    # Events
+    trigger_event = _blocking("trigger_event")
+    trigger_nowait = _blocking("trigger_nowait")
+    trigger_template = _blocking("trigger_template")
+    drain_triggers = _blocking("drain_triggers")
+    enqueue_trigger = _blocking("enqueue_trigger")
+    drain_outbox = _blocking("drain_outbox")
+    bulk_trigger = _blocking("bulk_trigger")
+    bulk_trigger_many = _blocking("bulk_trigger_many")
+    stream_bulk_trigger = _blocking_iterator("stream_bulk_trigger")
+    broadcast_event = _blocking("broadcast_event")
+    fanout_event = _blocking_iterator("fanout_event")
+    cancel_event = _blocking("cancel_event")
+    cancel_events = _blocking("cancel_events")
+    stream_cancel_events = _blocking_iterator("stream_cancel_events")
+
+    # Subscribers
+    get_subscriber = _blocking("get_subscriber")
+    upsert_subscriber = _blocking("upsert_subscriber")
+    bulk_upsert_subscribers = _blocking("bulk_upsert_subscribers")
+    update_subscriber_credentials = _blocking("update_subscriber_credentials")
+    sync_subscriber_credentials = _blocking("sync_subscriber_credentials")
+    delete_subscriber = _blocking("delete_subscriber")
@@ -0,0 +1,95 @@
+import asyncio
+
+from asyncnovu._constants import Defaults
+from asyncnovu.exceptions import PoolFullError
+
+OVERFLOW_POLICIES = ("block", "drop", "raise")
+
+
+# Bounded pool of background tasks.
+class TaskPool:
+    """
+    Class running coroutines in the background with a bound on the number of tasks alive at once, used by
+    NovuClient.trigger_nowait to take Novu's latency off the caller's path.
+
+    Parameters:
+
+    size (int): Maximum number of tasks running at once.
+    overflow (str): What to do when submitting to a full pool: 'block' waits for a free slot, 'drop' discards the work
+                    and 'raise' raises PoolFullError.
+    on_error (Callable): Optional function called with the submitted item and the exception when a task fails.
+                         Without it, the last exception is kept in 'last_error'.
+
+    Attributes:
+
+    submitted (int): Number of items accepted by the pool.
+    dropped (int): Number of items discarded because the pool was full.
+    failed (int): Number of tasks which raised an exception.
+
+    """
+
+    def __init__(self, size: int = Defaults.TASK_POOL_SIZE, overflow: str = "block", on_error=None):
+        if size < 1:
+            raise ValueError("Task pool size must be at least 1.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Overflow policy must be one of {', '.join(OVERFLOW_POLICIES)}.")
+        self.size = size
+        self.overflow = overflow
+        self.on_error = on_error
+        self.submitted = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error = None
+        self._slots = asyncio.Semaphore(size)
+        self._tasks = set()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    async def submit(self, func, item) -> bool:
+        """
+        Run func(item) in the background once a slot is free.
+
+        Returns:
+            bool : True if the item was accepted, False if it was dropped because the pool is full.
+        """
+
+        if self._slots.locked():
+            if self.overflow == "drop":
+                self.dropped += 1
+                return False
+            if self.overflow == "raise":
+                raise PoolFullError(f"Task pool is full with {self.size} running tasks.")
+        await self._slots.acquire()
+
+        self.submitted += 1
+        task = asyncio.ensure_future(func(item))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._done(done, item))
+        return True
+
+    async def drain(self, timeout: float = None):
+        """Wait until every task submitted so far, and any submitted meanwhile, completed."""
+
+        async def wait():
+            while self._tasks:
+                await asyncio.wait(set(self._tasks))
+
+        await asyncio.wait_for(wait(), timeout)
+
+    def _done(self, task: asyncio.Task, item):
+        self._tasks.discard(task)
+        self._slots.release()
+        if task.cancelled() or task.exception() is None:
+            return
+
+        self.failed += 1
+        error = task.exception()
+        if self.on_error is None:
+            self.last_error = error
+            return
+        try:
+            self.on_error(item, error)
+        except Exception as callback_error:
+            # Never let a failing callback break the pool.
+            self.last_error = callback_error
@@ -0,0 +1,169 @@
+"""
+This module provides an in-memory stand-in for the Novu API, to test and benchmark the client without a server.
+"""
+import asyncio
+import json
+import random
+import uuid
+from collections import Counter
+
+import httpx
+from asyncnovu._constants import Defaults, Paths
+
+
+# In-memory stand-in for the Novu API.
+class FakeNovu:
+    """
+    Class emulating the Novu API endpoints used by the client, served through an httpx.MockTransport.
+
+    Covers triggers (single, bulk and broadcast), cancellations and subscribers (get, upsert, bulk upsert, credentials
+    and delete). Subscribers and triggered transactions are kept in memory, and every request can be delayed or made
+    to fail at random to emulate a loaded server.
+
+    Parameters:
+
+    latency (float): Seconds every request takes before a response is sent.
+    jitter (float): Maximum random seconds added to the latency of every request.
+    error_rate (float): Probability for a request to fail with a 500 response.
+    rate_limit_rate (float): Probability for a request to be rejected with a 429 response.
+    retry_after (float): Value of the Retry-After header sent with 429 responses.
+    seed (int): Optional seed for the random generator, for reproducible runs.
+    record_transactions (bool): Keep the IDs of triggered transactions so they can be cancelled. Disable for long
+                                benchmarks to keep the fake server's memory flat.
+
+    Usage:
+
+        fake = FakeNovu(latency=0.02)
+        client = NovuClient("api_key", transport=fake.transport())
+
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1,
+        seed: int = None,
+        record_transactions: bool = True,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.record_transactions = record_transactions
+        self.subscribers = {}
+        self.credentials = {}
+        self.transactions = set()
+        self.calls = Counter()
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a transport to pass to NovuClient, routing its requests to this fake server."""
+
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request the way the Novu API would."""
+
+        # Emulate network and server processing time.
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # Inject rate limiting and server errors.
+        if self.rate_limit_rate and self.random.random() < self.rate_limit_rate:
+            self.calls["429"] += 1
+            return _error(429, "Too Many Requests", {"Retry-After": str(self.retry_after)})
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.calls["500"] += 1
+            return _error(500, "Internal Server Error")
+
+        path = request.url.path
+        body = json.loads(request.content) if request.content else None
+        for prefix in (Paths.TRIGGER_ENDPOINT, Paths.SUBSCRIBERS_ENDPOINT):
+            index = path.find(prefix)
+            if index != -1:
+                route, rest = prefix, path[index + len(prefix):]
+                break
+        else:
+            return _error(404, "Not Found")
+
+        self.calls[f"{request.method} {route}{rest if rest in _SUFFIXES else ''}"] += 1
+        if route == Paths.TRIGGER_ENDPOINT:
+            return self._events(request.method, rest, body)
+        return self._subscribers(request.method, rest, body)
+
+    def _events(self, method, rest, body):
+        if method == "POST" and rest == "":
+            return _data(201, self._trigger(body))
+        if method == "POST" and rest == Paths.BULK_SUFFIX:
+            events = body.get("events") or []
+            if len(events) > Defaults.BULK_TRIGGER_LIMIT:
+                return _error(400, f"events must contain no more than {Defaults.BULK_TRIGGER_LIMIT} elements")
+            return _data(201, [self._trigger(event) for event in events])
+        if method == "POST" and rest == Paths.BROADCAST_SUFFIX:
+            return _data(201, self._trigger(body))
+        if method == "DELETE" and rest.count("/") == 1:
+            transaction_id = rest[1:]
+            cancelled = transaction_id in self.transactions
+            self.transactions.discard(transaction_id)
+            return _data(200, cancelled)
+        return _error(404, "Not Found")
+
+    def _trigger(self, event):
+        transaction_id = event.get("transactionId") or uuid.uuid4().hex
+        if self.record_transactions:
+            self.transactions.add(transaction_id)
+        return {"acknowledged": True, "status": "processed", "transactionId": transaction_id}
+
+    def _subscribers(self, method, rest, body):
+        if method == "POST" and rest == "":
+            return _data(201, self._upsert(body))
+        if method == "POST" and rest == Paths.BULK_SUFFIX:
+            subscribers = body.get("subscribers") or []
+            if len(subscribers) > Defaults.BULK_SUBSCRIBER_LIMIT:
+                return _error(400, f"subscribers must contain no more than {Defaults.BULK_SUBSCRIBER_LIMIT} elements")
+            result = {"created": [], "updated": [], "failed": []}
+            for subscriber in subscribers:
+                created = subscriber["subscriberId"] not in self.subscribers
+                self._upsert(subscriber)
+                result["created" if created else "updated"].append({"subscriberId": subscriber["subscriberId"]})
+            return _data(201, result)
+
+        subscriber_id, _, suffix = rest[1:].partition("/")
+        if not subscriber_id:
+            return _error(404, "Not Found")
+        if method == "PUT" and "/" + suffix == Paths.CREDENTIALS_SUFFIX:
+            if subscriber_id not in self.subscribers:
+                return _error(404, f"Subscriber not found for id {subscriber_id}")
+            self.credentials[(subscriber_id, body["providerId"])] = body.get("credentials")
+            return _data(200, self.subscribers[subscriber_id])
+        if suffix:
+            return _error(404, "Not Found")
+        if method == "GET":
+            if subscriber_id not in self.subscribers:
+                return _error(404, f"Subscriber not found for id {subscriber_id}")
+            return _data(200, self.subscribers[subscriber_id])
+        if method == "DELETE":
+            self.subscribers.pop(subscriber_id, None)
+            return _data(200, {"acknowledged": True, "status": "deleted"})
+        return _error(404, "Not Found")
+
+    def _upsert(self, subscriber):
+        profile = self.subscribers.setdefault(subscriber["subscriberId"], {"_id": uuid.uuid4().hex})
+        profile.update(subscriber)
+        return profile
+
+
+_SUFFIXES = (Paths.BULK_SUFFIX, Paths.BROADCAST_SUFFIX)
+
+
+def _data(code, data):
+    return httpx.Response(code, json={"data": data})
+
+
+def _error(code, message, headers=None):
+    return httpx.Response(code, json={"statusCode": code, "message": message}, headers=headers)
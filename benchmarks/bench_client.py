@@ -0,0 +1,91 @@
+"""
+Load benchmark of the Novu client against the in-memory FakeNovu server.
+
+Reports requests per second, p50/p99 latency and peak traced memory for trigger_event, bulk_trigger and
+upsert_subscriber at several concurrency levels. Timings and memory are measured in separate runs, as tracing
+memory allocations slows the client down considerably.
+
+Usage: python benchmarks/bench_client.py [--requests N] [--concurrency 1 10 100] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from asyncnovu.client import NovuClient
+from asyncnovu.models import Subscriber, Trigger
+from asyncnovu.testing import FakeNovu
+
+OPERATIONS = {
+    "trigger_event": lambda client, index: client.trigger_event(
+        Trigger(id="welcome", subscribers=[f"subscriber_{index}"], payload={"index": index})
+    ),
+    "bulk_trigger": lambda client, index: client.bulk_trigger(
+        [Trigger(id="welcome", subscribers=[f"subscriber_{index}_{item}"], payload={"index": item}) for item in range(100)]
+    ),
+    "upsert_subscriber": lambda client, index: client.upsert_subscriber(
+        Subscriber(id=f"subscriber_{index}", email=f"subscriber_{index}@example.com", first_name="Test")
+    ),
+}
+
+
+def percentile(samples, fraction):
+    # Nearest-rank percentile of sorted samples.
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+async def run(operation, requests, concurrency, latency, trace_memory=False, **client_options):
+    """Run 'requests' calls of an operation with 'concurrency' workers and return the measurements."""
+
+    fake = FakeNovu(latency=latency, record_transactions=False)
+    call = OPERATIONS[operation]
+    latencies = []
+    counter = iter(range(requests))
+
+    async with NovuClient("api_key", transport=fake.transport(), **client_options) as client:
+        async def worker():
+            for index in counter:
+                start = time.perf_counter()
+                await call(client, index)
+                latencies.append(time.perf_counter() - start)
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    if trace_memory:
+        return {"peak_kib": peak / 1024}
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+        "mean": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def main(arguments):
+    print(f"{'operation':<20}{'concurrency':>12}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>12}")
+    for operation in arguments.operations:
+        for concurrency in arguments.concurrency:
+            result = await run(operation, arguments.requests, concurrency, arguments.latency)
+            result.update(await run(operation, arguments.requests, concurrency, arguments.latency, trace_memory=True))
+            print(
+                f"{operation:<20}{concurrency:>12}{result['rps']:>12,.0f}{result['p50']:>10.2f}"
+                f"{result['p99']:>10.2f}{result['peak_kib']:>12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="calls per operation and concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100], help="concurrent callers")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds of emulated server latency")
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    asyncio.run(main(parser.parse_args()))
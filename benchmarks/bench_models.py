@@ -0,0 +1,117 @@
+"""
+Benchmark of the request models: memory per object and wire serialization throughput.
+
+Compares the slotted models against the previous plain classes, whose wire dictionaries were rebuilt field by field by
+every API call. Triggers, which are usually sent once, build their wire dictionary on every to_wire() call, so both
+of their rates are the same. Subscribers cache it, so only their first to_wire() call builds it.
+
+Usage: python benchmarks/bench_models.py [count]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from asyncnovu.models import Subscriber, Trigger
+
+
+class LegacyTrigger:
+    """Plain class equivalent to the previous Trigger model."""
+
+    def __init__(self, id, subscribers=None, payload=None, overrides=None):
+        self.id = id
+        self.subscribers = subscribers
+        self.payload = payload
+        self.overrides = overrides
+
+
+class LegacySubscriber:
+    """Plain class equivalent to the previous Subscriber model."""
+
+    def __init__(self, id, email=None, first_name=None, last_name=None, phone=None, avatar=None):
+        self.id = id
+        self.email = email
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phone = phone
+        self.avatar = avatar
+
+
+def legacy_trigger_wire(trigger):
+    return {
+        "name": trigger.id,
+        "to": trigger.subscribers,
+        "payload": trigger.payload,
+        "overrides": trigger.overrides,
+    }
+
+
+def legacy_subscriber_wire(subscriber):
+    return {
+        "subscriberId": subscriber.id,
+        "email": subscriber.email,
+        "firstName": subscriber.first_name,
+        "lastName": subscriber.last_name,
+        "phone": subscriber.phone,
+        "avatar": subscriber.avatar,
+    }
+
+
+def memory_per_object(factory, count):
+    # Measure the memory retained by 'count' objects, excluding the shared field values.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(index) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / count
+
+
+def throughput(function, objects, repeat=5):
+    # Best of 'repeat' runs, in objects serialized per second.
+    best = min(timeit.repeat(lambda: [function(item) for item in objects], number=1, repeat=repeat))
+    return len(objects) / best
+
+
+def main(count):
+    subscribers = ["subscriber_id"]
+    payload = {"name": "Test"}
+    cases = [
+        (
+            "Trigger",
+            lambda index: LegacyTrigger("template", subscribers, payload),
+            lambda index: Trigger("template", subscribers, payload),
+            legacy_trigger_wire,
+        ),
+        (
+            "Subscriber",
+            lambda index: LegacySubscriber("subscriber_id", "subscriber@gmail.com", "Test", "Subscriber"),
+            lambda index: Subscriber("subscriber_id", "subscriber@gmail.com", "Test", "Subscriber"),
+            legacy_subscriber_wire,
+        ),
+    ]
+
+    print(f"{'model':<12}{'variant':<10}{'bytes/object':>14}{'first wire/s':>16}{'cached wire/s':>16}")
+    for name, legacy_factory, factory, legacy_wire in cases:
+        legacy_objects = [legacy_factory(index) for index in range(count)]
+        legacy_rate = throughput(legacy_wire, legacy_objects)
+        print(
+            f"{name:<12}{'legacy':<10}{memory_per_object(legacy_factory, count):>14.1f}"
+            f"{legacy_rate:>16,.0f}{legacy_rate:>16,.0f}"
+        )
+
+        # Serialize fresh objects for the uncached rate, then the same objects again for the cached rate.
+        to_wire = type(factory(0)).to_wire
+        first_rate = max(throughput(to_wire, [factory(index) for index in range(count)], repeat=1) for _ in range(5))
+        objects = [factory(index) for index in range(count)]
+        [to_wire(item) for item in objects]
+        cached_rate = throughput(to_wire, objects)
+        print(
+            f"{name:<12}{'slotted':<10}{memory_per_object(factory, count):>14.1f}"
+            f"{first_rate:>16,.0f}{cached_rate:>16,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,68 @@
+import httpx
+import pytest
+from asyncnovu.cache import TTLCache
+from asyncnovu.client import NovuClient
+from asyncnovu.models import Subscriber
+
+
+def test_ttl_cache():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    # Testing hits, misses and least recently used eviction.
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 2
+
+    # Testing if values fetched before an invalidation are discarded.
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.set("a", 4, generation)
+    assert cache.get("a") is None
+
+    # Testing expiry.
+    expired = TTLCache(ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_subscriber_cache():
+    # Mocking the Novu server, counting subscriber lookups.
+    lookups = []
+
+    def handler(request):
+        if request.method == "GET":
+            lookups.append(request.url.path)
+            if request.url.path.endswith("missing"):
+                return httpx.Response(404, json={"statusCode": 404, "message": "Not found."})
+        return httpx.Response(200, json={"data": {"subscriberId": "subscriber_id"}})
+
+    cache = TTLCache()
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), subscriber_cache=cache
+    )
+
+    # Testing if repeated lookups are served from the cache.
+    first = await client.get_subscriber("subscriber_id")
+    second = await client.get_subscriber("subscriber_id")
+    assert first == second == {"status_code": 200, "detail": {"subscriberId": "subscriber_id"}}
+    assert len(lookups) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Testing if failed lookups are not cached.
+    await client.get_subscriber("missing")
+    await client.get_subscriber("missing")
+    assert len(lookups) == 3
+
+    # Testing if writes through the client invalidate the cached profile.
+    await client.upsert_subscriber(Subscriber(id="subscriber_id", email="subscriber@gmail.com"))
+    await client.get_subscriber("subscriber_id")
+    assert len(lookups) == 4
+    await client.delete_subscriber("subscriber_id")
+    await client.get_subscriber("subscriber_id")
+    assert len(lookups) == 5
+    await client.aclose()
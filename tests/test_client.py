@@ -1,11 +1,34 @@
+import asyncio
+import gc
+import json
+import time
+import weakref
 from unittest.mock import patch
 
 import httpx
 import pytest
 from asyncnovu._utils import format
+from asyncnovu.cache import TTLCache
 from asyncnovu.client import NovuClient
 from asyncnovu.enums.provider import PushProviderIdEnum
-from asyncnovu.models import Subscriber, Trigger
+from asyncnovu.codec import CODECS
+from asyncnovu.models import Subscriber, Trigger, TriggerTemplate
+from asyncnovu.retry import RetryPolicy
+from asyncnovu.testing import FakeNovu
+
+
+def count_requests(request_mock, method):
+    # Counting the requests sent through httpx with the given method.
+    return sum(1 for call in request_mock.call_args_list if call.args[0] == method)
+
+
+def assert_requested(request_mock, method, url, body=None, headers=None):
+    # Checking the last request sent through httpx, decoding its pre-encoded body.
+    args, kwargs = request_mock.call_args
+    assert args == (method, url)
+    assert kwargs["headers"] == headers
+    content = kwargs["content"]
+    assert (json.loads(content) if content is not None else None) == body
 
 
 @pytest.mark.asyncio
@@ -24,22 +47,100 @@ async def test_format_util():
     }
 
 
+def test_model_wire_format():
+    # Testing if unset fields are omitted from the wire representation.
+    trigger = Trigger(id="trigger_id", subscribers=["subscriber_id"])
+    assert trigger.to_wire() == {"name": "trigger_id", "to": ["subscriber_id"]}
+    trigger.payload = {"data": "data"}
+    assert trigger.to_wire() == {"name": "trigger_id", "to": ["subscriber_id"], "payload": {"data": "data"}}
+
+    subscriber = Subscriber(id="subscriber_id", first_name="Test", phone="+10000000000")
+    assert subscriber.to_wire() == {"subscriberId": "subscriber_id", "firstName": "Test", "phone": "+10000000000"}
+
+    # Testing if the subscriber wire representation is cached until an attribute is reassigned.
+    assert subscriber.to_wire() is subscriber.to_wire()
+    subscriber.phone = None
+    assert subscriber.to_wire() == {"subscriberId": "subscriber_id", "firstName": "Test"}
+
+    # Checking if models are slotted.
+    assert not hasattr(trigger, "__dict__")
+    with pytest.raises(AttributeError):
+        subscriber.nickname = "Test"
+
+
+@pytest.mark.parametrize("codec", list(CODECS.values()))
+def test_trigger_template_encoding(codec):
+    try:
+        codec = codec()
+    except ImportError:
+        pytest.skip("Codec is not installed.")
+
+    # Testing if spliced bodies match the wire representation of the equivalent trigger.
+    templates = [
+        TriggerTemplate("trigger_id"),
+        TriggerTemplate("trigger_id", payload={}),
+        TriggerTemplate("trigger_id", payload={"campaign": "spring"}, overrides={"email": {"from": "a@b.c"}}),
+    ]
+    calls = [
+        (["subscriber_id"], None, None),
+        (["subscriber_id", "other_id"], {"code": 1234}, "transaction_id"),
+        (["subscriber_id"], {"campaign": "summer"}, None),
+    ]
+    for template in templates:
+        for subscribers, payload, transaction_id in calls:
+            body = template.encode(codec, subscribers, payload, transaction_id)
+            assert json.loads(body) == template.to_trigger(subscribers, payload, transaction_id).to_wire()
+
+    # Testing if the template is validated and re-encoded after being modified.
+    with pytest.raises(ValueError):
+        TriggerTemplate("trigger_id", payload=["campaign"])
+    template = templates[2]
+    template.overrides = None
+    assert "overrides" not in json.loads(template.encode(codec, ["subscriber_id"]))
+
+
+def test_trigger_template_custom_codec():
+    # Custom codec without a name, counting the encoded values.
+    class Codec:
+        def __init__(self):
+            self.encoded = 0
+
+        def encode(self, value):
+            self.encoded += 1
+            return json.dumps(value, separators=(",", ":")).encode()
+
+    # Testing that templates encode their constant parts once per codec instance.
+    template = TriggerTemplate("trigger_id", payload={"campaign": "spring"})
+    first, second = Codec(), Codec()
+    for codec in (first, second, first):
+        body = template.encode(codec, ["subscriber_id"])
+        assert json.loads(body) == template.to_trigger(["subscriber_id"]).to_wire()
+    assert first.encoded == 4 and second.encoded == 3
+
+    # Testing that templates do not keep codecs alive.
+    codec = weakref.ref(second)
+    del second
+    gc.collect()
+    assert codec() is None
+
+    # Testing that the representation shows the public attributes only.
+    assert repr(template) == (
+        "TriggerTemplate(id='trigger_id', subscribers=None, payload={'campaign': 'spring'}, overrides=None, "
+        "transaction_id=None)"
+    )
+
+
 @pytest.mark.asyncio
-@patch("httpx.AsyncClient.delete")
-@patch("httpx.AsyncClient.post")
-async def test_event_actions(httpx_post_mock, httpx_delete_mock):
+@patch("httpx.AsyncClient.request")
+async def test_event_actions(httpx_request_mock):
     # Creating Novu Client.
     client = NovuClient("api_key", "api_url")
 
     # Mocking httpx calls to Novu.
-    httpx_post_mock.return_value = httpx.Response(
+    httpx_request_mock.return_value = httpx.Response(
         200, json={"data": "Test passed."}, request=httpx.Request("POST", "test")
     )
 
-    httpx_delete_mock.return_value = httpx.Response(
-        200, json={"data": "Test passed."}, request=httpx.Request("DELETE", "test")
-    )
-
     # Testing trigger function to send an event.
     response = await client.trigger_event(
         Trigger(
@@ -52,10 +153,12 @@ async def test_event_actions(httpx_post_mock, httpx_delete_mock):
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_post_mock.call_count == 1
-    httpx_post_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "POST") == 1
+    assert_requested(
+        httpx_request_mock,
+        "POST",
         "api_url/events/trigger",
-        json={
+        body={
             "name": "trigger_id",
             "to": ["subscriber_id"],
             "payload": {"data": "data"},
@@ -84,10 +187,12 @@ async def test_event_actions(httpx_post_mock, httpx_delete_mock):
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_post_mock.call_count == 2
-    httpx_post_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "POST") == 2
+    assert_requested(
+        httpx_request_mock,
+        "POST",
         "api_url/events/trigger/bulk",
-        json={
+        body={
             "events": [
                 {
                     "name": "trigger_1",
@@ -117,10 +222,12 @@ async def test_event_actions(httpx_post_mock, httpx_delete_mock):
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_post_mock.call_count == 3
-    httpx_post_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "POST") == 3
+    assert_requested(
+        httpx_request_mock,
+        "POST",
         "api_url/events/trigger/broadcast",
-        json={
+        body={
             "name": "trigger_id",
             "payload": {"data": "data"},
             "overrides": {"overrides": "overrides"},
@@ -133,46 +240,35 @@ async def test_event_actions(httpx_post_mock, httpx_delete_mock):
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_delete_mock.call_count == 1
-    httpx_delete_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "DELETE") == 1
+    assert_requested(
+        httpx_request_mock,
+        "DELETE",
         "api_url/events/trigger/transaction_id",
         headers=client.headers,
     )
 
 
 @pytest.mark.asyncio
-@patch("httpx.AsyncClient.delete")
-@patch("httpx.AsyncClient.put")
-@patch("httpx.AsyncClient.post")
-@patch("httpx.AsyncClient.get")
-async def test_subscriber_actions(httpx_get_mock, httpx_post_mock, httpx_put_mock, httpx_delete_mock):
+@patch("httpx.AsyncClient.request")
+async def test_subscriber_actions(httpx_request_mock):
     # Creating Novu Client.
     client = NovuClient("api_key", "api_url")
 
     # Mocking httpx calls to Novu.
-    httpx_get_mock.return_value = httpx.Response(
+    httpx_request_mock.return_value = httpx.Response(
         200, json={"data": "Test passed."}, request=httpx.Request("GET", "test")
     )
 
-    httpx_post_mock.return_value = httpx.Response(
-        200, json={"data": "Test passed."}, request=httpx.Request("POST", "test")
-    )
-
-    httpx_put_mock.return_value = httpx.Response(
-        200, json={"data": "Test passed."}, request=httpx.Request("PUT", "test")
-    )
-
-    httpx_delete_mock.return_value = httpx.Response(
-        200, json={"data": "Test passed."}, request=httpx.Request("DELETE", "test")
-    )
-
     # Testing function to get a subscriber profile.
     response = await client.get_subscriber("subscriber_id")
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_get_mock.call_count == 1
-    httpx_get_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "GET") == 1
+    assert_requested(
+        httpx_request_mock,
+        "GET",
         "api_url/subscribers/subscriber_id",
         headers=client.headers,
     )
@@ -189,16 +285,16 @@ async def test_subscriber_actions(httpx_get_mock, httpx_post_mock, httpx_put_moc
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_post_mock.call_count == 1
-    httpx_post_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "POST") == 1
+    assert_requested(
+        httpx_request_mock,
+        "POST",
         "api_url/subscribers",
-        json={
+        body={
             "subscriberId": "subscriber_id",
             "email": "subscriber@gmail.com",
             "firstName": "Test",
             "lastName": "Subscriber",
-            "phone": None,
-            "avatar": None,
         },
         headers=client.headers,
     )
@@ -210,10 +306,12 @@ async def test_subscriber_actions(httpx_get_mock, httpx_post_mock, httpx_put_moc
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_put_mock.call_count == 1
-    httpx_put_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "PUT") == 1
+    assert_requested(
+        httpx_request_mock,
+        "PUT",
         "api_url/subscribers/subscriber_id/credentials",
-        json={
+        body={
             "providerId": "fcm",
             "credentials": {
                 "deviceTokens": ["token_1"],
@@ -227,8 +325,371 @@ async def test_subscriber_actions(httpx_get_mock, httpx_post_mock, httpx_put_moc
     assert response == {"status_code": 200, "detail": "Test passed."}
 
     # Checking if correct inputs went into httpx call.
-    assert httpx_delete_mock.call_count == 1
-    httpx_delete_mock.assert_called_with(
+    assert count_requests(httpx_request_mock, "DELETE") == 1
+    assert_requested(
+        httpx_request_mock,
+        "DELETE",
         "api_url/subscribers/subscriber_id",
         headers=client.headers,
     )
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_lifecycle():
+    # Mocking the Novu server with a transport that records requests.
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": "Test passed."})
+
+    # Creating Novu Client as an async context manager.
+    async with NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler)) as client:
+        await client.get_subscriber("subscriber_1")
+        pooled = client.http
+        await client.get_subscriber("subscriber_2")
+
+        # Checking if the same pooled httpx client was reused across calls.
+        assert client.http is pooled
+        assert [str(request.url) for request in requests] == [
+            "https://novu.test/v1/subscribers/subscriber_1",
+            "https://novu.test/v1/subscribers/subscriber_2",
+        ]
+        assert requests[0].headers["Authorization"] == "ApiKey api_key"
+
+    # Checking if exiting the context closed the pooled connections.
+    assert pooled.is_closed
+
+    # Checking if the client can be reused after being closed.
+    response = await client.get_subscriber("subscriber_3")
+    assert response == {"status_code": 200, "detail": "Test passed."}
+    assert client.http is not pooled
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_trigger_many():
+    # Mocking the Novu server, failing the second bulk request and any request above the size cap.
+    requests = []
+
+    def handler(request):
+        events = json.loads(request.content)["events"]
+        requests.append(events)
+        if len(events) > 2:
+            return httpx.Response(400, json={"statusCode": 400, "message": "Too many events."})
+        if events[0]["name"] == "trigger_2":
+            return httpx.Response(500, json={"statusCode": 500, "message": "Server error."})
+        return httpx.Response(201, json={"data": [{"transactionId": event["name"]} for event in events]})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler))
+    triggers = [Trigger(id=f"trigger_{index}", subscribers=["subscriber_id"]) for index in range(5)]
+
+    # Testing bulk trigger function with automatic chunking.
+    results = await client.bulk_trigger_many(triggers, chunk_size=2, concurrency=2)
+    await client.aclose()
+
+    # Checking if every chunk respected the size limit.
+    assert sorted(len(events) for events in requests) == [1, 2, 2]
+
+    # Checking if results map back to the input order, including the failed chunk.
+    assert results == [
+        {"status_code": 201, "detail": {"transactionId": "trigger_0"}},
+        {"status_code": 201, "detail": {"transactionId": "trigger_1"}},
+        {"status_code": 500, "detail": {"message": "Server error."}},
+        {"status_code": 500, "detail": {"message": "Server error."}},
+        {"status_code": 201, "detail": {"transactionId": "trigger_4"}},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", list(CODECS))
+async def test_bulk_trigger_many_html_error(codec):
+    # Mocking a proxy answering the second bulk request with an HTML error page.
+    page = "<html><body><h1>502 Bad Gateway</h1></body></html>"
+
+    def handler(request):
+        events = json.loads(request.content)["events"]
+        if events[0]["name"] == "trigger_2":
+            return httpx.Response(502, text=page, headers={"Content-Type": "text/html"})
+        return httpx.Response(201, json={"data": [{"transactionId": event["name"]} for event in events]})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), codec=codec)
+    triggers = [Trigger(id=f"trigger_{index}", subscribers=["subscriber_id"]) for index in range(4)]
+
+    # Testing that the failed chunk reports the raw page instead of raising a decoding error.
+    results = await client.bulk_trigger_many(triggers, chunk_size=2)
+    await client.aclose()
+    assert [result["status_code"] for result in results] == [201, 201, 502, 502]
+    assert results[2]["detail"] == results[3]["detail"] == page
+
+
+@pytest.mark.asyncio
+async def test_stream_bulk_trigger():
+    # Mocking the Novu server, tracking how many bulk requests are in flight at once.
+    in_flight, peak = 0, 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        events = json.loads(request.content)["events"]
+        return httpx.Response(201, json={"data": [{"transactionId": event["name"]} for event in events]})
+
+    # Producing triggers lazily from an async generator.
+    async def source():
+        for index in range(7):
+            yield Trigger(id=f"trigger_{index}", subscribers=["subscriber_id"])
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler))
+
+    # Testing streaming bulk trigger function.
+    batches = [batch async for batch in client.stream_bulk_trigger(source(), batch_size=2, max_in_flight=2)]
+    await client.aclose()
+
+    # Checking if concurrency stayed bounded and every batch came back with its offset.
+    assert peak == 2
+    assert sorted(batch["offset"] for batch in batches) == [0, 2, 4, 6]
+    results = {batch["offset"]: batch["results"] for batch in batches}
+    assert results[6] == [{"status_code": 201, "detail": {"transactionId": "trigger_6"}}]
+    assert results[2][1] == {"status_code": 201, "detail": {"transactionId": "trigger_3"}}
+
+
+@pytest.mark.asyncio
+async def test_fanout_event():
+    # Mocking the Novu server, failing the bulk request which contains subscriber 'subscriber_4'.
+    requests = []
+
+    async def handler(request):
+        events = json.loads(request.content)["events"]
+        requests.append(events)
+        await asyncio.sleep(0.01 if events[0]["to"] == ["subscriber_1"] else 0)
+        if ["subscriber_4"] in [event["to"] for event in events]:
+            return httpx.Response(503, json={"statusCode": 503, "message": "Unavailable."})
+        return httpx.Response(201, json={"data": [{"transactionId": event["transactionId"]} for event in events]})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler))
+    trigger = Trigger(id="trigger_id", payload={"campaign": 1}, transaction_id="campaign")
+    subscribers = [f"subscriber_{index}" for index in range(7)]
+
+    # Testing fan-out from a checkpoint, with the first batch completing last.
+    checkpoints = []
+    async for progress in client.fanout_event(trigger, subscribers, batch_size=2, concurrency=3, checkpoint=1):
+        checkpoints.append(progress.checkpoint)
+    await client.aclose()
+
+    # Checking the per-subscriber triggers and the progress report.
+    assert requests[0] == [
+        {"name": "trigger_id", "to": ["subscriber_1"], "payload": {"campaign": 1}, "transactionId": "campaign-1"},
+        {"name": "trigger_id", "to": ["subscriber_2"], "payload": {"campaign": 1}, "transactionId": "campaign-2"},
+    ]
+    assert checkpoints[0] == 1 and checkpoints[-1] == 7
+    assert (progress.sent, progress.failed, progress.batches) == (4, 2, 3)
+    assert progress.failures == {
+        "subscriber_3": {"message": "Unavailable."},
+        "subscriber_4": {"message": "Unavailable."},
+    }
+
+
+@pytest.mark.asyncio
+async def test_fanout_event_rate():
+    fake = FakeNovu()
+    client = NovuClient("api_key", "https://novu.test/v1", transport=fake.transport())
+
+    # Testing that the fan-out is paced to the requested rate.
+    start = time.monotonic()
+    async for progress in client.fanout_event(Trigger(id="trigger_id"), map(str, range(30)), batch_size=10, rate=200):
+        pass
+    await client.aclose()
+    assert time.monotonic() - start >= 0.09
+    assert progress.sent == 30 and fake.calls["POST /events/trigger/bulk"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cancel_events():
+    fake = FakeNovu(latency=0.001)
+    client = NovuClient("api_key", "https://novu.test/v1", transport=fake.transport())
+    triggers = [Trigger(id="trigger_id", subscribers=["subscriber_id"], transaction_id=f"tx_{i}") for i in range(5)]
+    await client.bulk_trigger(triggers)
+
+    # Testing streamed cancellations, as they complete.
+    results = [result async for result in client.stream_cancel_events(["tx_0", "tx_1"], concurrency=2)]
+    assert sorted(results, key=lambda result: result["transaction_id"]) == [
+        {"transaction_id": "tx_0", "status_code": 200, "detail": True},
+        {"transaction_id": "tx_1", "status_code": 200, "detail": True},
+    ]
+
+    # Testing the cancellation report, with already cancelled and invalid transaction IDs.
+    async def source():
+        for transaction_id in ("tx_1", "tx_2", "tx_3", "tx/4", "tx_4"):
+            yield transaction_id
+
+    report = await client.cancel_events(source(), concurrency=3)
+    await client.aclose()
+    assert sorted(report["cancelled"]) == ["tx_2", "tx_3", "tx_4"]
+    assert report["not_found"] == ["tx_1"]
+    assert report["failed"] == {"tx/4": {"message": "Not Found"}}
+    assert fake.calls["DELETE /events/trigger"] == 7
+
+
+@pytest.mark.asyncio
+async def test_trigger_template():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"data": {"acknowledged": True}})
+
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(),
+    )
+    template = TriggerTemplate("trigger_id", payload={"campaign": "spring"})
+
+    # Testing templated triggers, given a transaction ID when retries are enabled.
+    response = await client.trigger_template(template, ["subscriber_id"], {"code": 1234})
+    await client.aclose()
+    assert response == {"status_code": 201, "detail": {"acknowledged": True}}
+    assert bodies[0].pop("transactionId")
+    assert bodies[0] == {"name": "trigger_id", "to": ["subscriber_id"], "payload": {"campaign": "spring", "code": 1234}}
+
+
+@pytest.mark.asyncio
+async def test_trigger_batching():
+    # Mocking the Novu server, recording the size of each bulk request.
+    batches = []
+
+    def handler(request):
+        events = json.loads(request.content)["events"]
+        batches.append(len(events))
+        data = [{"transactionId": event["name"]} for event in events]
+        return httpx.Response(201, json={"data": data}, headers={"X-Request-Id": f"request_{len(batches)}"})
+
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=httpx.MockTransport(handler),
+        batch_triggers=True,
+        batch_window=0.01,
+        batch_max_size=3,
+    )
+
+    # Testing concurrent trigger calls being coalesced into bulk requests.
+    responses = await asyncio.gather(
+        *(client.trigger_event(Trigger(id=f"trigger_{index}", subscribers=["subscriber_id"])) for index in range(5))
+    )
+    assert batches == [3, 2]
+    assert responses[4] == {"status_code": 201, "detail": {"transactionId": "trigger_4"}}
+    assert responses[4].ok and responses[4].request_id == "request_2"
+
+    # Testing that fire-and-forget triggers get an empty detail.
+    response = await client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]), read_body=False)
+    assert response.ok and response.detail == {} and batches == [3, 2, 1]
+
+    # Checking if closing the client flushes triggers still waiting in the buffer.
+    pending = asyncio.ensure_future(client.trigger_event(Trigger(id="trigger_5", subscribers=["subscriber_id"])))
+    await asyncio.sleep(0)
+    await client.aclose()
+    assert batches == [3, 2, 1, 1]
+    assert (await pending)["detail"] == {"transactionId": "trigger_5"}
+
+
+@pytest.mark.asyncio
+async def test_read_coalescing():
+    # Mocking a slow Novu server, counting requests.
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": {"subscriberId": request.url.path.rsplit("/", 1)[-1]}})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler))
+
+    # Testing if concurrent identical reads share one request.
+    responses = await asyncio.gather(*(client.get_subscriber("subscriber_1") for _ in range(5)))
+    assert len(requests) == 1
+    assert all(response == {"status_code": 200, "detail": {"subscriberId": "subscriber_1"}} for response in responses)
+
+    # Testing if different reads, and reads after completion, are sent separately.
+    await asyncio.gather(client.get_subscriber("subscriber_1"), client.get_subscriber("subscriber_2"))
+    assert len(requests) == 3
+    assert client._inflight == {}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_read_coalescing_after_write():
+    # Mocking a slow Novu server keeping the last saved profile.
+    profile = {"subscriberId": "subscriber_id", "email": "old@example.com"}
+
+    async def handler(request):
+        if request.method == "GET":
+            data = dict(profile)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"data": data})
+        profile.update(json.loads(request.content))
+        return httpx.Response(201, json={"data": profile})
+
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), subscriber_cache=TTLCache()
+    )
+
+    # Testing that a read started after a write does not join the read of the previous profile.
+    stale = asyncio.ensure_future(client.get_subscriber("subscriber_id"))
+    await asyncio.sleep(0.01)
+    await client.upsert_subscriber(Subscriber(id="subscriber_id", email="new@example.com"))
+    assert (await client.get_subscriber("subscriber_id"))["detail"]["email"] == "new@example.com"
+    assert (await stale)["detail"]["email"] == "old@example.com"
+
+    # Testing that the previous profile was not cached.
+    assert (await client.get_subscriber("subscriber_id"))["detail"]["email"] == "new@example.com"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_subscribers():
+    # Mocking a Novu server with the bulk subscriber endpoint.
+    def handler(request):
+        subscribers = json.loads(request.content)["subscribers"]
+        ids = [subscriber["subscriberId"] for subscriber in subscribers]
+        return httpx.Response(201, json={"data": {
+            "created": [{"subscriberId": subscriber_id} for subscriber_id in ids if subscriber_id != "subscriber_2"],
+            "updated": [],
+            "failed": [{"subscriberId": "subscriber_2", "message": "Invalid email."}] if "subscriber_2" in ids else [],
+        }})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler))
+
+    # Testing bulk upsert through the bulk endpoint with a streamed source.
+    report = await client.bulk_upsert_subscribers(
+        (Subscriber(id=f"subscriber_{index}") for index in range(5)), batch_size=2
+    )
+    assert sorted(report["succeeded"]) == ["subscriber_0", "subscriber_1", "subscriber_3", "subscriber_4"]
+    assert report["failed"] == {"subscriber_2": "Invalid email."}
+    await client.aclose()
+
+    # Mocking a Novu server without the bulk subscriber endpoint.
+    paths = []
+
+    def legacy_handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("/bulk"):
+            return httpx.Response(404, json={"statusCode": 404, "message": "Not found."})
+        if json.loads(request.content)["subscriberId"] == "subscriber_1":
+            return httpx.Response(400, json={"statusCode": 400, "message": "Invalid phone."})
+        return httpx.Response(200, json={"data": {}})
+
+    client = NovuClient("api_key", "https://novu.test/v1", transport=httpx.MockTransport(legacy_handler))
+
+    # Testing if bulk upsert falls back to individual upserts.
+    report = await client.bulk_upsert_subscribers(
+        [Subscriber(id=f"subscriber_{index}") for index in range(3)], batch_size=10
+    )
+    assert sorted(report["succeeded"]) == ["subscriber_0", "subscriber_2"]
+    assert report["failed"] == {"subscriber_1": {"message": "Invalid phone."}}
+    assert paths.count("/v1/subscribers") == 3
+    await client.aclose()
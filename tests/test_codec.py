@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from asyncnovu.codec import CODECS, MsgspecCodec, OrjsonCodec, StdlibCodec, get_codec
+
+# Payloads covering the JSON features used by Novu requests and responses.
+PAYLOADS = [
+    {},
+    [],
+    {"name": "trigger_id", "to": ["subscriber_1", "subscriber_2"], "payload": {"count": 3, "ratio": 0.25}},
+    {"unicode": "héllo wörld ✓ 你好", "escapes": "quote \" backslash \\ newline \n tab \t", "emoji": "🔔"},
+    {"nested": {"list": [1, -2, 3.5, True, False, None, {"deep": [[], {}]}]}, "empty": ""},
+    {"large": 2**62, "negative": -(2**62), "float": 1e-10, "zero": 0},
+    {"data": [{"acknowledged": True, "status": "processed", "transactionId": "f1e2d3"}] * 50},
+]
+
+
+def available_codecs():
+    # Instantiating every codec whose optional package is installed.
+    codecs = []
+    for codec in CODECS.values():
+        try:
+            codecs.append(codec())
+        except ImportError:
+            continue
+    return codecs
+
+
+@pytest.fixture(params=available_codecs(), ids=lambda codec: codec.name)
+def codec(request):
+    return request.param
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_codec_parity(codec, payload):
+    # Testing if encoded bodies decode to the same value with the standard library.
+    encoded = codec.encode(payload)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+
+    # Testing if bodies encoded by the standard library decode to the same value.
+    assert codec.decode(json.dumps(payload).encode()) == payload
+    assert codec.decode(StdlibCodec().encode(payload)) == payload
+
+
+def test_codec_non_string_keys(codec):
+    # Testing if non-string keys are converted to strings like the standard library does.
+    assert codec.decode(codec.encode({1: "one"})) == {"1": "one"}
+
+
+def test_codec_invalid_input(codec):
+    # Testing if invalid JSON raises a ValueError subclass for every codec.
+    with pytest.raises(ValueError):
+        codec.decode(b"{not json")
+
+
+def test_get_codec():
+    # Testing codec resolution by name, by instance and automatically.
+    assert isinstance(get_codec("json"), StdlibCodec)
+    instance = StdlibCodec()
+    assert get_codec(instance) is instance
+    assert get_codec("auto").name in CODECS
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_optional_codecs():
+    # Testing if fast codecs are only usable when their package is installed.
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codec()
+        except ImportError as error:
+            assert codec.name in str(error)
@@ -0,0 +1,145 @@
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.enums.provider import PushProviderIdEnum
+from asyncnovu.fingerprint import MemoryFingerprintStore, SQLiteFingerprintStore, fingerprint
+from asyncnovu.models import Subscriber
+from asyncnovu.testing import FakeNovu
+
+
+def test_fingerprint():
+    # Testing that fingerprints ignore the order of keys but not the values.
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+    assert fingerprint(None) != fingerprint({})
+
+
+@pytest.mark.asyncio
+async def test_memory_fingerprint_store():
+    store = MemoryFingerprintStore(maxsize=2)
+    await store.set_many({"a": "1", "b": "2"})
+
+    # Testing least recently used eviction.
+    assert await store.get_many(["a", "c"]) == {"a": "1"}
+    await store.set_many({"c": "3"})
+    assert await store.get_many(["a", "b", "c"]) == {"a": "1", "c": "3"}
+    await store.delete_many(["a"])
+    assert len(store) == 1
+    await store.set_many({"c:1": "4"})
+    await store.delete_prefix("c:")
+    assert await store.get_many(["c", "c:1"]) == {"c": "3"}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fingerprint_store(tmp_path):
+    path = str(tmp_path / "fingerprints.db")
+    store = SQLiteFingerprintStore(path)
+    await store.set_many({f"key_{index}": str(index) for index in range(600)})
+    await store.delete_many(["key_1"])
+    await store.delete_prefix("key_59")
+    store.close()
+
+    # Testing that fingerprints persist, including lookups of more keys than SQLite allows parameters per query.
+    store = SQLiteFingerprintStore(path)
+    found = await store.get_many([f"key_{index}" for index in range(1200)])
+    assert len(found) == 588 and found["key_589"] == "589" and "key_595" not in found
+    await store.clear()
+    assert await store.get_many(["key_0"]) == {}
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_subscriber_credentials():
+    fake = FakeNovu()
+    client = NovuClient("api_key", "https://novu.test/v1", transport=fake.transport())
+    with pytest.raises(RuntimeError):
+        await client.sync_subscriber_credentials([])
+
+    client.fingerprint_store = MemoryFingerprintStore()
+    for index in range(3):
+        await client.upsert_subscriber(Subscriber(id=f"subscriber_{index}"))
+
+    def tokens(changed=None):
+        for index in range(4):
+            for provider in (PushProviderIdEnum.FCM, PushProviderIdEnum.APNS):
+                token = f"{provider.value}_{index}_{'new' if index == changed else 'old'}"
+                yield f"subscriber_{index}", provider, {"deviceTokens": [token]}
+
+    # Testing that the first sync sends everything, and unknown subscribers fail.
+    report = await client.sync_subscriber_credentials(tokens(), batch_size=3, concurrency=2)
+    assert len(report["updated"]) == 6 and report["skipped"] == 0
+    fcm, apns = PushProviderIdEnum.FCM, PushProviderIdEnum.APNS
+    assert set(report["failed"]) == {("subscriber_3", fcm), ("subscriber_3", apns)}
+
+    # Testing that only changed and previously failed credentials are sent again.
+    report = await client.sync_subscriber_credentials(tokens(changed=1))
+    assert set(report["updated"]) == {("subscriber_1", fcm), ("subscriber_1", apns)}
+    assert report["skipped"] == 4 and len(report["failed"]) == 2
+    assert fake.credentials[("subscriber_1", "fcm")] == {"deviceTokens": ["fcm_1_new"]}
+    assert fake.calls["PUT /subscribers"] == 12
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sync_subscriber_credentials_tracking():
+    fake = FakeNovu()
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=fake.transport(), fingerprint_store=MemoryFingerprintStore()
+    )
+    fcm = PushProviderIdEnum.FCM
+    await client.upsert_subscriber(Subscriber(id="subscriber_id"))
+
+    # Testing that credentials updated directly are sent again by the next sync with other credentials.
+    await client.sync_subscriber_credentials([("subscriber_id", fcm, {"deviceTokens": ["t1"]})])
+    await client.update_subscriber_credentials("subscriber_id", fcm, {"deviceTokens": ["t2"]})
+    report = await client.sync_subscriber_credentials([("subscriber_id", fcm, {"deviceTokens": ["t1"]})])
+    assert report["updated"] == [("subscriber_id", fcm)]
+    assert fake.credentials[("subscriber_id", "fcm")] == {"deviceTokens": ["t1"]}
+
+    # Testing that the credentials of a deleted and recreated subscriber are sent again.
+    await client.delete_subscriber("subscriber_id")
+    await client.upsert_subscriber(Subscriber(id="subscriber_id"))
+    fake.credentials.clear()
+    report = await client.sync_subscriber_credentials([("subscriber_id", fcm, {"deviceTokens": ["t1"]})])
+    assert report["updated"] == [("subscriber_id", fcm)] and report["skipped"] == 0
+    assert fake.credentials[("subscriber_id", "fcm")] == {"deviceTokens": ["t1"]}
+
+    # Testing that credentials updated directly are not sent again by a sync of the same credentials.
+    await client.update_subscriber_credentials("subscriber_id", fcm, {"deviceTokens": ["t3"]})
+    report = await client.sync_subscriber_credentials([("subscriber_id", fcm, {"deviceTokens": ["t3"]})])
+    assert report["skipped"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_skip_unchanged_upserts():
+    with pytest.raises(ValueError):
+        NovuClient("api_key", skip_unchanged_upserts=True)
+
+    fake = FakeNovu()
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=fake.transport(),
+        fingerprint_store=MemoryFingerprintStore(),
+        skip_unchanged_upserts=True,
+    )
+
+    # Testing that an unchanged profile is only sent once, and changes or deletions are sent again.
+    assert (await client.upsert_subscriber(Subscriber(id="subscriber_0", first_name="Test"))).ok
+    response = await client.upsert_subscriber(Subscriber(id="subscriber_0", first_name="Test"))
+    assert response.ok and response.skipped and response.detail == {"skipped": True}
+    assert (await client.upsert_subscriber(Subscriber(id="subscriber_0", first_name="New"))).ok
+    await client.delete_subscriber("subscriber_0")
+    assert (await client.upsert_subscriber(Subscriber(id="subscriber_0", first_name="New"))).ok
+    assert client.upsert_stats == {"sent": 3, "skipped": 1}
+
+    # Testing that bulk upserts only send the changed profiles.
+    subscribers = [Subscriber(id=f"subscriber_{index}", first_name="New") for index in range(4)]
+    report = await client.bulk_upsert_subscribers(subscribers, batch_size=2)
+    assert sorted(report["succeeded"]) == ["subscriber_1", "subscriber_2", "subscriber_3"]
+    assert report["skipped"] == ["subscriber_0"]
+    report = await client.bulk_upsert_subscribers(subscribers, batch_size=2)
+    assert report["succeeded"] == [] and len(report["skipped"]) == 4
+    assert client.upsert_stats == {"sent": 6, "skipped": 6}
+    assert fake.calls["POST /subscribers/bulk"] == 2
+    await client.aclose()
@@ -0,0 +1,130 @@
+import asyncio
+
+import httpx
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.instrumentation import Histogram, Hooks, MetricsCollector, OpenTelemetryHooks
+from asyncnovu.models import Trigger
+from asyncnovu.retry import RetryPolicy
+from asyncnovu.testing import FakeNovu
+
+
+def test_histogram():
+    histogram = Histogram(bounds=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    # Testing bucket counts and quantile estimates.
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+
+
+@pytest.mark.asyncio
+async def test_metrics_collector():
+    # Mocking a Novu server which rate limits the first request.
+    fake = FakeNovu(latency=0.01)
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}, json={"statusCode": 429, "message": "Slow down."})]
+
+    async def handler(request):
+        return responses.pop() if responses else await fake.handle(request)
+
+    # Recording the order of hook callbacks with a custom hook.
+    events = []
+
+    class Recorder(Hooks):
+        def on_request(self, info):
+            events.append(("request", info.key, info.attempt))
+
+        def on_response(self, info, response):
+            events.append(("response", info.key, info.status_code))
+
+    metrics = MetricsCollector()
+    async with NovuClient(
+        "api_key",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(),
+        hooks=[metrics, Recorder()],
+        max_connections=4,
+    ) as client:
+        await client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+        await asyncio.gather(*(client.get_subscriber(f"subscriber_{index}") for index in range(4)))
+
+    # Testing hook callbacks, including the retried attempt.
+    assert events[:4] == [
+        ("request", "POST trigger", 1),
+        ("response", "POST trigger", 429),
+        ("request", "POST trigger", 2),
+        ("response", "POST trigger", 201),
+    ]
+
+    # Testing collected metrics.
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == 6
+    assert snapshot["retries"] == 1
+    assert snapshot["in_flight"] == 0
+    assert snapshot["peak_in_flight"] == 4
+    assert snapshot["peak_pool_utilisation"] == 1.0
+    assert snapshot["bytes_sent"] > 0 and snapshot["bytes_received"] > 0
+    assert snapshot["endpoints"]["POST trigger"]["statuses"] == {429: 1, 201: 1}
+    assert snapshot["endpoints"]["GET subscribers"]["count"] == 4
+    assert snapshot["endpoints"]["GET subscribers"]["p50"] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_metrics_collector_errors():
+    # Mocking an unreachable Novu server.
+    def handler(request):
+        raise httpx.ConnectError("Connection refused.")
+
+    metrics = MetricsCollector()
+    async with NovuClient("api_key", transport=httpx.MockTransport(handler), hooks=[metrics]) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get_subscriber("subscriber_id")
+
+    # Testing if failed attempts are counted as errors.
+    assert metrics.errors["GET subscribers"] == 1
+    assert metrics.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_hook():
+    # Recording the attempts on the wire with a hook failing on the first attempt.
+    seen = []
+
+    class Failing(Hooks):
+        def on_request(self, info):
+            seen.append(info.in_flight)
+            if len(seen) == 1:
+                raise RuntimeError("Hook failed.")
+
+    async with NovuClient("api_key", transport=FakeNovu().transport(), hooks=[Failing()]) as client:
+        with pytest.raises(RuntimeError):
+            await client.get_subscriber("subscriber_id")
+        await client.get_subscriber("subscriber_id")
+
+    # Testing that the failed attempt is no longer counted on the wire.
+    assert seen == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_hooks():
+    sdk = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    # Creating a tracer exporting spans in memory.
+    exporter = InMemorySpanExporter()
+    provider = sdk.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    fake = FakeNovu()
+    hooks = OpenTelemetryHooks(provider.get_tracer("test"))
+    async with NovuClient("api_key", transport=fake.transport(), hooks=[hooks]) as client:
+        await client.get_subscriber("subscriber_id")
+
+    # Testing the emitted span.
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "Novu GET subscribers"
+    assert span.attributes["http.response.status_code"] == 404
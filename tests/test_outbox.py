@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.models import Trigger
+from asyncnovu.outbox import SQLiteOutbox
+from asyncnovu.testing import FakeNovu
+
+
+@pytest.mark.asyncio
+async def test_outbox_delivery(tmp_path):
+    fake = FakeNovu()
+    outbox = SQLiteOutbox(str(tmp_path / "outbox.db"), batch_size=2, poll_interval=0.01)
+    async with NovuClient("api_key", transport=fake.transport(), outbox=outbox) as client:
+        # Testing if enqueued triggers are sent in bulk and removed once acknowledged.
+        transaction_ids = [
+            await client.enqueue_trigger(Trigger(id="trigger_id", subscribers=[f"subscriber_{index}"]))
+            for index in range(5)
+        ]
+        assert await client.enqueue_trigger(Trigger(id="trigger_id", transaction_id="known")) == "known"
+        await client.drain_outbox(timeout=5)
+
+    assert fake.transactions == set(transaction_ids) | {"known"}
+    assert fake.calls["POST /events/trigger/bulk"] >= 3
+    assert await outbox.counts() == {"pending": 0, "failed": 0}
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_outbox_replay(tmp_path):
+    path = str(tmp_path / "outbox.db")
+
+    # Enqueuing a trigger and stopping while it is being sent, as a crashed process would.
+    sending = asyncio.Event()
+
+    async def hanging(request):
+        sending.set()
+        await asyncio.sleep(60)
+
+    outbox = SQLiteOutbox(path)
+    client = NovuClient("api_key", transport=httpx.MockTransport(hanging), outbox=outbox)
+    transaction_id = await client.enqueue_trigger(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+    await sending.wait()
+    await client.aclose()
+    outbox.close()
+
+    # Testing if a new client on the same outbox replays the trigger with its original transaction ID.
+    fake = FakeNovu()
+    outbox = SQLiteOutbox(path, poll_interval=0.01)
+    assert (await outbox.counts())["pending"] == 1
+    async with NovuClient("api_key", transport=fake.transport(), outbox=outbox) as client:
+        await client.drain_outbox(timeout=5)
+    assert fake.transactions == {transaction_id}
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_outbox_failures(tmp_path):
+    # Mocking a Novu server rejecting every batch with a client error.
+    def rejecting(request):
+        return httpx.Response(400, json={"statusCode": 400, "message": "Invalid event."})
+
+    outbox = SQLiteOutbox(str(tmp_path / "outbox.db"), poll_interval=0.01)
+    async with NovuClient("api_key", transport=httpx.MockTransport(rejecting), outbox=outbox) as client:
+        await client.enqueue_trigger(Trigger(id="trigger_id", transaction_id="rejected"))
+        await client.drain_outbox(timeout=5)
+
+    # Testing if rejected triggers are kept as failed, and can be requeued.
+    assert await outbox.counts() == {"pending": 0, "failed": 1}
+    (failure,) = await outbox.failures()
+    assert failure[0] == "rejected"
+    assert "Invalid event." in failure[1]
+    assert await outbox.requeue_failed() == 1
+    assert await outbox.counts() == {"pending": 1, "failed": 0}
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_without_outbox():
+    # Testing if the outbox API requires an outbox.
+    client = NovuClient("api_key")
+    with pytest.raises(RuntimeError):
+        await client.enqueue_trigger(Trigger(id="trigger_id"))
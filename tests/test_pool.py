@@ -0,0 +1,197 @@
+import asyncio
+
+import httpx
+import pytest
+from asyncnovu.cache import TTLCache
+from asyncnovu.client import NovuClient
+from asyncnovu.fingerprint import MemoryFingerprintStore
+from asyncnovu.models import Subscriber, Trigger
+from asyncnovu.pool import NovuClientPool
+from asyncnovu.ratelimit import RateLimit, RateLimiter
+from asyncnovu.scheduler import FairScheduler, Priority
+from asyncnovu.testing import FakeNovu
+
+
+@pytest.mark.asyncio
+async def test_fair_scheduler():
+    scheduler = FairScheduler(1)
+    order = []
+
+    async def request(key, index):
+        await scheduler.acquire(key)
+        order.append(f"{key}{index}")
+        await asyncio.sleep(0)
+        scheduler.release()
+
+    # Testing that a key queueing many requests does not starve a later one.
+    tasks = [asyncio.ensure_future(request("a", index)) for index in range(4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.ensure_future(request("b", 0)))
+    await asyncio.gather(*tasks)
+    assert order.index("b0") < order.index("a3")
+
+    # Testing that cancelled waiters give their turn away.
+    await scheduler.acquire("a")
+    waiter = asyncio.ensure_future(scheduler.acquire("b"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    scheduler.release()
+    assert scheduler.active == 0 and scheduler.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_client_pool():
+    # Mocking the Novu server, recording the API key of every request.
+    keys = []
+
+    async def handler(request):
+        keys.append(request.headers["Authorization"])
+        await asyncio.sleep(0.001)
+        return httpx.Response(201, json={"data": {"acknowledged": True}})
+
+    pool = NovuClientPool(
+        "https://novu.test/v1",
+        transport=httpx.MockTransport(handler),
+        max_in_flight=2,
+        rate_limits={"trigger": RateLimit(1000, burst=3)},
+    )
+    tenants = [pool.client(f"key_{index}") for index in range(3)]
+    assert pool.client("key_0") is tenants[0] and len(pool) == 3
+
+    # Testing that tenants share the connections but keep their own headers and rate limit budget.
+    trigger = Trigger(id="trigger_id", subscribers=["subscriber_id"])
+    responses = await asyncio.gather(*(tenant.trigger_event(trigger) for tenant in tenants for _ in range(3)))
+    assert all(response["status_code"] == 201 for response in responses)
+    assert sorted(set(keys)) == ["ApiKey key_0", "ApiKey key_1", "ApiKey key_2"] and len(keys) == 9
+    assert all(tenant.http is pool.http for tenant in tenants)
+    assert tenants[0].rate_limiter.namespace != tenants[1].rate_limiter.namespace
+    assert tenants[0].rate_limiter.backend is tenants[1].rate_limiter.backend
+
+    # Testing that closing a tenant keeps the shared connections open, and closing the pool closes them.
+    http = pool.http
+    await pool.remove("key_2")
+    assert not http.is_closed and len(pool) == 2
+    await pool.aclose()
+    assert http.is_closed and len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_pool_tenant_state():
+    # Testing that stateful options cannot be shared by the tenants of a pool.
+    with pytest.raises(ValueError):
+        NovuClientPool(subscriber_cache=TTLCache())
+    with pytest.raises(ValueError):
+        NovuClientPool().client("key_0", namespace="tenant:")
+
+    fake = FakeNovu()
+    store = MemoryFingerprintStore()
+    pool = NovuClientPool(
+        "https://novu.test/v1",
+        transport=fake.transport(),
+        fingerprint_store=store,
+        skip_unchanged_upserts=True,
+    )
+    first = pool.client("key_0", subscriber_cache=TTLCache())
+    second = pool.client("key_1", subscriber_cache=TTLCache())
+    assert first.subscriber_cache is not second.subscriber_cache
+    assert first.codec is second.codec
+    assert first.fingerprint_store is store and second.fingerprint_store is store
+
+    # Testing that one tenant's fingerprints do not skip the same upsert of another tenant.
+    subscriber = Subscriber(id="subscriber_id", first_name="Test")
+    await first.upsert_subscriber(subscriber)
+    await second.upsert_subscriber(subscriber)
+    assert first.upsert_stats == second.upsert_stats == {"sent": 1, "skipped": 0}
+
+    # Testing that one tenant's cached profiles are not served to another tenant.
+    await first.get_subscriber("subscriber_id")
+    await second.get_subscriber("subscriber_id")
+    assert first.subscriber_cache.misses == second.subscriber_cache.misses == 1
+    assert fake.calls["GET /subscribers"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priorities():
+    scheduler = FairScheduler(2, reserved=1)
+
+    # Testing that the reserved slot is kept for high priority requests.
+    await scheduler.acquire("a", Priority.LOW)
+    low = asyncio.ensure_future(scheduler.acquire("a", Priority.LOW))
+    await asyncio.sleep(0)
+    assert not low.done()
+    await scheduler.acquire("a", Priority.HIGH)
+    assert scheduler.active == 2
+
+    # Testing that the most urgent waiters are served first, and only high priority ones use the freed reserved slot.
+    normal = asyncio.ensure_future(scheduler.acquire("b", Priority.NORMAL))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.sleep(0)
+    assert not normal.done()
+    scheduler.release()
+    await normal
+    assert not low.done()
+    scheduler.release()
+    await low
+    assert scheduler.active == 1 and scheduler.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_lanes():
+    fake = FakeNovu(latency=0.02)
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=fake.transport(),
+        priority_scheduler=FairScheduler(2, reserved=1),
+        rate_limiter=RateLimiter(trigger=RateLimit(1000), bulk=RateLimit(1000)),
+    )
+    finished = []
+
+    async def bulk(index):
+        await client.bulk_trigger([Trigger(id="campaign", subscribers=[f"subscriber_{index}"])])
+        finished.append(f"bulk_{index}")
+
+    async def urgent():
+        with client.priority(Priority.HIGH):
+            await client.trigger_event(Trigger(id="one-time-code", subscribers=["subscriber_id"]))
+        finished.append("urgent")
+
+    # Testing that an urgent trigger does not queue behind a bulk campaign sent with low priority.
+    tasks = [asyncio.ensure_future(bulk(index)) for index in range(4)]
+    await asyncio.sleep(0)
+    await asyncio.gather(urgent(), *tasks)
+    await client.aclose()
+    assert finished.index("urgent") <= 1
+    assert finished[-1].startswith("bulk")
+
+
+@pytest.mark.asyncio
+async def test_priority_within_rate_limits():
+    fake = FakeNovu()
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=fake.transport(),
+        priority_scheduler=FairScheduler(8, reserved=2),
+        rate_limiter=RateLimiter(trigger=RateLimit(10, burst=1)),
+    )
+
+    # Starting a rate limited bulk cancellation, whose requests queue up for the trigger bucket.
+    job = asyncio.ensure_future(client.cancel_events([f"tx_{index}" for index in range(50)], concurrency=10))
+    await asyncio.sleep(0.15)
+
+    # Testing that an urgent trigger waits for one token at most, instead of every queued one.
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with client.priority(Priority.HIGH):
+        response = await client.trigger_event(Trigger(id="one-time-code", subscribers=["subscriber_id"]))
+    assert response["status_code"] == 201
+    assert loop.time() - start < 0.2
+    assert fake.calls["DELETE /events/trigger"] < 5
+
+    job.cancel()
+    await asyncio.gather(job, return_exceptions=True)
+    await client.aclose()
@@ -0,0 +1,70 @@
+import httpx
+import pytest
+from asyncnovu._constants import Endpoints
+from asyncnovu.client import NovuClient
+from asyncnovu.ratelimit import MemoryBackend, RateLimit, RateLimiter, SQLiteBackend
+
+
+@pytest.mark.asyncio
+async def test_memory_backend():
+    backend = MemoryBackend()
+
+    # Testing if the burst is served immediately and further requests are spaced out.
+    delays = [await backend.reserve("key", 10, 2) for _ in range(4)]
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+    # Testing if pausing a bucket pushes back the next request.
+    await backend.pause("other", 10, 2, 5.0)
+    assert await backend.reserve("other", 10, 2) == pytest.approx(5.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_shared(tmp_path):
+    # Creating two backends on the same file, as two processes would.
+    path = str(tmp_path / "limits.db")
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+
+    # Testing if both backends draw from the same budget.
+    assert await first.reserve("key", 10, 1) == 0.0
+    assert await second.reserve("key", 10, 1) == pytest.approx(0.1, abs=0.02)
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_adaptive():
+    limiter = RateLimiter(trigger=RateLimit(100, 10), subscribers=None)
+
+    # Testing if the advertised policy lowers the configured rate.
+    await limiter.observe(Endpoints.TRIGGER, httpx.Response(201, headers={"RateLimit-Policy": "20;w=2"}))
+    assert limiter.limits[Endpoints.TRIGGER].rate == 10
+    assert limiter.limits[Endpoints.TRIGGER].burst == 10
+
+    # Testing if an exhausted budget pauses the bucket until the reset.
+    await limiter.observe(
+        Endpoints.TRIGGER, httpx.Response(201, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "3"})
+    )
+    assert await limiter.backend.reserve(Endpoints.TRIGGER, 10, 10) == pytest.approx(3.1, abs=0.01)
+
+    # Testing if endpoints without a limit are never delayed.
+    await limiter.acquire(Endpoints.SUBSCRIBERS)
+
+
+@pytest.mark.asyncio
+async def test_client_rate_limiting():
+    # Mocking the Novu server.
+    def handler(request):
+        return httpx.Response(200, json={"data": "Test passed."})
+
+    # Creating a limiter with a budget too small for two immediate requests.
+    limiter = RateLimiter(subscribers=RateLimit(1, 1))
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), rate_limiter=limiter
+    )
+
+    # Testing if requests draw tokens from the subscribers bucket.
+    await client.get_subscriber("subscriber_id")
+    assert await limiter.backend.reserve(Endpoints.SUBSCRIBERS, 1, 1) > 0
+    await client.aclose()
@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.exceptions import CircuitOpenError
+from asyncnovu.models import Trigger
+from asyncnovu.resilience import CircuitBreaker, HedgePolicy
+from asyncnovu.scheduler import FairScheduler, Priority
+from asyncnovu.testing import FakeNovu
+
+
+def test_circuit_states():
+    breaker = CircuitBreaker(failure_threshold=0.5, window=4, min_calls=4, reset_timeout=0.0)
+    circuit = breaker.circuit("POST trigger")
+    assert breaker.circuit("POST trigger") is circuit
+
+    # Testing that the circuit opens once half of the window failed.
+    for failure in (False, True, False):
+        circuit.before_call()
+        circuit.record(failure)
+    assert circuit.state == "closed"
+    circuit.before_call()
+    circuit.record(True)
+    assert circuit.state == "open"
+
+    # Testing that a half-open circuit allows one trial at a time, and closes on success.
+    circuit.before_call()
+    assert circuit.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        circuit.before_call()
+    circuit.record(False)
+    assert circuit.state == "closed" and circuit.failure_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast():
+    fake = FakeNovu(error_rate=1.0)
+    breaker = CircuitBreaker(window=4, min_calls=4, reset_timeout=0.05)
+    client = NovuClient("api_key", "https://novu.test/v1", transport=fake.transport(), circuit_breaker=breaker)
+    trigger = Trigger(id="trigger_id", subscribers=["subscriber_id"])
+
+    # Testing that the circuit opens after repeated server errors.
+    for _ in range(4):
+        assert (await client.trigger_event(trigger))["status_code"] == 500
+    with pytest.raises(CircuitOpenError) as error:
+        await client.trigger_event(trigger)
+    assert error.value.endpoint == "POST trigger"
+    assert fake.calls["500"] == 4
+
+    # Testing that other endpoints are not affected.
+    assert (await client.get_subscriber("subscriber_id"))["status_code"] == 500
+
+    # Testing that a successful trial closes the circuit once the reset timeout elapsed.
+    await asyncio.sleep(0.06)
+    fake.error_rate = 0.0
+    assert (await client.trigger_event(trigger))["status_code"] == 201
+    assert breaker.circuit("POST trigger").state == "closed"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_bulk_results():
+    fake = FakeNovu(error_rate=1.0)
+    breaker = CircuitBreaker(window=2, min_calls=2, reset_timeout=30.0)
+    client = NovuClient("api_key", "https://novu.test/v1", transport=fake.transport(), circuit_breaker=breaker)
+    triggers = [Trigger(id="trigger_id", subscribers=[f"subscriber_{index}"]) for index in range(5)]
+
+    # Testing that chunks refused by the open circuit are reported per trigger instead of raising.
+    results = await client.bulk_trigger_many(triggers, chunk_size=1, concurrency=1)
+    assert [result["status_code"] for result in results] == [500, 500, None, None, None]
+    assert "is open" in results[-1]["detail"]
+    assert fake.calls["500"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedged_reads():
+    # Mocking a server whose first answer is stuck, while the hedge is answered right away.
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"data": {"subscriberId": "subscriber_id"}})
+
+    policy = HedgePolicy(quantile=0.9, min_delay=0.01, min_samples=5)
+    for _ in range(5):
+        policy.observe("GET subscribers", 0.001)
+    assert policy.delay("GET subscribers") == 0.01
+    assert policy.delay("GET trigger") is None
+
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), hedge_policy=policy
+    )
+
+    # Testing that the hedge answers well before the stuck attempt would.
+    response = await asyncio.wait_for(client.get_subscriber("subscriber_id"), timeout=1)
+    assert response == {"status_code": 200, "detail": {"subscriberId": "subscriber_id"}}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedged_reads_scheduling():
+    # Mocking a server whose first answer is slow, while the hedge is answered right away.
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"data": {"subscriberId": "subscriber_id"}})
+
+    policy = HedgePolicy(quantile=0.9, min_delay=0.01, min_samples=5)
+    for _ in range(5):
+        policy.observe("GET subscribers", 0.001)
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=httpx.MockTransport(handler),
+        hedge_policy=policy,
+        coalesce_reads=False,
+        priority_scheduler=FairScheduler(2, reserved=1),
+    )
+
+    # Testing that a high priority hedge takes the slot reserved for urgent requests.
+    with client.priority(Priority.HIGH):
+        assert (await asyncio.wait_for(client.get_subscriber("subscriber_id"), timeout=0.08))["status_code"] == 200
+    assert len(calls) == 2
+
+    # Testing that a low priority hedge waits for a slot instead of using the reserved one.
+    calls.clear()
+    with client.priority(Priority.LOW):
+        assert (await client.get_subscriber("subscriber_id"))["status_code"] == 200
+    assert len(calls) == 1
+    await client.aclose()
@@ -0,0 +1,62 @@
+import json
+
+import httpx
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.codec import StdlibCodec
+from asyncnovu.models import Trigger
+from asyncnovu.response import NovuResponse
+
+
+class CountingCodec(StdlibCodec):
+    # Standard library codec counting the decoded bodies.
+    decoded = 0
+
+    def decode(self, content):
+        CountingCodec.decoded += 1
+        return super().decode(content)
+
+
+def test_lazy_response():
+    CountingCodec.decoded = 0
+    content = json.dumps({"statusCode": 400, "message": "Bad request."}).encode()
+    response = NovuResponse(400, content, httpx.Headers({"X-Request-Id": "request_id"}), CountingCodec())
+
+    # Testing that the body is only decoded once, on first access.
+    assert response.status_code == 400 and not response.ok and CountingCodec.decoded == 0
+    assert response.detail == {"message": "Bad request."}
+    assert response["detail"] is response.detail and CountingCodec.decoded == 1
+
+    # Testing compatibility with the formatted response dictionaries.
+    assert response == {"status_code": 400, "detail": {"message": "Bad request."}}
+    assert response.to_dict() == dict(response) == {**response}
+    assert response.request_id == "request_id"
+    with pytest.raises(KeyError):
+        response["message"]
+
+    # Testing responses built from an already decoded detail.
+    response = NovuResponse.from_detail(200, {"skipped": True}, skipped=True)
+    assert response.ok and response.skipped and response == {"status_code": 200, "detail": {"skipped": True}}
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_trigger():
+    CountingCodec.decoded = 0
+    statuses = [201, 400]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, json={"data": {"acknowledged": status < 300}})
+
+    client = NovuClient(
+        "api_key", "https://novu.test/v1", transport=httpx.MockTransport(handler), codec=CountingCodec()
+    )
+    trigger = Trigger(id="trigger_id", subscribers=["subscriber_id"])
+
+    # Testing that the body of a successful fire-and-forget trigger is discarded, but error details are kept.
+    response = await client.trigger_event(trigger, read_body=False)
+    assert response.ok and response.content == b"" and response.detail == {}
+    response = await client.trigger_event(trigger, read_body=False)
+    assert response.to_dict() == {"status_code": 400, "detail": {"acknowledged": False}}
+    assert CountingCodec.decoded == 1
+    await client.aclose()
@@ -0,0 +1,73 @@
+import json
+
+import httpx
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.models import Trigger
+from asyncnovu.retry import RetryPolicy, parse_retry_after
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(max_attempts=3, backoff_base=1.0, backoff_cap=5.0)
+
+    # Testing full jitter backoff bounds.
+    assert 0 <= policy.delay(1) <= 1.0
+    assert 0 <= policy.delay(2, httpx.Response(503)) <= 2.0
+
+    # Testing Retry-After handling, including values above the backoff cap.
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "60"})) is None
+
+    # Testing statuses which should not be retried and the attempt limit.
+    assert policy.delay(1, httpx.Response(400)) is None
+    assert policy.delay(3, httpx.Response(503)) is None
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_trigger_retries():
+    # Mocking the Novu server to rate limit, fail, drop the connection, then succeed.
+    bodies = []
+    outcomes = [
+        httpx.Response(429, headers={"Retry-After": "0"}, json={"statusCode": 429, "message": "Too many requests."}),
+        httpx.Response(503, json={"statusCode": 503, "message": "Unavailable."}),
+        httpx.ConnectError("Connection refused."),
+        httpx.Response(201, json={"data": {"acknowledged": True}}),
+    ]
+
+    def handler(request):
+        if request.content:
+            bodies.append(json.loads(request.content))
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=4, backoff_base=0),
+    )
+
+    # Testing if the trigger eventually succeeds.
+    response = await client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+    assert response == {"status_code": 201, "detail": {"acknowledged": True}}
+
+    # Checking if every attempt reused the same generated transaction ID.
+    transaction_ids = {body["transactionId"] for body in bodies}
+    assert len(bodies) == 4
+    assert len(transaction_ids) == 1
+
+    # Testing if the last failed response is returned once attempts are exhausted.
+    outcomes.extend([httpx.Response(503, json={"statusCode": 503, "message": "Unavailable."})] * 4)
+    response = await client.get_subscriber("subscriber_id")
+    assert response == {"status_code": 503, "detail": {"message": "Unavailable."}}
+    assert not outcomes
+    await client.aclose()
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+from asyncnovu.models import Subscriber, Trigger
+from asyncnovu.outbox import SQLiteOutbox
+from asyncnovu.sync import SyncNovuClient
+from asyncnovu.testing import FakeNovu
+
+
+def test_sync_client():
+    fake = FakeNovu(latency=0.01)
+    with SyncNovuClient("api_key", transport=fake.transport()) as client:
+        # Testing blocking calls.
+        response = client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+        assert response["status_code"] == 201
+        client.upsert_subscriber(Subscriber(id="subscriber_id"))
+        assert client.get_subscriber("subscriber_id")["detail"]["subscriberId"] == "subscriber_id"
+
+        # Testing the blocking streaming iterator.
+        batches = list(client.stream_bulk_trigger((Trigger(id="trigger_id") for _ in range(5)), batch_size=2))
+        assert sorted(batch["offset"] for batch in batches) == [0, 2, 4]
+
+        # Testing calls submitted from several threads sharing the pooled client.
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.cancel_event("missing")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [result["detail"] for result in results] == [False] * 8
+        pooled = client.client.http
+
+    # Checking if closing the client released the pool and the loop.
+    assert pooled.is_closed
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client.get_subscriber("subscriber_id")
+
+
+def test_sync_client_outbox(tmp_path):
+    fake = FakeNovu()
+    outbox = SQLiteOutbox(str(tmp_path / "outbox.db"), batch_size=2, poll_interval=0.01)
+    with SyncNovuClient("api_key", transport=fake.transport(), outbox=outbox) as client:
+        # Testing if triggers enqueued from synchronous code are sent by the background worker.
+        transaction_ids = [
+            client.enqueue_trigger(Trigger(id="trigger_id", subscribers=[f"subscriber_{index}"])) for index in range(3)
+        ]
+        client.drain_outbox(timeout=5)
+
+    assert fake.transactions == set(transaction_ids)
+    outbox.close()
+
+
+def test_sync_client_docs():
+    # Checking if blocking methods keep the documentation of the async ones.
+    assert "Trigger a notification workflow." in SyncNovuClient.trigger_event.__doc__
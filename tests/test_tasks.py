@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.exceptions import PoolFullError, ResponseError
+from asyncnovu.models import Trigger
+from asyncnovu.tasks import TaskPool
+from asyncnovu.testing import FakeNovu
+
+
+@pytest.mark.asyncio
+async def test_task_pool_overflow():
+    release = asyncio.Event()
+    done = []
+
+    async def job(item):
+        await release.wait()
+        done.append(item)
+
+    # Testing the drop and raise policies of a full pool.
+    pool = TaskPool(size=2, overflow="drop")
+    assert await pool.submit(job, 1) and await pool.submit(job, 2)
+    assert not await pool.submit(job, 3)
+    pool.overflow = "raise"
+    with pytest.raises(PoolFullError):
+        await pool.submit(job, 4)
+    assert (len(pool), pool.submitted, pool.dropped) == (2, 2, 1)
+
+    # Testing that the block policy waits for a free slot.
+    pool.overflow = "block"
+    blocked = asyncio.ensure_future(pool.submit(job, 5))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    release.set()
+    assert await blocked
+    await pool.drain(timeout=1)
+    assert sorted(done) == [1, 2, 5] and len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_trigger_nowait():
+    fake = FakeNovu(latency=0.01)
+    errors = []
+    client = NovuClient(
+        "api_key",
+        "https://novu.test/v1",
+        transport=fake.transport(),
+        task_pool=TaskPool(size=5, on_error=lambda trigger, error: errors.append((trigger.id, error))),
+    )
+
+    # Testing that triggers are accepted without waiting for the server.
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for index in range(5):
+        assert await client.trigger_nowait(Trigger(id=f"trigger_{index}", subscribers=["subscriber_id"]))
+    assert loop.time() - start < 0.01 and fake.calls["POST /events/trigger"] == 0
+
+    # Testing that draining waits for the triggers, and error responses reach the callback.
+    await client.drain_triggers(timeout=1)
+    assert fake.calls["POST /events/trigger"] == 5 and not errors
+    fake.error_rate = 1.0
+    await client.trigger_nowait(Trigger(id="failing", subscribers=["subscriber_id"]))
+    await client.aclose()
+    assert errors[0][0] == "failing" and isinstance(errors[0][1], ResponseError)
+    assert errors[0][1].response["status_code"] == 500
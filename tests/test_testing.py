@@ -0,0 +1,68 @@
+import pytest
+from asyncnovu.client import NovuClient
+from asyncnovu.enums.provider import PushProviderIdEnum
+from asyncnovu.models import Subscriber, Trigger
+from asyncnovu.retry import RetryPolicy
+from asyncnovu.testing import FakeNovu
+
+
+@pytest.mark.asyncio
+async def test_fake_novu_endpoints():
+    fake = FakeNovu()
+    async with NovuClient("api_key", transport=fake.transport()) as client:
+        # Testing trigger endpoints.
+        response = await client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+        assert response["status_code"] == 201
+        transaction_id = response["detail"]["transactionId"]
+
+        response = await client.bulk_trigger([Trigger(id="trigger_id", subscribers=["subscriber_id"])] * 3)
+        assert response["status_code"] == 201
+        assert len(response["detail"]) == 3
+
+        response = await client.bulk_trigger([Trigger(id="trigger_id")] * 101)
+        assert response["status_code"] == 400
+
+        response = await client.broadcast_event(Trigger(id="trigger_id"))
+        assert response["status_code"] == 201
+
+        # Testing cancellation of known and unknown transactions.
+        assert (await client.cancel_event(transaction_id))["detail"] is True
+        assert (await client.cancel_event(transaction_id))["detail"] is False
+
+        # Testing subscriber endpoints.
+        assert (await client.get_subscriber("subscriber_id"))["status_code"] == 404
+        response = await client.upsert_subscriber(Subscriber(id="subscriber_id", email="subscriber@gmail.com"))
+        assert response["detail"]["email"] == "subscriber@gmail.com"
+        response = await client.update_subscriber_credentials(
+            "subscriber_id", PushProviderIdEnum.FCM, {"deviceTokens": ["token_1"]}
+        )
+        assert response["status_code"] == 200
+        assert fake.credentials[("subscriber_id", "fcm")] == {"deviceTokens": ["token_1"]}
+        assert (await client.get_subscriber("subscriber_id"))["detail"]["subscriberId"] == "subscriber_id"
+
+        report = await client.bulk_upsert_subscribers([Subscriber(id="subscriber_id"), Subscriber(id="other_id")])
+        assert sorted(report["succeeded"]) == ["other_id", "subscriber_id"]
+
+        await client.delete_subscriber("subscriber_id")
+        assert (await client.get_subscriber("subscriber_id"))["status_code"] == 404
+
+    # Checking the per-endpoint call counters.
+    assert fake.calls["POST /events/trigger/bulk"] == 2
+    assert fake.calls["DELETE /events/trigger"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fake_novu_failures():
+    # Testing injected rate limiting with a deterministic seed.
+    fake = FakeNovu(rate_limit_rate=0.5, retry_after=0, seed=1)
+    async with NovuClient("api_key", transport=fake.transport(), retry_policy=RetryPolicy(max_attempts=10)) as client:
+        for _ in range(10):
+            response = await client.trigger_event(Trigger(id="trigger_id", subscribers=["subscriber_id"]))
+            assert response["status_code"] == 201
+    assert fake.calls["429"] > 0
+
+    # Testing injected server errors.
+    fake = FakeNovu(error_rate=1.0)
+    async with NovuClient("api_key", transport=fake.transport()) as client:
+        response = await client.get_subscriber("subscriber_id")
+        assert response == {"status_code": 500, "detail": {"message": "Internal Server Error"}}